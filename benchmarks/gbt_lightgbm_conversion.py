@@ -0,0 +1,71 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+"""Benchmark LightGBM to daal4py model conversion."""
+
+import argparse
+import timeit
+import tracemalloc
+
+import numpy as np
+import lightgbm as lgb
+import daal4py as d4p
+
+
+def peak_memory_mb(func):
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n-samples', type=int, default=100000)
+    parser.add_argument('--n-features', type=int, default=50)
+    parser.add_argument('--n-classes', type=int, default=2)
+    parser.add_argument('--n-estimators', type=int, nargs='+',
+                        default=[100, 500, 1000])
+    parser.add_argument('--num-leaves', type=int, default=255)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    x = rng.rand(args.n_samples, args.n_features)
+    y = rng.randint(args.n_classes, size=args.n_samples)
+    params = {'num_leaves': args.num_leaves, 'verbose': -1}
+    if args.n_classes > 2:
+        params.update(objective='multiclass', num_class=args.n_classes)
+    else:
+        params.update(objective='binary')
+    dtrain = lgb.Dataset(x, label=y)
+
+    print('method,n_trees,time_s,peak_memory_mb')
+    for n_estimators in args.n_estimators:
+        booster = lgb.train(params, dtrain, num_boost_round=n_estimators)
+        n_trees = booster.num_trees()
+        for method, func in [
+            ('dump_model', booster.dump_model),
+            ('get_gbt_model_from_lightgbm',
+             lambda: d4p.get_gbt_model_from_lightgbm(booster)),
+        ]:
+            time = min(timeit.repeat(func, number=1, repeat=args.repeat))
+            print(f'{method},{n_trees},{time:.6f},{peak_memory_mb(func):.1f}')
+
+
+if __name__ == '__main__':
+    main()
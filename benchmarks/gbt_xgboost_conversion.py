@@ -0,0 +1,59 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+"""Benchmark XGBoost to daal4py model conversion."""
+
+import argparse
+import timeit
+
+import numpy as np
+import xgboost as xgb
+import daal4py as d4p
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n-samples', type=int, default=100000)
+    parser.add_argument('--n-features', type=int, default=50)
+    parser.add_argument('--n-classes', type=int, default=2)
+    parser.add_argument('--n-estimators', type=int, nargs='+',
+                        default=[100, 500, 1000])
+    parser.add_argument('--max-depth', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    x = rng.rand(args.n_samples, args.n_features)
+    y = rng.randint(args.n_classes, size=args.n_samples)
+    params = {'max_depth': args.max_depth, 'tree_method': 'hist'}
+    if args.n_classes > 2:
+        params.update(objective='multi:softprob', num_class=args.n_classes)
+    else:
+        params.update(objective='binary:logistic')
+    dtrain = xgb.DMatrix(x, label=y)
+
+    print('n_trees,n_nodes,time_s,nodes_per_s')
+    for n_estimators in args.n_estimators:
+        booster = xgb.train(params, dtrain, num_boost_round=n_estimators)
+        n_trees = len(booster.get_dump())
+        n_nodes = sum(tree.count('\n') for tree in booster.get_dump())
+        time = min(timeit.repeat(lambda: d4p.get_gbt_model_from_xgboost(booster),
+                                 number=1, repeat=args.repeat))
+        print(f'{n_trees},{n_nodes},{time:.6f},{n_nodes / time:.0f}')
+
+
+if __name__ == '__main__':
+    main()
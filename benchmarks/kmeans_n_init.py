@@ -0,0 +1,50 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+"""Benchmark sequential and threaded KMeans n_init restarts."""
+
+import argparse
+import timeit
+
+import numpy as np
+from daal4py.sklearn.cluster._k_means_0_23 import _daal4py_k_means_fit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n-samples', type=int, nargs='+',
+                        default=[10000, 100000, 1000000])
+    parser.add_argument('--n-features', type=int, default=20)
+    parser.add_argument('--n-clusters', type=int, default=10)
+    parser.add_argument('--n-init', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    print('n_samples,n_jobs,time_s,inertia')
+    for n_samples in args.n_samples:
+        x = rng.rand(n_samples, args.n_features)
+        for n_jobs in [1, -1]:
+            def fit():
+                return _daal4py_k_means_fit(
+                    x, args.n_clusters, 300, 1e-4, 'k-means++', args.n_init,
+                    False, np.random.RandomState(0), n_jobs=n_jobs)
+            time = min(timeit.repeat(fit, number=1, repeat=args.repeat))
+            print(f'{n_samples},{n_jobs},{time:.6f},{fit()[2]:.6f}')
+
+
+if __name__ == '__main__':
+    main()
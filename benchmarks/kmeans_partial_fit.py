@@ -0,0 +1,63 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+"""Benchmark MiniBatchKMeans.partial_fit of daal4py and scikit-learn."""
+
+import argparse
+import os
+import tempfile
+import timeit
+
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans as MiniBatchKMeans_original
+from daal4py.sklearn.cluster import MiniBatchKMeans
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n-samples', type=int, default=1000000)
+    parser.add_argument('--n-features', type=int, default=50)
+    parser.add_argument('--n-clusters', type=int, default=10)
+    parser.add_argument('--chunk-size', type=int, nargs='+',
+                        default=[1024, 16384, 131072])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'x.npy')
+        x = np.lib.format.open_memmap(
+            path, mode='w+', dtype=np.float64,
+            shape=(args.n_samples, args.n_features))
+        x[:] = np.random.RandomState(0).rand(args.n_samples, args.n_features)
+        x.flush()
+        del x
+        x = np.load(path, mmap_mode='r')
+
+        print('chunk_size,library,time_s')
+        for chunk_size in args.chunk_size:
+            for library, estimator in [('daal4py', MiniBatchKMeans),
+                                       ('sklearn', MiniBatchKMeans_original)]:
+                def fit():
+                    model = estimator(n_clusters=args.n_clusters, random_state=0,
+                                      compute_labels=False)
+                    for start in range(0, x.shape[0], chunk_size):
+                        model.partial_fit(x[start:start + chunk_size])
+                time = min(timeit.repeat(fit, number=1, repeat=args.repeat))
+                print(f'{chunk_size},{library},{time:.6f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+"""Benchmark the KMeans tolerance computed with np.var and with oneDAL."""
+
+import argparse
+import timeit
+import tracemalloc
+
+import numpy as np
+from daal4py.sklearn.cluster._k_means_0_23 import _tolerance
+
+
+def numpy_tolerance(x, rtol):
+    return np.var(x, axis=0).mean() * rtol
+
+
+def peak_memory(func, x):
+    tracemalloc.start()
+    func(x, 1e-4)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n-samples', type=int, nargs='+',
+                        default=[100000, 1000000])
+    parser.add_argument('--n-features', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    print('n_samples,method,time_s,peak_mib')
+    for n_samples in args.n_samples:
+        x = rng.rand(n_samples, args.n_features)
+        for method, func in [('numpy', numpy_tolerance), ('daal4py', _tolerance)]:
+            time = min(timeit.repeat(lambda: func(x, 1e-4), number=1,
+                                     repeat=args.repeat))
+            peak = peak_memory(func, x) / 2 ** 20
+            print(f'{n_samples},{method},{time:.6f},{peak:.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+"""Benchmark weighted KMeans fit of daal4py against scikit-learn."""
+
+import argparse
+import timeit
+
+import numpy as np
+from sklearn.cluster import KMeans as KMeans_sklearn
+from daal4py.sklearn.cluster import KMeans as KMeans_daal4py
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n-samples', type=int, default=1000000)
+    parser.add_argument('--n-features', type=int, default=20)
+    parser.add_argument('--n-clusters', type=int, nargs='+', default=[8, 64, 512])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    x = rng.rand(args.n_samples, args.n_features)
+    sample_weight = rng.randint(1, 10, args.n_samples).astype(np.float64)
+    print('n_clusters,estimator,time_s,inertia')
+    for n_clusters in args.n_clusters:
+        for name, estimator in [('sklearn', KMeans_sklearn),
+                                ('daal4py', KMeans_daal4py)]:
+            def fit():
+                return estimator(n_clusters=n_clusters, n_init=1, max_iter=20,
+                                 tol=0, random_state=0).fit(
+                    x, sample_weight=sample_weight)
+            time = min(timeit.repeat(fit, number=1, repeat=args.repeat))
+            print(f'{n_clusters},{name},{time:.6f},{fit().inertia_:.6f}')
+
+
+if __name__ == '__main__':
+    main()
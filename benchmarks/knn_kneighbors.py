@@ -0,0 +1,51 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+"""Benchmark kd_tree and brute kneighbors latency of daal4py NearestNeighbors."""
+
+import argparse
+import timeit
+
+import numpy as np
+from daal4py.sklearn.neighbors import NearestNeighbors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n-samples', type=int, default=100000)
+    parser.add_argument('--n-features', type=int, default=8)
+    parser.add_argument('--n-neighbors', type=int, default=10)
+    parser.add_argument('--n-queries', type=int, nargs='+',
+                        default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    x_train = rng.rand(args.n_samples, args.n_features)
+
+    print('algorithm,n_queries,time_s')
+    for algorithm in ['kd_tree', 'brute']:
+        model = NearestNeighbors(n_neighbors=args.n_neighbors,
+                                 algorithm=algorithm).fit(x_train)
+        for n_queries in args.n_queries:
+            x_test = rng.rand(n_queries, args.n_features)
+            time = min(timeit.repeat(lambda: model.kneighbors(x_test),
+                                     number=1, repeat=args.repeat))
+            print(f'{algorithm},{n_queries},{time:.6f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+"""Benchmark newton-cg LogisticRegression fit of daal4py against scikit-learn."""
+
+import argparse
+import timeit
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression as LogisticRegression_sklearn
+from daal4py.sklearn.linear_model import LogisticRegression as LogisticRegression_daal4py
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n-samples', type=int, default=100000)
+    parser.add_argument('--n-features', type=int, nargs='+',
+                        default=[8, 32, 128, 512])
+    parser.add_argument('--n-classes', type=int, nargs='+', default=[2, 3])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    print('n_classes,n_features,estimator,time_s,n_iter')
+    for n_classes in args.n_classes:
+        for n_features in args.n_features:
+            x = rng.randn(args.n_samples, n_features)
+            beta = rng.randn(n_features, n_classes) / np.sqrt(n_features)
+            y = np.argmax(x @ beta + rng.gumbel(size=(args.n_samples, n_classes)),
+                          axis=1)
+            for name, estimator in [('sklearn', LogisticRegression_sklearn),
+                                    ('daal4py', LogisticRegression_daal4py)]:
+                def fit():
+                    return estimator(solver='newton-cg', max_iter=100).fit(x, y)
+                time = min(timeit.repeat(fit, number=1, repeat=args.repeat))
+                print(f'{n_classes},{n_features},{name},{time:.6f},'
+                      f'{fit().n_iter_.max()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+"""Benchmark predict latency of daal4py LogisticRegression."""
+
+import argparse
+import timeit
+
+import numpy as np
+from sklearn.datasets import make_classification
+from daal4py.sklearn.linear_model import LogisticRegression
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n-features', type=int, default=100)
+    parser.add_argument('--n-classes', type=int, default=3)
+    parser.add_argument('--batch-sizes', type=int, nargs='+',
+                        default=[1, 10, 100])
+    parser.add_argument('--number', type=int, default=1000)
+    args = parser.parse_args()
+
+    X, y = make_classification(n_samples=10000, n_features=args.n_features,
+                               n_informative=args.n_features // 2,
+                               n_classes=args.n_classes, random_state=0)
+    clf = LogisticRegression(max_iter=1000).fit(X, y)
+
+    print('method,batch_size,latency_us')
+    for method in [clf.predict, clf.predict_proba]:
+        for batch_size in args.batch_sizes:
+            x_batch = np.ascontiguousarray(X[:batch_size])
+            time = timeit.timeit(lambda: method(x_batch), number=args.number)
+            print(f'{method.__name__},{batch_size},'
+                  f'{time / args.number * 1e6:.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+"""Benchmark PCA.fit_transform against fit followed by transform."""
+
+import argparse
+import timeit
+import tracemalloc
+
+import numpy as np
+from daal4py.sklearn.decomposition import PCA
+
+
+def fused(X, n_components):
+    return PCA(n_components=n_components).fit_transform(X)
+
+
+def separate(X, n_components):
+    return PCA(n_components=n_components).fit(X).transform(X)
+
+
+def peak_memory(func, X, n_components):
+    tracemalloc.start()
+    func(X, n_components)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n-samples', type=int, nargs='+',
+                        default=[100000, 1000000])
+    parser.add_argument('--n-features', type=int, default=100)
+    parser.add_argument('--n-components', type=int, default=10)
+    parser.add_argument('--dtype', type=str, nargs='+',
+                        default=['float64', 'int64'],
+                        help='input dtypes, non-float inputs are converted '
+                             'during validation')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    print('n_samples,dtype,method,time_s,peak_mib')
+    for n_samples in args.n_samples:
+        X = rng.rand(n_samples, args.n_features) * 100
+        for dtype in args.dtype:
+            X_typed = X.astype(dtype)
+            for method, func in [('separate', separate), ('fused', fused)]:
+                time = min(timeit.repeat(
+                    lambda: func(X_typed, args.n_components), number=1,
+                    repeat=args.repeat))
+                peak = peak_memory(func, X_typed, args.n_components) / 2 ** 20
+                print(f'{n_samples},{dtype},{method},{time:.6f},{peak:.1f}')
+
+
+if __name__ == '__main__':
+    main()
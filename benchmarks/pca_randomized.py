@@ -0,0 +1,65 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+"""Benchmark daal4py full and randomized PCA against stock randomized PCA."""
+
+import argparse
+import timeit
+
+import numpy as np
+from sklearn.decomposition import PCA as PCA_original
+from daal4py.sklearn.decomposition import PCA
+
+SOLVERS = [
+    ('daal4py_full', PCA, 'full'),
+    ('daal4py_randomized', PCA, 'randomized'),
+    ('sklearn_randomized', PCA_original, 'randomized'),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--shapes', type=str, nargs='+',
+                        default=['10000x100', '10000x1000', '100000x500',
+                                 '2000x20000'],
+                        help='n_samples x n_features of the data sets')
+    parser.add_argument('--n-components', type=int, nargs='+',
+                        default=[5, 20, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    print('n_samples,n_features,n_components,solver,time_s,'
+          'explained_variance_ratio')
+    for shape in args.shapes:
+        n_samples, n_features = map(int, shape.split('x'))
+        X = rng.rand(n_samples, n_features)
+        for n_components in args.n_components:
+            if n_components > min(X.shape):
+                continue
+            for name, estimator, svd_solver in SOLVERS:
+                def fit():
+                    return estimator(n_components=n_components,
+                                     svd_solver=svd_solver,
+                                     random_state=0).fit(X)
+                time = min(timeit.repeat(fit, number=1, repeat=args.repeat))
+                ratio = fit().explained_variance_ratio_.sum()
+                print(f'{n_samples},{n_features},{n_components},{name},'
+                      f'{time:.6f},{ratio:.6f}')
+
+
+if __name__ == '__main__':
+    main()
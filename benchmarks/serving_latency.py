@@ -0,0 +1,62 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+"""Benchmark estimator predict against ServingPredictor.predict_one."""
+
+import argparse
+import timeit
+
+from sklearn.datasets import make_classification
+from daal4py.sklearn import ServingPredictor
+from daal4py.sklearn.ensemble import (RandomForestClassifier, GBTDAALClassifier)
+from daal4py.sklearn.linear_model import LogisticRegression, Ridge
+from daal4py.sklearn.neighbors import KNeighborsClassifier
+from daal4py.sklearn.svm import SVC
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--n-features', type=int, default=20)
+    parser.add_argument('--number', type=int, default=1000)
+    args = parser.parse_args()
+
+    X, y = make_classification(n_samples=5000, n_features=args.n_features,
+                               random_state=0)
+    row = X[0]
+    estimators = [
+        RandomForestClassifier(n_estimators=100, random_state=0),
+        GBTDAALClassifier(max_iterations=100),
+        SVC(),
+        KNeighborsClassifier(),
+        Ridge(),
+        LogisticRegression(max_iter=1000),
+    ]
+
+    print('estimator,predict_us,predict_one_us')
+    for estimator in estimators:
+        estimator.fit(X, y)
+        predictor = ServingPredictor(estimator)
+        predict = timeit.timeit(lambda: estimator.predict(row.reshape(1, -1)),
+                                number=args.number)
+        predict_one = timeit.timeit(lambda: predictor.predict_one(row),
+                                    number=args.number)
+        print(f'{type(estimator).__name__},'
+              f'{predict / args.number * 1e6:.2f},'
+              f'{predict_one / args.number * 1e6:.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -32,6 +32,8 @@ try:
         _get__version__,
         _get__daal_link_version__,
         _get__daal_run_version__,
+        _kmeans_weighted_cluster_sums,
+        _kmeans_weighted_inertia,
         __has_dist__)
 except ImportError as e:
     s = str(e)
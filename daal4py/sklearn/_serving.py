@@ -0,0 +1,318 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+# Low-latency prediction pipelines for fitted daal4py estimators
+
+import threading
+
+import numpy as np
+import daal4py
+from scipy import sparse as sp
+from sklearn.utils.validation import check_is_fitted
+
+from ._utils import parse_dtype, sklearn_check_version
+from .ensemble import (RandomForestClassifier, RandomForestRegressor,
+                       GBTDAALClassifier, GBTDAALRegressor)
+from .linear_model import LinearRegression, LogisticRegression, Ridge
+from .linear_model.logistic_path import _get_daal4py_predict_cache
+from .neighbors import KNeighborsClassifier
+from .neighbors._base import parse_auto_method, prediction_algorithm
+from .svm import SVC
+
+if sklearn_check_version('0.23'):
+    from .svm._svm_0_23 import _daal4py_kf
+else:
+    from .svm._svm_0_22 import _daal4py_kf
+
+
+def _take_labels(classes):
+    def postprocess(labels):
+        return np.take(classes, labels.ravel().astype(np.intp, casting='unsafe'))
+    return postprocess
+
+
+def _require_daal_model(estimator, attr='daal_model_'):
+    model = getattr(estimator, attr, None)
+    if model is None:
+        raise ValueError(
+            f'{type(estimator).__name__} was not fitted with '
+            f'Intel(R) oneAPI Data Analytics Library, serving mode is unavailable')
+    return model
+
+
+def _forest_classifier(estimator, fptype, method):
+    if estimator.n_outputs_ != 1:
+        raise ValueError('Serving mode supports single output forests only')
+    results = {'predict': 'computeClassLabels',
+               'predict_proba': 'computeClassProbabilities'}[method]
+    n_classes = int(estimator.n_classes_)
+
+    def algorithm():
+        return daal4py.decision_forest_classification_prediction(
+            nClasses=n_classes,
+            fptype=fptype,
+            resultsToEvaluate=results
+        )
+    if method == 'predict':
+        labels = _take_labels(estimator.classes_)
+
+        def postprocess(res):
+            return labels(res.prediction)
+    else:
+        def postprocess(res):
+            return res.probabilities
+    return algorithm, _require_daal_model(estimator), postprocess
+
+
+def _forest_regressor(estimator, fptype, method):
+    def algorithm():
+        return daal4py.decision_forest_regression_prediction(fptype=fptype)
+
+    def postprocess(res):
+        return res.prediction.ravel()
+    return algorithm, _require_daal_model(estimator), postprocess
+
+
+def _gbt_classifier(estimator, fptype, method):
+    results = {'predict': 'computeClassLabels',
+               'predict_proba': 'computeClassProbabilities'}[method]
+    n_classes = estimator.n_classes_
+
+    def algorithm():
+        return daal4py.gbt_classification_prediction(
+            fptype=fptype,
+            nClasses=n_classes,
+            resultsToEvaluate=results
+        )
+    if method == 'predict':
+        labels = _take_labels(estimator.classes_)
+
+        def postprocess(res):
+            return labels(res.prediction)
+    else:
+        def postprocess(res):
+            return res.probabilities
+    return algorithm, _require_daal_model(estimator), postprocess
+
+
+def _gbt_regressor(estimator, fptype, method):
+    def algorithm():
+        return daal4py.gbt_regression_prediction(fptype=fptype)
+
+    def postprocess(res):
+        return res.prediction.ravel()
+    return algorithm, _require_daal_model(estimator), postprocess
+
+
+def _svc(estimator, fptype, method):
+    if not getattr(estimator, '_daal_fit', False) or estimator.probability:
+        raise ValueError('Serving mode requires SVC fitted with '
+                         'Intel(R) oneAPI Data Analytics Library '
+                         'and probability=False')
+    num_classes = len(estimator.classes_)
+    kernel, gamma = estimator.kernel, estimator._gamma
+
+    def algorithm():
+        kf = _daal4py_kf(kernel, fptype, gamma=gamma)
+        svm_predict = daal4py.svm_prediction(
+            fptype=fptype,
+            method='defaultDense',
+            kernel=kf
+        )
+        if num_classes == 2:
+            return svm_predict
+        return daal4py.multi_class_classifier_prediction(
+            nClasses=num_classes,
+            fptype=fptype,
+            pmethod="voteBased",
+            tmethod='oneAgainstOne',
+            resultsToEvaluate='computeClassLabels',
+            prediction=svm_predict
+        )
+    classes = estimator.classes_
+
+    def postprocess(res):
+        res = res.prediction.ravel()
+        if num_classes == 2:
+            res = np.greater(res, 0)
+        return classes.take(np.asarray(res, dtype=np.intp))
+    return algorithm, _require_daal_model(estimator), postprocess
+
+
+def _knn_classifier(estimator, fptype, method):
+    model = _require_daal_model(estimator, '_daal_model')
+    params = {
+        'method': 'defaultDense',
+        'k': estimator.n_neighbors,
+        'nClasses': len(estimator.classes_),
+        'voteWeights': 'voteUniform'
+        if estimator.weights == 'uniform' else 'voteDistance',
+        'resultsToEvaluate': 'computeClassLabels',
+        'resultsToCompute': ''
+    }
+    method = parse_auto_method(
+        estimator, estimator.algorithm, estimator.n_samples_fit_,
+        estimator.n_features_in_)
+
+    def algorithm():
+        return prediction_algorithm(method, fptype, dict(params))
+
+    labels = _take_labels(estimator.classes_)
+
+    def postprocess(res):
+        return labels(res.prediction)
+    return algorithm, model, postprocess
+
+
+def _linear(prediction):
+    def pipeline(estimator, fptype, method):
+        def algorithm():
+            return prediction(fptype=fptype, method='defaultDense')
+
+        ravel = estimator.coef_.ndim == 1
+
+        def postprocess(res):
+            res = res.prediction
+            if res.shape[1] == 1 and ravel:
+                res = np.ravel(res)
+            return res
+        return algorithm, _require_daal_model(estimator), postprocess
+    return pipeline
+
+
+def _logistic(estimator, fptype, method):
+    results = {'predict': 'computeClassLabels',
+               'predict_proba': 'computeClassProbabilities',
+               'predict_log_proba': 'computeClassLogProbabilities'}[method]
+    if sp.issparse(estimator.coef_):
+        raise ValueError('Serving mode does not support sparse coef_')
+    if method != 'predict' and estimator.classes_.size != 2 and \
+            estimator.multi_class not in ["multinomial", "warn"]:
+        raise ValueError('Serving mode supports probabilities only for '
+                         'binary or multinomial LogisticRegression')
+    n_classes = len(estimator.classes_)
+
+    def algorithm():
+        return daal4py.logistic_regression_prediction(
+            nClasses=n_classes,
+            fptype=fptype,
+            method='defaultDense',
+            resultsToEvaluate=results
+        )
+    classes = estimator.classes_
+    relabel = not np.array_equal(classes, np.arange(0, len(classes)))
+
+    def postprocess(res):
+        if method == 'predict':
+            res = res.prediction
+            if relabel or classes.dtype != res.dtype:
+                res = classes.take(np.asarray(res, dtype=np.intp))
+        elif method == 'predict_proba':
+            res = res.probabilities
+        else:
+            res = res.logProbabilities
+        if res.shape[1] == 1:
+            res = np.ravel(res)
+        return res
+    return algorithm, _get_daal4py_predict_cache(estimator)['model'], postprocess
+
+
+_PIPELINES = [
+    (RandomForestClassifier, _forest_classifier, ['predict', 'predict_proba']),
+    (RandomForestRegressor, _forest_regressor, ['predict']),
+    (GBTDAALClassifier, _gbt_classifier, ['predict', 'predict_proba']),
+    (GBTDAALRegressor, _gbt_regressor, ['predict']),
+    (SVC, _svc, ['predict']),
+    (KNeighborsClassifier, _knn_classifier, ['predict']),
+    (Ridge, _linear(daal4py.ridge_regression_prediction), ['predict']),
+    (LinearRegression, _linear(daal4py.linear_regression_prediction), ['predict']),
+    (LogisticRegression, _logistic,
+     ['predict', 'predict_proba', 'predict_log_proba']),
+]
+
+
+class ServingPredictor:
+    """Precompiled prediction pipeline of a fitted daal4py estimator.
+
+    The oneDAL model, the prediction algorithm object and the output
+    conversion are set up once, so that each call only converts the input
+    and runs the native prediction. Inputs are not validated beyond
+    their shape: they must be finite and numeric.
+
+    The predictor is a snapshot of the estimator; build a new one after
+    refitting or modifying the estimator. It can be shared between
+    threads: the oneDAL model is shared and each thread gets its own
+    prediction algorithm object.
+
+    Parameters
+    ----------
+    estimator : estimator instance
+        A fitted daal4py estimator: RandomForestClassifier,
+        RandomForestRegressor, GBTDAALClassifier, GBTDAALRegressor, SVC,
+        KNeighborsClassifier, LinearRegression, Ridge or LogisticRegression.
+    method : str, default='predict'
+        The estimator method to precompile, e.g. 'predict' or 'predict_proba'.
+    dtype : {np.float64, np.float32}, default=np.float64
+        The floating point type the inputs are converted to.
+    """
+
+    def __init__(self, estimator, method='predict', dtype=np.float64):
+        check_is_fitted(estimator)
+        for estimator_type, pipeline, methods in _PIPELINES:
+            if isinstance(estimator, estimator_type):
+                break
+        else:
+            raise TypeError(
+                f'Serving mode is not supported for {type(estimator).__name__}')
+        if method not in methods:
+            raise ValueError(
+                f'Serving mode for {type(estimator).__name__} supports '
+                f'methods {methods}, got {method}')
+
+        self.estimator = estimator
+        self.method = method
+        self.dtype = np.dtype(dtype)
+        self.n_features_in_ = getattr(estimator, 'n_features_in_', None)
+        if self.n_features_in_ is None:
+            self.n_features_in_ = estimator.coef_.shape[-1]
+        self._make_algorithm, self._model, self._postprocess = \
+            pipeline(estimator, parse_dtype(self.dtype), method)
+        # oneDAL algorithm objects keep their inputs between calls, so
+        # every thread gets its own algorithm, the model is shared
+        self._local = threading.local()
+        self._get_algorithm()
+
+    def _get_algorithm(self):
+        algorithm = getattr(self._local, 'algorithm', None)
+        if algorithm is None:
+            algorithm = self._local.algorithm = self._make_algorithm()
+        return algorithm
+
+    def predict_batch(self, X):
+        """Run the precompiled method on a 2d array of shape
+        (n_samples, n_features_in_)."""
+        X = np.ascontiguousarray(X, dtype=self.dtype)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f'Expected an array of shape (n_samples, {self.n_features_in_}), '
+                f'got {X.shape}')
+        res = self._get_algorithm().compute(X, self._model)
+        return self._postprocess(res)
+
+    def predict_one(self, x):
+        """Run the precompiled method on a single sample of n_features_in_
+        values."""
+        return self.predict_batch(np.reshape(x, (1, -1)))[0]
@@ -16,18 +16,125 @@
 
 import numpy as np
 from scipy import sparse as sp
+from scipy.sparse.csgraph import connected_components
+import warnings
 
-from sklearn.utils import check_array
+from sklearn import get_config
+from sklearn.utils import check_array, gen_batches
 from sklearn.utils.validation import _check_sample_weight
+from sklearn.metrics.pairwise import euclidean_distances
+from sklearn.neighbors import KDTree
 
 from sklearn.cluster import DBSCAN as DBSCAN_original
+from sklearn.cluster._dbscan_inner import dbscan_inner
+
+try:
+    from sklearn.utils._joblib import Parallel, delayed
+except ImportError:
+    from sklearn.externals.joblib import Parallel, delayed
 
 import daal4py
 from daal4py.sklearn._utils import (make2d, getFPType, get_patch_message)
 import logging
 
 
-def _daal_dbscan(X, eps=0.5, min_samples=5, sample_weight=None):
+def _neighborhoods_size(X, eps):
+    """Estimate the memory in bytes taken by the neighborhoods of all
+    samples from the distances between two evenly spaced subsets of them"""
+    n_samples = X.shape[0]
+    rows = X[np.linspace(0, n_samples - 1, min(n_samples, 256)).astype(np.intp)]
+    columns = X[np.linspace(0, n_samples - 1, min(n_samples, 4096)).astype(np.intp)]
+    distances = euclidean_distances(rows, columns, squared=True)
+    density = np.count_nonzero(distances <= eps * eps) / distances.size
+    return density * n_samples * n_samples * np.dtype(np.intc).itemsize
+
+
+def _use_memory_saving(X, eps):
+    working_memory = get_config()['working_memory'] * 2 ** 20
+    # the neighborhoods never take more than n_samples ** 2 indices, the
+    # estimate is only needed when that bound does not fit
+    if X.shape[0] ** 2 * np.dtype(np.intc).itemsize <= working_memory:
+        return False
+    return bool(_neighborhoods_size(X, eps) > working_memory)
+
+
+def _kd_tree_dbscan(X, eps, min_samples, sample_weight=None, leaf_size=30,
+                    n_jobs=None):
+    """DBSCAN with KD-tree radius queries. The neighborhoods are queried
+    in chunks and only the neighborhoods of core samples are kept."""
+    tree = KDTree(X, leaf_size=leaf_size)
+    no_neighbors = np.empty(0, dtype=np.intp)
+
+    def query(batch):
+        neighborhoods = tree.query_radius(X[batch], eps)
+        if sample_weight is None:
+            n_neighbors = np.array([len(neighbors) for neighbors in neighborhoods])
+        else:
+            n_neighbors = np.array(
+                [np.sum(sample_weight[neighbors]) for neighbors in neighborhoods])
+        is_core = n_neighbors >= min_samples
+        for i in np.flatnonzero(~is_core):
+            neighborhoods[i] = no_neighbors
+        return is_core, neighborhoods
+
+    results = Parallel(n_jobs=n_jobs, backend='threading')(
+        delayed(query)(batch) for batch in gen_batches(X.shape[0], 4096))
+    is_core = np.concatenate([res[0] for res in results]).astype(np.uint8)
+    neighborhoods = np.concatenate([res[1] for res in results])
+
+    labels = np.full(X.shape[0], -1, dtype=np.intp)
+    dbscan_inner(is_core, neighborhoods, labels)
+    return np.flatnonzero(is_core), labels
+
+
+def _precomputed_graph_dbscan(X, eps, min_samples, sample_weight=None):
+    """DBSCAN on a sparse graph of precomputed distances. The clusters are
+    the connected components of the core samples. Returns None when the
+    neighborhoods are not symmetric, then the clusters depend on the order
+    of the expansion."""
+    n_samples = X.shape[0]
+    # a sample is its own neighbor
+    X = X.copy()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', sp.SparseEfficiencyWarning)
+        X.setdiag(X.diagonal())
+    neighbors = sp.csr_matrix(
+        (X.data <= eps, X.indices, X.indptr), shape=X.shape)
+    neighbors.eliminate_zeros()
+    if (neighbors != neighbors.T).nnz:
+        return None
+
+    if sample_weight is None:
+        n_neighbors = np.diff(neighbors.indptr)
+    else:
+        n_neighbors = neighbors.astype(sample_weight.dtype) @ sample_weight
+    is_core = n_neighbors >= min_samples
+    core_ind = np.flatnonzero(is_core)
+    labels = np.full(n_samples, -1, dtype=np.intp)
+    if core_ind.size == 0:
+        return core_ind, labels
+
+    n_clusters, components = connected_components(
+        neighbors[core_ind][:, core_ind], directed=False)
+    # clusters are numbered in the order of their first core sample
+    _, first_samples = np.unique(components, return_index=True)
+    cluster_ids = np.empty(n_clusters, dtype=np.intp)
+    cluster_ids[np.argsort(first_samples)] = np.arange(n_clusters)
+    labels[core_ind] = cluster_ids[components]
+
+    # a border sample joins the first expanded cluster that reaches it,
+    # which is the lowest label among its core neighbors
+    border_ind = np.flatnonzero(~is_core)
+    border = neighbors[border_ind][:, core_ind].astype(np.intp)
+    border.data = n_clusters - labels[core_ind][border.indices]
+    lowest = np.asarray(border.max(axis=1).todense()).ravel()
+    reached = lowest > 0
+    labels[border_ind[reached]] = n_clusters - lowest[reached]
+    return core_ind, labels
+
+
+def _daal_dbscan(X, eps=0.5, min_samples=5, sample_weight=None,
+                 memory_saving=False):
     ww = make2d(sample_weight) if sample_weight is not None else None
     XX = make2d(X)
 
@@ -37,7 +144,7 @@ def _daal_dbscan(X, eps=0.5, min_samples=5, sample_weight=None):
         fptype=fpt,
         epsilon=float(eps),
         minObservations=int(min_samples),
-        memorySavingMode=False,
+        memorySavingMode=memory_saving,
         resultsToCompute="computeCoreIndices"
     )
 
@@ -98,6 +205,10 @@ class DBSCAN(DBSCAN_original):
         If algorithm is set to 'daal', Intel(R) oneAPI Data Analytics Library
         will be used.
 
+        If algorithm is set to 'kd_tree' and the metric is euclidean, the
+        neighborhoods of dense data are queried from a KD-tree in chunks and
+        only the neighborhoods of core samples are kept.
+
     leaf_size : int, optional (default = 30)
         Leaf size passed to BallTree or cKDTree. This can affect the speed
         of the construction and query, as well as the memory required
@@ -114,6 +225,14 @@ class DBSCAN(DBSCAN_original):
         ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
         for more details.
 
+    memory_saving : {'auto', True, False}, optional (default='auto')
+        Whether Intel(R) oneAPI Data Analytics Library computes the
+        neighborhoods on the fly instead of storing them, which bounds the
+        memory to O(n_samples) at the cost of computing the distances
+        again. 'auto' switches it on when the neighborhoods, estimated from
+        the distances between subsets of samples, may take more than the
+        ``working_memory`` of :func:`sklearn.set_config`.
+
     Attributes
     ----------
     core_sample_indices_ : array, shape = [n_core_samples]
@@ -151,11 +270,17 @@ class DBSCAN(DBSCAN_original):
     neighborhoods in chunks using
     :func:`NearestNeighbors.radius_neighbors_graph
     <sklearn.neighbors.NearestNeighbors.radius_neighbors_graph>` with
-    ``mode='distance'``, then using ``metric='precomputed'`` here.
+    ``mode='distance'``, then using ``metric='precomputed'`` here. Graphs
+    with symmetric neighborhoods are clustered from the connected components
+    of their core samples with scipy, not with Intel(R) oneAPI Data
+    Analytics Library.
 
     Another way to reduce memory and computation time is to remove
     (near-)duplicate points and use ``sample_weight`` instead.
 
+    With ``algorithm='kd_tree'``, the KD-tree radius queries are done in
+    chunks, keeping the neighborhoods of core samples only.
+
     :class:`cluster.OPTICS` provides a similar clustering with lower memory
     usage.
 
@@ -193,6 +318,7 @@ class DBSCAN(DBSCAN_original):
         leaf_size=30,
         p=None,
         n_jobs=None,
+        memory_saving='auto',
     ):
         self.eps = eps
         self.min_samples = min_samples
@@ -202,6 +328,7 @@ class DBSCAN(DBSCAN_original):
         self.leaf_size = leaf_size
         self.p = p
         self.n_jobs = n_jobs
+        self.memory_saving = memory_saving
 
     def fit(self, X, y=None, sample_weight=None):
         """Perform DBSCAN clustering from features, or distance matrix.
@@ -234,20 +361,61 @@ class DBSCAN(DBSCAN_original):
         if sample_weight is not None:
             sample_weight = _check_sample_weight(sample_weight, X)
 
-        _daal_ready = self.algorithm in ['auto', 'brute'] and \
-            (self.metric == 'euclidean' or (
-             self.metric == 'minkowski' and self.p == 2)) and \
+        if self.memory_saving not in ['auto', True, False]:
+            raise ValueError("memory_saving must be 'auto', True or False, got"
+                             " {}".format(str(self.memory_saving)))
+
+        if self.metric == 'precomputed' and sp.issparse(X) and \
+                X.shape[0] == X.shape[1]:
+            X = check_array(X, accept_sparse='csr')
+            result = _precomputed_graph_dbscan(
+                X, self.eps, self.min_samples, sample_weight=sample_weight)
+            if result is not None:
+                logging.info(
+                    "sklearn.cluster.DBSCAN."
+                    "fit: " + get_patch_message("sklearn"))
+                self.core_sample_indices_, self.labels_ = result
+                self.components_ = X[self.core_sample_indices_].copy()
+                self.n_features_in_ = X.shape[1]
+                return self
+
+        _is_euclidean = self.metric == 'euclidean' or (
+            self.metric == 'minkowski' and self.p == 2)
+        if self.algorithm == 'kd_tree' and _is_euclidean and not sp.issparse(X):
+            X = check_array(X, dtype=[np.float64, np.float32])
+            logging.info(
+                "sklearn.cluster.DBSCAN."
+                "fit: " + get_patch_message("sklearn"))
+            core_ind, assignments = _kd_tree_dbscan(
+                X,
+                self.eps,
+                self.min_samples,
+                sample_weight=sample_weight,
+                leaf_size=self.leaf_size,
+                n_jobs=self.n_jobs
+            )
+            self.core_sample_indices_ = core_ind
+            self.labels_ = assignments
+            self.components_ = np.take(X, core_ind, axis=0)
+            self.n_features_in_ = X.shape[1]
+            return self
+
+        _daal_ready = self.algorithm in ['auto', 'brute'] and _is_euclidean and \
             not sp.issparse(X)
         if _daal_ready:
             logging.info(
                 "sklearn.cluster.DBSCAN."
                 "fit: " + get_patch_message("daal"))
             X = check_array(X, accept_sparse='csr', dtype=[np.float64, np.float32])
+            memory_saving = self.memory_saving
+            if memory_saving == 'auto':
+                memory_saving = _use_memory_saving(X, self.eps)
             core_ind, assignments = _daal_dbscan(
                 X,
                 self.eps,
                 self.min_samples,
-                sample_weight=sample_weight
+                sample_weight=sample_weight,
+                memory_saving=memory_saving
             )
             self.core_sample_indices_ = core_ind
             self.labels_ = assignments
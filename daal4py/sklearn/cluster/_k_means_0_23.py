@@ -18,21 +18,30 @@ import numpy as np
 import numbers
 from scipy import sparse as sp
 
+from sklearn import get_config
 from sklearn.utils import check_random_state, check_array
-from sklearn.utils.sparsefuncs import mean_variance_axis
 from sklearn.utils.validation import (
     check_is_fitted,
     _num_samples,
+    _check_sample_weight,
     _deprecate_positional_args)
 
 from sklearn.cluster._kmeans import _labels_inertia
 from sklearn.utils._openmp_helpers import _openmp_effective_n_threads
 
 from sklearn.exceptions import ConvergenceWarning
-from sklearn.utils.extmath import row_norms
+from sklearn.utils.extmath import row_norms, stable_cumsum
+from sklearn.utils import gen_batches
+from sklearn.metrics.pairwise import euclidean_distances
 import warnings
 
 from sklearn.cluster import KMeans as KMeans_original
+from sklearn.cluster import MiniBatchKMeans as MiniBatchKMeans_original
+
+try:
+    from sklearn.utils._joblib import Parallel, delayed, effective_n_jobs
+except ImportError:
+    from sklearn.externals.joblib import Parallel, delayed, effective_n_jobs
 
 import daal4py
 from .._utils import (
@@ -54,36 +63,41 @@ def _validate_center_shape(X, n_centers, centers):
             f"match the number of features of the data {X.shape[1]}.")
 
 
+def _max_concurrent_restarts(X, nClusters):
+    """Number of restarts whose buffers fit into sklearn's working_memory"""
+    # each concurrent run holds its own assignments, closest distances
+    # and centroids
+    itemsize = X.dtype.itemsize
+    restart_bytes = X.shape[0] * (np.dtype(np.int32).itemsize + itemsize) + \
+        2 * nClusters * X.shape[1] * itemsize
+    return max(1, int(get_config()['working_memory'] * 2 ** 20 // restart_bytes))
+
+
 def _tolerance(X, rtol):
     """Compute absolute tolerance from the relative tolerance"""
-    if rtol == 0.0:
-        return rtol
-    if sp.issparse(X):
-        variances = mean_variance_axis(X, axis=0)[1]
-        mean_var = np.mean(variances)
-    else:
-        mean_var = np.var(X, axis=0).mean()
+    if rtol == 0.0 or X.shape[0] == 1:
+        return 0.0
+    # oneDAL computes the column variances in a single pass over X,
+    # without the centered copy of X that np.var makes
+    moments_algo = daal4py.low_order_moments(
+        fptype=getFPType(X),
+        method="fastCSR" if sp.issparse(X) else "defaultDense",
+        estimatesToCompute="estimatesMeanVariance",
+    )
+    variances = moments_algo.compute(X).variance
+    # oneDAL variances are unbiased, np.var divides by n_samples
+    n_samples = X.shape[0]
+    mean_var = variances.mean() * (n_samples - 1) / n_samples
     return mean_var * rtol
 
 
-def _daal4py_compute_starting_centroids(
-    X,
-    X_fptype,
-    nClusters,
-    cluster_centers_0,
-    verbose,
-    random_state
-):
-    def is_string(s, target_str):
-        return isinstance(s, str) and s == target_str
+def _daal4py_init_centroids(X, X_fptype, nClusters, init, seed):
+    """Compute 'k-means++' or 'random' starting centroids with the given seed"""
     is_sparse = sp.isspmatrix(X)
-
-    deterministic = False
-    if is_string(cluster_centers_0, 'k-means++'):
-        _seed = random_state.randint(np.iinfo('i').max)
+    daal_engine = daal4py.engines_mt19937(
+        fptype=X_fptype, method="defaultDense", seed=seed)
+    if init == 'k-means++':
         plus_plus_method = "plusPlusCSR" if is_sparse else "plusPlusDense"
-        daal_engine = daal4py.engines_mt19937(
-            fptype=X_fptype, method="defaultDense", seed=_seed)
         _n_local_trials = 2 + int(np.log(nClusters))
         kmeans_init = daal4py.kmeans_init(
             nClusters,
@@ -92,21 +106,35 @@ def _daal4py_compute_starting_centroids(
             method=plus_plus_method,
             engine=daal_engine,
         )
-        kmeans_init_res = kmeans_init.compute(X)
-        centroids_ = kmeans_init_res.centroids
-    elif is_string(cluster_centers_0, 'random'):
-        _seed = random_state.randint(np.iinfo('i').max)
+    else:
         random_method = "randomCSR" if is_sparse else "randomDense"
-        daal_engine = daal4py.engines_mt19937(
-            seed=_seed, fptype=X_fptype, method="defaultDense")
         kmeans_init = daal4py.kmeans_init(
             nClusters,
             fptype=X_fptype,
             method=random_method,
             engine=daal_engine,
         )
-        kmeans_init_res = kmeans_init.compute(X)
-        centroids_ = kmeans_init_res.centroids
+    return kmeans_init.compute(X).centroids
+
+
+def _daal4py_compute_starting_centroids(
+    X,
+    X_fptype,
+    nClusters,
+    cluster_centers_0,
+    verbose,
+    random_state
+):
+    def is_string(s, target_str):
+        return isinstance(s, str) and s == target_str
+    is_sparse = sp.isspmatrix(X)
+
+    deterministic = False
+    if is_string(cluster_centers_0, 'k-means++') or \
+            is_string(cluster_centers_0, 'random'):
+        _seed = random_state.randint(np.iinfo('i').max)
+        centroids_ = _daal4py_init_centroids(
+            X, X_fptype, nClusters, cluster_centers_0, _seed)
     elif hasattr(cluster_centers_0, '__array__'):
         deterministic = True
         cc_arr = np.ascontiguousarray(cluster_centers_0, dtype=X.dtype)
@@ -165,10 +193,173 @@ def _daal4py_k_means_predict(X, nClusters, centroids,
     return res.assignments[:, 0], res.objectiveFunction[0, 0]
 
 
+def _check_distinct_clusters(labels, nClusters):
+    distinct_clusters = np.unique(labels).size
+    if distinct_clusters < nClusters:
+        warnings.warn(
+            "Number of distinct clusters ({}) found smaller than "
+            "n_clusters ({}). Possibly due to duplicate points "
+            "in X.".format(distinct_clusters, nClusters),
+            ConvergenceWarning, stacklevel=3)
+        # for passing test case "test_kmeans_warns_less_centers_than_unique_points"
+
+
+def _dense_rows(X, rows):
+    X_rows = X[rows]
+    return X_rows.toarray() if sp.issparse(X_rows) else X_rows
+
+
+def _weighted_k_means_plusplus(X, nClusters, sample_weight, random_state):
+    """k-means++ seeding where points are sampled proportionally to
+    weight times squared distance to the closest chosen center"""
+    n_samples = X.shape[0]
+    n_local_trials = 2 + int(np.log(nClusters))
+    x_squared_norms = row_norms(X, squared=True)
+    centers = np.empty((nClusters, X.shape[1]), dtype=X.dtype)
+
+    center_id = random_state.choice(n_samples, p=sample_weight / sample_weight.sum())
+    centers[0] = _dense_rows(X, [center_id])
+    closest_dist_sq = euclidean_distances(
+        centers[0, np.newaxis], X, Y_norm_squared=x_squared_norms, squared=True)[0]
+    current_pot = closest_dist_sq @ sample_weight
+
+    for c in range(1, nClusters):
+        rand_vals = random_state.uniform(size=n_local_trials) * current_pot
+        candidate_ids = np.searchsorted(
+            stable_cumsum(sample_weight * closest_dist_sq), rand_vals)
+        np.clip(candidate_ids, None, n_samples - 1, out=candidate_ids)
+        distance_to_candidates = euclidean_distances(
+            X[candidate_ids], X, Y_norm_squared=x_squared_norms, squared=True)
+        np.minimum(closest_dist_sq, distance_to_candidates,
+                   out=distance_to_candidates)
+        candidates_pot = distance_to_candidates @ sample_weight
+
+        best_candidate = np.argmin(candidates_pot)
+        current_pot = candidates_pot[best_candidate]
+        closest_dist_sq = distance_to_candidates[best_candidate]
+        centers[c] = _dense_rows(X, [candidate_ids[best_candidate]])
+    return centers
+
+
+def _cluster_sums(X, labels, sample_weight, nClusters):
+    """Weighted sums of the points and total weights of the clusters"""
+    labels = np.ascontiguousarray(labels, dtype=np.intc)
+    if not sp.issparse(X):
+        return daal4py._kmeans_weighted_cluster_sums(
+            np.ascontiguousarray(X), labels,
+            np.ascontiguousarray(sample_weight, dtype=X.dtype), nClusters)
+    # one weighted entry per column, in CSC format no sorting is needed
+    n_samples = X.shape[0]
+    membership = sp.csc_matrix(
+        (sample_weight, labels, np.arange(n_samples + 1)), shape=(nClusters, n_samples))
+    sums = (membership @ X).toarray()
+    weights = np.bincount(labels, weights=sample_weight, minlength=nClusters)
+    return sums, weights
+
+
+def _weighted_centers(X, labels, sample_weight, centers):
+    """Weighted means of the clusters, empty clusters keep their center"""
+    sums, weights = _cluster_sums(X, labels, sample_weight, centers.shape[0])
+    new_centers = centers.copy()
+    non_empty = weights > 0
+    new_centers[non_empty] = sums[non_empty] / weights[non_empty, np.newaxis]
+    return new_centers
+
+
+def _weighted_inertia(X, centers, labels, sample_weight):
+    if not sp.issparse(X):
+        return daal4py._kmeans_weighted_inertia(
+            np.ascontiguousarray(X), np.ascontiguousarray(centers, dtype=X.dtype),
+            np.ascontiguousarray(labels, dtype=np.intc),
+            np.ascontiguousarray(sample_weight, dtype=X.dtype))
+    inertia = 0.0
+    for batch in gen_batches(X.shape[0], 4096):
+        diff = _dense_rows(X, batch) - centers[labels[batch]]
+        inertia += row_norms(diff, squared=True) @ sample_weight[batch]
+    return inertia
+
+
+def _weighted_starting_centroids(X, X_fptype, nClusters, cluster_centers_0,
+                                 verbose, random_state, sample_weight):
+    deterministic = False
+    if isinstance(cluster_centers_0, str) and cluster_centers_0 == 'k-means++':
+        centers = _weighted_k_means_plusplus(
+            X, nClusters, sample_weight, random_state)
+    elif isinstance(cluster_centers_0, str) and cluster_centers_0 == 'random':
+        centers = _dense_rows(X, random_state.choice(
+            X.shape[0], nClusters, replace=False,
+            p=sample_weight / sample_weight.sum()))
+    else:
+        deterministic, centers = _daal4py_compute_starting_centroids(
+            X, X_fptype, nClusters, cluster_centers_0, verbose, random_state)
+    return deterministic, np.ascontiguousarray(centers, dtype=X.dtype)
+
+
+def _daal4py_weighted_k_means_fit(X, nClusters, numIterations, tol,
+                                  cluster_centers_0, n_init, verbose,
+                                  random_state, sample_weight):
+    # oneDAL kmeans has no weights input: oneDAL assigns the points to the
+    # closest centers, the weighted centers and inertia are then reduced
+    # natively (see src/kmeans_weighted.h)
+    X_fptype = getFPType(X)
+    abs_tol = _tolerance(X, tol)  # tol is relative tolerance
+    method = "lloydCSR" if sp.isspmatrix(X) else "defaultDense"
+    if not sp.issparse(X):
+        # the weighted reductions read C-ordered rows, convert only once
+        X = np.ascontiguousarray(X)
+    sample_weight = np.asarray(sample_weight, dtype=X.dtype)
+    best_inertia, best_cluster_centers, best_labels = None, None, None
+    best_n_iter = -1
+    assign_algo = _daal4py_kmeans_compatibility(
+        nClusters=nClusters,
+        maxIterations=0,
+        fptype=X_fptype,
+        resultsToEvaluate='computeAssignments',
+        method=method,
+    )
+
+    for k in range(n_init):
+        deterministic, centers = _weighted_starting_centroids(
+            X, X_fptype, nClusters, cluster_centers_0, verbose, random_state,
+            sample_weight)
+
+        for n_iter in range(1, numIterations + 1):
+            labels = assign_algo.compute(X, centers).assignments[:, 0]
+            new_centers = _weighted_centers(X, labels, sample_weight, centers)
+            center_shift = ((new_centers - centers) ** 2).sum()
+            centers = new_centers
+            if center_shift <= abs_tol:
+                break
+
+        labels = assign_algo.compute(X, centers).assignments[:, 0]
+        inertia = _weighted_inertia(X, centers, labels, sample_weight)
+        if verbose:
+            print(f"Iteration {k}, inertia {inertia}.")
+
+        if best_inertia is None or inertia < best_inertia:
+            best_cluster_centers, best_labels = centers, labels
+            best_inertia, best_n_iter = inertia, n_iter
+        if deterministic and n_init != 1:
+            warnings.warn(
+                'Explicit initial center position passed: '
+                'performing only one init in k-means instead of n_init=%d'
+                % n_init, RuntimeWarning, stacklevel=2)
+            break
+
+    _check_distinct_clusters(best_labels, nClusters)
+
+    return best_cluster_centers, best_labels, best_inertia, best_n_iter
+
+
 def _daal4py_k_means_fit(X, nClusters, numIterations,
-                         tol, cluster_centers_0, n_init, verbose, random_state):
+                         tol, cluster_centers_0, n_init, verbose, random_state,
+                         n_jobs=None, sample_weight=None):
     if numIterations < 0:
         raise ValueError("Wrong iterations number")
+    if sample_weight is not None:
+        return _daal4py_weighted_k_means_fit(
+            X, nClusters, numIterations, tol, cluster_centers_0, n_init, verbose,
+            random_state, sample_weight)
 
     X_fptype = getFPType(X)
     abs_tol = _tolerance(X, tol)  # tol is relative tolerance
@@ -176,20 +367,46 @@ def _daal4py_k_means_fit(X, nClusters, numIterations,
     method = "lloydCSR" if is_sparse else "defaultDense"
     best_inertia, best_cluster_centers = None, None
     best_n_iter = -1
-    kmeans_algo = _daal4py_kmeans_compatibility(
-        nClusters=nClusters,
-        maxIterations=numIterations,
-        accuracyThreshold=abs_tol,
-        fptype=X_fptype,
-        resultsToEvaluate='computeCentroids',
-        method=method,
-    )
 
-    for k in range(n_init):
-        deterministic, starting_centroids_ = _daal4py_compute_starting_centroids(
-            X, X_fptype, nClusters, cluster_centers_0, verbose, random_state)
+    def lloyd(starting_centroids_):
+        # algorithm objects are not thread-safe, each run gets its own
+        kmeans_algo = _daal4py_kmeans_compatibility(
+            nClusters=nClusters,
+            maxIterations=numIterations,
+            accuracyThreshold=abs_tol,
+            fptype=X_fptype,
+            resultsToEvaluate='computeCentroids',
+            method=method,
+        )
+        return kmeans_algo.compute(X, starting_centroids_)
+
+    # restarts run concurrently only on request, None or 1 keeps them
+    # sequential, and only as many as fit into working_memory
+    n_concurrent = min(n_init, effective_n_jobs(n_jobs),
+                       _max_concurrent_restarts(X, nClusters))
+    if n_concurrent > 1 and isinstance(cluster_centers_0, str) and \
+            cluster_centers_0 in ('k-means++', 'random'):
+        # Independent restarts run in threads, oneDAL releases the GIL.
+        # Seeds are drawn in the same order as in the sequential loop.
+        seeds = [random_state.randint(np.iinfo('i').max) for _ in range(n_init)]
+
+        def restart(seed):
+            return lloyd(_daal4py_init_centroids(
+                X, X_fptype, nClusters, cluster_centers_0, seed))
+        results = Parallel(n_jobs=n_concurrent, backend='threading')(
+            delayed(restart)(seed) for seed in seeds)
+        if verbose:
+            print("Initialization complete")
+    else:
+        results = None
 
-        res = kmeans_algo.compute(X, starting_centroids_)
+    for k in range(n_init):
+        if results is None:
+            deterministic, starting_centroids_ = _daal4py_compute_starting_centroids(
+                X, X_fptype, nClusters, cluster_centers_0, verbose, random_state)
+            res = lloyd(starting_centroids_)
+        else:
+            deterministic, res = False, results[k]
 
         inertia = res.objectiveFunction[0, 0]
         if verbose:
@@ -212,18 +429,44 @@ def _daal4py_k_means_fit(X, nClusters, numIterations,
     best_labels, best_inertia = _daal4py_k_means_predict(
         X, nClusters, best_cluster_centers, flag_compute)
 
-    distinct_clusters = np.unique(best_labels).size
-    if distinct_clusters < nClusters:
-        warnings.warn(
-            "Number of distinct clusters ({}) found smaller than "
-            "n_clusters ({}). Possibly due to duplicate points "
-            "in X.".format(distinct_clusters, nClusters),
-            ConvergenceWarning, stacklevel=2)
-        # for passing test case "test_kmeans_warns_less_centers_than_unique_points"
+    _check_distinct_clusters(best_labels, nClusters)
 
     return best_cluster_centers, best_labels, best_inertia, best_n_iter
 
 
+def _daal4py_mini_batch_step(X, sample_weight, centers, weight_sums, random_state,
+                             random_reassign, reassignment_ratio, verbose):
+    # oneDAL assigns the chunk to the closest centers, the per-cluster
+    # partial sums of the chunk are then merged into the running weighted
+    # means, like step1Local/step2Master of distributed kmeans do
+    nClusters = centers.shape[0]
+    labels = _daal4py_k_means_predict(X, nClusters, centers)[0]
+    sums, batch_weights = _cluster_sums(X, labels, sample_weight, nClusters)
+    total_weights = weight_sums + batch_weights
+    updated = (batch_weights != 0) & (total_weights > 0)
+    weighted_sums = centers[updated] * weight_sums[updated, np.newaxis] + sums[updated]
+    centers[updated] = weighted_sums / total_weights[updated, np.newaxis]
+    weight_sums[:] = total_weights
+
+    # Reassign clusters that have very low weight
+    if random_reassign and reassignment_ratio > 0:
+        to_reassign = weight_sums < reassignment_ratio * weight_sums.max()
+        # pick at most .5 * batch_size samples as new centers
+        if to_reassign.sum() > .5 * X.shape[0]:
+            indices_dont_reassign = np.argsort(weight_sums)[int(.5 * X.shape[0]):]
+            to_reassign[indices_dont_reassign] = False
+        n_reassigns = to_reassign.sum()
+        if n_reassigns:
+            new_centers = random_state.choice(
+                X.shape[0], replace=False, size=n_reassigns)
+            if verbose:
+                print(f"[MiniBatchKMeans] Reassigning {n_reassigns} cluster centers.")
+            centers[to_reassign] = _dense_rows(X, new_centers)
+        # reset counts of reassigned centers, but don't reset them too small
+        # to avoid instant reassignment
+        weight_sums[to_reassign] = np.min(weight_sums[~to_reassign])
+
+
 def _fit(self, X, y=None, sample_weight=None):
     """Compute k-means clustering.
 
@@ -284,6 +527,9 @@ def _fit(self, X, y=None, sample_weight=None):
     if algorithm == "auto":
         algorithm = "full" if self.n_clusters == 1 else "elkan"
 
+    if algorithm == "lloyd":
+        algorithm = "full"
+
     if algorithm not in ["full", "elkan"]:
         raise ValueError("Algorithm must be 'auto', 'full' or 'elkan', got"
                          " {}".format(str(algorithm)))
@@ -295,8 +541,13 @@ def _fit(self, X, y=None, sample_weight=None):
             sample_weight = np.full(X_len, sample_weight, dtype=np.float64)
         else:
             sample_weight = np.asarray(sample_weight)
-        daal_ready = (sample_weight.shape == (X_len,)) and (
-            np.allclose(sample_weight, np.ones_like(sample_weight)))
+        # weights are used to sample initial centers, they must define
+        # a distribution with at least n_clusters distinct points
+        daal_ready = (sample_weight.shape == (X_len,)) and \
+            np.all(sample_weight >= 0) and \
+            np.count_nonzero(sample_weight) >= self.n_clusters
+        if daal_ready and np.allclose(sample_weight, np.ones_like(sample_weight)):
+            sample_weight = None
 
     if daal_ready:
         logging.info(
@@ -307,7 +558,8 @@ def _fit(self, X, y=None, sample_weight=None):
         self.cluster_centers_, self.labels_, self.inertia_, self.n_iter_ = \
             _daal4py_k_means_fit(
                 X, self.n_clusters, self.max_iter, self.tol, self.init, self.n_init,
-                self.verbose, random_state)
+                self.verbose, random_state, n_jobs=getattr(self, 'n_init_jobs', None),
+                sample_weight=sample_weight)
     else:
         logging.info(
             "sklearn.cluster.KMeans."
@@ -370,6 +622,109 @@ def _predict(self, X, sample_weight=None):
                            self.cluster_centers_)[0]
 
 
+def _partial_fit(self, X, y=None, sample_weight=None):
+    """Update k means estimate on a single mini-batch X.
+
+    The chunks may be slices of a memory-mapped array, each chunk is
+    read once.
+
+    Parameters
+    ----------
+    X : array-like or sparse matrix, shape=(n_samples, n_features)
+        Coordinates of the data points to cluster. It must be noted that
+        X will be copied if it is not C-contiguous.
+
+    y : Ignored
+        not used, present here for API consistency by convention.
+
+    sample_weight : array-like, shape (n_samples,), optional
+        The weights for each observation in X. If None, all observations
+        are assigned equal weight (default: None)
+
+    """
+    has_centers = hasattr(self, 'cluster_centers_')
+    # the running weights of the centers are kept in _counts, centers
+    # fitted without them are updated by scikit-learn
+    daal_ready = hasattr(self, '_counts') if has_centers else \
+        _num_samples(X) >= self.n_clusters
+    if daal_ready:
+        X = check_array(
+            X,
+            accept_sparse='csr',
+            dtype=self.cluster_centers_.dtype if has_centers
+            else [np.float64, np.float32],
+            order='C',
+            accept_large_sparse=False
+        )
+        weighted = sample_weight is not None
+        sample_weight = _check_sample_weight(sample_weight, X, dtype=X.dtype)
+        if weighted and not has_centers and isinstance(self.init, str):
+            # weights are used to sample initial centers
+            daal_ready = np.all(sample_weight >= 0) and \
+                np.count_nonzero(sample_weight) >= self.n_clusters
+
+    if not daal_ready:
+        logging.info(
+            "sklearn.cluster.MiniBatchKMeans."
+            "partial_fit: " + get_patch_message("sklearn"))
+        return super(MiniBatchKMeans, self).partial_fit(
+            X, y=y, sample_weight=sample_weight)
+
+    logging.info(
+        "sklearn.cluster.MiniBatchKMeans."
+        "partial_fit: " + get_patch_message("daal"))
+    self._random_state = getattr(
+        self, '_random_state', check_random_state(self.random_state))
+    self.n_steps_ = getattr(self, 'n_steps_', 0)
+
+    if not has_centers:
+        X_fptype = getFPType(X)
+        if weighted:
+            _, centers = _weighted_starting_centroids(
+                X, X_fptype, self.n_clusters, self.init, self.verbose,
+                self._random_state, sample_weight)
+        else:
+            _, centers = _daal4py_compute_starting_centroids(
+                X, X_fptype, self.n_clusters, self.init, self.verbose,
+                self._random_state)
+        self.n_features_in_ = X.shape[1]
+        self.cluster_centers_ = np.array(centers, dtype=X.dtype, order='C')
+        self._counts = np.zeros(self.n_clusters, dtype=X.dtype)
+        self._n_since_last_reassign = 0
+    elif self.n_features_in_ != X.shape[1]:
+        raise ValueError(
+            (f'X has {X.shape[1]} features, '
+             f'but MiniBatchKMeans is expecting {self.n_features_in_} '
+             'features as input'))
+
+    # random reassignments are done each time 10 * n_clusters samples
+    # have been processed or when there are empty clusters
+    self._n_since_last_reassign += X.shape[0]
+    random_reassign = (self._counts == 0).any() or \
+        self._n_since_last_reassign >= 10 * self.n_clusters
+    if random_reassign:
+        self._n_since_last_reassign = 0
+
+    _daal4py_mini_batch_step(
+        X, sample_weight, self.cluster_centers_, self._counts, self._random_state,
+        random_reassign, self.reassignment_ratio, self.verbose)
+
+    if self.compute_labels:
+        if weighted:
+            self.labels_ = _daal4py_k_means_predict(
+                X, self.n_clusters, self.cluster_centers_)[0]
+            self.inertia_ = _weighted_inertia(
+                X, self.cluster_centers_, self.labels_, sample_weight)
+        else:
+            self.labels_, self.inertia_ = _daal4py_k_means_predict(
+                X, self.n_clusters, self.cluster_centers_,
+                'computeAssignments|computeExactObjectiveFunction')
+
+    self.n_steps_ += 1
+    self._n_features_out = self.cluster_centers_.shape[0]
+    return self
+
+
 class KMeans(KMeans_original):
     __doc__ = KMeans_original.__doc__
 
@@ -387,6 +742,7 @@ class KMeans(KMeans_original):
             random_state=None,
             copy_x=True,
             algorithm='auto',
+            n_init_jobs=None,
         ):
             super(KMeans, self).__init__(
                 n_clusters=n_clusters,
@@ -399,6 +755,7 @@ class KMeans(KMeans_original):
                 copy_x=copy_x,
                 algorithm=algorithm,
             )
+            self.n_init_jobs = n_init_jobs
     else:
         @_deprecate_positional_args
         def __init__(
@@ -415,6 +772,7 @@ class KMeans(KMeans_original):
             copy_x=True,
             n_jobs='deprecated',
             algorithm='auto',
+            n_init_jobs=None,
         ):
             super(KMeans, self).__init__(
                 n_clusters=n_clusters,
@@ -429,9 +787,17 @@ class KMeans(KMeans_original):
                 n_jobs=n_jobs,
                 algorithm=algorithm,
             )
+            self.n_init_jobs = n_init_jobs
 
     def fit(self, X, y=None, sample_weight=None):
         return _fit(self, X, y=y, sample_weight=sample_weight)
 
     def predict(self, X, sample_weight=None):
         return _predict(self, X, sample_weight=sample_weight)
+
+
+class MiniBatchKMeans(MiniBatchKMeans_original):
+    __doc__ = MiniBatchKMeans_original.__doc__
+
+    def partial_fit(self, X, y=None, sample_weight=None):
+        return _partial_fit(self, X, y=y, sample_weight=sample_weight)
@@ -102,3 +102,62 @@ def _test_across_grid_parameter_numpy_gen(metric, use_weights: bool):
 def test_across_grid_parameter_numpy_gen(metric, use_weights: bool):
     _test_across_grid_parameter_numpy_gen(
         metric=metric, use_weights=use_weights)
+
+
+@pytest.mark.parametrize('memory_saving', [True, False, 'auto'])
+@pytest.mark.parametrize('use_weights', USE_WEIGHTS)
+def test_memory_saving(memory_saving, use_weights: bool):
+    data, weights = generate_data(
+        low=-100.0, high=100.0, samples_number=1000, sample_dimension=4)
+    if use_weights is False:
+        weights = None
+    daal_labels = DBSCAN_DAAL(
+        eps=35.0, min_samples=6, memory_saving=memory_saving).fit(
+        X=data, sample_weight=weights).labels_
+    sklearn_labels = DBSCAN_SKLEARN(eps=35.0, min_samples=6).fit(
+        X=data, sample_weight=weights).labels_
+    check_labels_equals(daal_labels, sklearn_labels)
+
+
+@pytest.mark.parametrize('use_weights', USE_WEIGHTS)
+def test_kd_tree_matches_sklearn(use_weights: bool):
+    data, weights = generate_data(
+        low=-100.0, high=100.0, samples_number=5000, sample_dimension=2)
+    if use_weights is False:
+        weights = None
+    daal_dbscan = DBSCAN_DAAL(eps=2.0, min_samples=5, algorithm='kd_tree').fit(
+        X=data, sample_weight=weights)
+    sklearn_dbscan = DBSCAN_SKLEARN(eps=2.0, min_samples=5).fit(
+        X=data, sample_weight=weights)
+    np.testing.assert_array_equal(daal_dbscan.core_sample_indices_,
+                                  sklearn_dbscan.core_sample_indices_)
+    np.testing.assert_array_equal(daal_dbscan.labels_, sklearn_dbscan.labels_)
+
+
+def test_memory_saving_auto():
+    from sklearn import config_context
+    from daal4py.sklearn.cluster._dbscan import _use_memory_saving
+    data, _ = generate_data(
+        low=-100.0, high=100.0, samples_number=5000, sample_dimension=2)
+    # all neighborhoods fit in the working memory
+    assert not _use_memory_saving(data, 1000.0)
+    with config_context(working_memory=1):
+        assert _use_memory_saving(data, 1000.0)
+        assert not _use_memory_saving(data, 1e-3)
+
+
+@pytest.mark.parametrize('use_weights', USE_WEIGHTS)
+def test_precomputed_sparse_graph(use_weights: bool):
+    from sklearn.neighbors import radius_neighbors_graph
+    data, weights = generate_data(
+        low=-100.0, high=100.0, samples_number=3000, sample_dimension=2)
+    if use_weights is False:
+        weights = None
+    graph = radius_neighbors_graph(data, 5.0, mode='distance')
+    daal_dbscan = DBSCAN_DAAL(eps=4.0, min_samples=5, metric='precomputed').fit(
+        X=graph, sample_weight=weights)
+    sklearn_dbscan = DBSCAN_SKLEARN(eps=4.0, min_samples=5, metric='precomputed').fit(
+        X=graph, sample_weight=weights)
+    np.testing.assert_array_equal(daal_dbscan.core_sample_indices_,
+                                  sklearn_dbscan.core_sample_indices_)
+    np.testing.assert_array_equal(daal_dbscan.labels_, sklearn_dbscan.labels_)
@@ -0,0 +1,156 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+
+import numpy as np
+import pytest
+from scipy import sparse as sp
+from sklearn import config_context
+from sklearn.datasets import make_blobs
+from daal4py.sklearn._utils import sklearn_check_version
+
+if sklearn_check_version('0.23'):
+    from daal4py.sklearn.cluster._k_means_0_23 import (
+        _daal4py_k_means_fit, _max_concurrent_restarts, _tolerance)
+
+
+@pytest.mark.skipif(not sklearn_check_version('0.23'),
+                    reason="parallel restarts require scikit-learn 0.23")
+@pytest.mark.parametrize('init', ['k-means++', 'random'])
+def test_parallel_restarts_match_sequential(init):
+    X, _ = make_blobs(n_samples=2000, centers=10, n_features=5, random_state=0)
+    results = [
+        _daal4py_k_means_fit(X, 10, 300, 1e-4, init, 8, False,
+                             np.random.RandomState(42), n_jobs=n_jobs)
+        for n_jobs in [1, 4]
+    ]
+    (seq_centers, seq_labels, seq_inertia, seq_n_iter), \
+        (par_centers, par_labels, par_inertia, par_n_iter) = results
+    np.testing.assert_allclose(par_centers, seq_centers)
+    np.testing.assert_array_equal(par_labels, seq_labels)
+    assert par_inertia == pytest.approx(seq_inertia)
+    assert par_n_iter == seq_n_iter
+
+
+@pytest.mark.skipif(not sklearn_check_version('0.23'),
+                    reason="parallel restarts require scikit-learn 0.23")
+def test_parallel_restarts_are_opt_in():
+    from daal4py.sklearn.cluster import KMeans
+    X, _ = make_blobs(n_samples=2000, centers=10, n_features=5, random_state=0)
+    assert KMeans().n_init_jobs is None
+    sequential = KMeans(n_clusters=10, n_init=4, random_state=0).fit(X)
+    concurrent = KMeans(n_clusters=10, n_init=4, random_state=0,
+                        n_init_jobs=-1).fit(X)
+    np.testing.assert_allclose(concurrent.cluster_centers_,
+                               sequential.cluster_centers_)
+    np.testing.assert_array_equal(concurrent.labels_, sequential.labels_)
+
+    # restarts in flight are limited by working_memory
+    X = np.zeros((2 ** 16, 4))
+    assert _max_concurrent_restarts(X, 10) > 1
+    with config_context(working_memory=1):
+        assert _max_concurrent_restarts(X, 10) == 1
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_native_weighted_reductions(dtype):
+    import daal4py
+    rng = np.random.RandomState(0)
+    n_samples, n_features, n_clusters = 10000, 7, 5
+    X = rng.rand(n_samples, n_features).astype(dtype)
+    weights = rng.rand(n_samples).astype(dtype)
+    labels = rng.randint(0, n_clusters, n_samples).astype(np.intc)
+    centers = rng.rand(n_clusters, n_features).astype(dtype)
+
+    sums, cluster_weights = daal4py._kmeans_weighted_cluster_sums(
+        X, labels, weights, n_clusters)
+    expected_sums = np.zeros((n_clusters, n_features))
+    np.add.at(expected_sums, labels, weights[:, np.newaxis] * X.astype(np.float64))
+    np.testing.assert_allclose(sums, expected_sums, rtol=1e-5)
+    np.testing.assert_allclose(
+        cluster_weights, np.bincount(labels, weights=weights), rtol=1e-5)
+
+    inertia = daal4py._kmeans_weighted_inertia(X, centers, labels, weights)
+    expected_inertia = ((X - centers[labels]) ** 2).sum(axis=1) @ weights
+    assert inertia == pytest.approx(expected_inertia, rel=1e-5)
+
+
+@pytest.mark.parametrize('label', [-1, 5])
+def test_native_weighted_reductions_check_labels(label):
+    import daal4py
+    X = np.ones((10, 3))
+    weights = np.ones(10)
+    labels = np.zeros(10, dtype=np.intc)
+    labels[7] = label
+    with pytest.raises(ValueError, match='labels'):
+        daal4py._kmeans_weighted_cluster_sums(X, labels, weights, 5)
+    with pytest.raises(ValueError, match='labels'):
+        daal4py._kmeans_weighted_inertia(X, np.ones((5, 3)), labels, weights)
+
+
+@pytest.mark.skipif(not sklearn_check_version('0.23'),
+                    reason="weighted KMeans requires scikit-learn 0.23")
+def test_weighted_matches_repeated_samples():
+    from daal4py.sklearn.cluster import KMeans
+    X, _ = make_blobs(n_samples=500, centers=4, n_features=3, random_state=0)
+    sample_weight = np.random.RandomState(0).randint(1, 4, size=X.shape[0])
+    init = X[:4]
+
+    weighted = KMeans(n_clusters=4, init=init, n_init=1).fit(
+        X, sample_weight=sample_weight)
+    repeated = KMeans(n_clusters=4, init=init, n_init=1).fit(
+        np.repeat(X, sample_weight, axis=0))
+
+    np.testing.assert_allclose(weighted.cluster_centers_,
+                               repeated.cluster_centers_, rtol=1e-5)
+    assert weighted.inertia_ == pytest.approx(repeated.inertia_, rel=1e-5)
+
+
+@pytest.mark.skipif(not sklearn_check_version('0.23'),
+                    reason="MiniBatchKMeans requires scikit-learn 0.23")
+@pytest.mark.parametrize('weighted', [False, True])
+def test_minibatch_partial_fit_matches_sklearn(weighted):
+    from sklearn.cluster import MiniBatchKMeans as MiniBatchKMeans_original
+    from daal4py.sklearn.cluster import MiniBatchKMeans
+    X, _ = make_blobs(n_samples=5000, centers=5, n_features=4, random_state=0)
+    sample_weight = np.random.RandomState(0).rand(X.shape[0]) if weighted else None
+    init = X[:5]
+
+    daal_model = MiniBatchKMeans(n_clusters=5, init=init, random_state=0)
+    sklearn_model = MiniBatchKMeans_original(
+        n_clusters=5, init=init, n_init=1, random_state=0)
+    for batch in range(0, X.shape[0], 500):
+        batch_weight = None if sample_weight is None else \
+            sample_weight[batch:batch + 500]
+        daal_model.partial_fit(X[batch:batch + 500], sample_weight=batch_weight)
+        sklearn_model.partial_fit(X[batch:batch + 500], sample_weight=batch_weight)
+
+    np.testing.assert_allclose(daal_model.cluster_centers_,
+                               sklearn_model.cluster_centers_, rtol=1e-5)
+    assert daal_model.n_steps_ == 10
+
+
+@pytest.mark.skipif(not sklearn_check_version('0.23'),
+                    reason="native tolerance requires scikit-learn 0.23")
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+@pytest.mark.parametrize('sparse', [False, True])
+def test_tolerance_matches_numpy_variance(dtype, sparse):
+    X = np.random.RandomState(0).rand(1000, 7).astype(dtype)
+    X[X < 0.5] = 0
+    expected = np.var(X.astype(np.float64), axis=0).mean() * 1e-4
+    X = sp.csr_matrix(X) if sparse else X
+    assert _tolerance(X, 1e-4) == pytest.approx(expected, rel=1e-4)
+    assert _tolerance(X, 0.0) == 0.0
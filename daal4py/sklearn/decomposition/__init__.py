@@ -16,5 +16,6 @@
 #===============================================================================
 
 from ._pca import PCA
+from ._incremental_pca import IncrementalPCA
 
-__all__ = ['PCA']
+__all__ = ['PCA', 'IncrementalPCA']
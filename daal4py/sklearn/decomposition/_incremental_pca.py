@@ -0,0 +1,236 @@
+#===============================================================================
+# Copyright 2014-2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+import numpy as np
+from scipy import sparse as sp
+
+from sklearn.utils import check_array, gen_batches
+
+import daal4py
+from .._utils import getFPType, get_patch_message, sklearn_check_version
+import logging
+
+if sklearn_check_version('0.22'):
+    from sklearn.decomposition._incremental_pca import \
+        IncrementalPCA as IncrementalPCA_original
+else:
+    from sklearn.decomposition.incremental_pca import \
+        IncrementalPCA as IncrementalPCA_original
+
+
+def _batch_moments(X):
+    """Mean and centered cross-product matrix of one batch, computed by
+    the oneDAL covariance algorithm."""
+    n_samples, n_features = X.shape
+    if n_samples == 1:
+        return X.ravel().astype(np.float64), np.zeros((n_features, n_features))
+    covariance_res = daal4py.covariance(
+        fptype=getFPType(X), outputMatrixType='covarianceMatrix').compute(X)
+    mean = covariance_res.mean.ravel().astype(np.float64)
+    crossproduct = (n_samples - 1) * covariance_res.covariance.astype(np.float64)
+    return mean, crossproduct
+
+
+# attributes computed from the accumulated statistics by _finalize_daal4py
+_FINALIZED_ATTRIBUTES = (
+    'components_', 'singular_values_', 'mean_', 'var_', 'explained_variance_',
+    'explained_variance_ratio_', 'noise_variance_')
+
+
+class IncrementalPCA(IncrementalPCA_original):
+    __doc__ = IncrementalPCA_original.__doc__
+
+    def __getattr__(self, name):
+        # partial_fit only accumulates the statistics, the eigendecomposition
+        # is done on the first access to one of the fitted attributes
+        if name in _FINALIZED_ATTRIBUTES and '_finalize_dtype' in self.__dict__:
+            self._finalize_daal4py(self.__dict__.pop('_finalize_dtype'))
+            return self.__dict__[name]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def _check_n_components(self, n_samples, n_features, first_pass):
+        last_n_components = None if first_pass else self.n_components_
+        if self.n_components is None:
+            if first_pass:
+                self.n_components_ = min(n_samples, n_features)
+            else:
+                self.n_components_ = last_n_components
+        elif not self.n_components <= n_features:
+            raise ValueError(
+                "n_components=%r invalid for n_features=%d, need "
+                "more rows than columns for IncrementalPCA "
+                "processing" % (self.n_components, n_features))
+        elif self.n_components > n_samples and first_pass:
+            raise ValueError(
+                "n_components=%r must be less or equal to "
+                "the batch number of samples %d for the first "
+                "partial_fit call." % (self.n_components, n_samples))
+        else:
+            self.n_components_ = self.n_components
+
+        if not first_pass and last_n_components != self.n_components_:
+            raise ValueError(
+                "Number of input features has changed from %i "
+                "to %i between calls to partial_fit! Try "
+                "setting n_components to a fixed value." %
+                (last_n_components, self.n_components_))
+
+    def _update_daal4py(self, X):
+        # Chunks are reduced to their mean and centered cross-product matrix
+        # and merged into the running statistics, so that the eigenproblem
+        # is of size n_features whatever the number of samples seen.
+        batch_mean, batch_crossproduct = _batch_moments(X)
+        n_samples = X.shape[0]
+
+        if not hasattr(self, '_crossproduct'):
+            self.n_samples_seen_ = n_samples
+            self._mean = batch_mean
+            self._crossproduct = batch_crossproduct
+            return
+
+        n_seen = self.n_samples_seen_
+        n_total = n_seen + n_samples
+        delta = batch_mean - self._mean
+        self._crossproduct += batch_crossproduct
+        self._crossproduct += np.outer(delta, delta) * (n_seen * n_samples / n_total)
+        self._mean += delta * (n_samples / n_total)
+        self.n_samples_seen_ = n_total
+
+    def _finalize_daal4py(self, dtype):
+        n_total = self.n_samples_seen_
+        n_features = self._crossproduct.shape[0]
+        n_components = self.n_components_
+
+        eigenvalues, eigenvectors = np.linalg.eigh(self._crossproduct)
+        eigenvalues = np.maximum(eigenvalues[::-1], 0)
+        components = eigenvectors[:, ::-1].T
+
+        # the same signs as svd_flip(u_based_decision=False)
+        max_abs_cols = np.argmax(np.abs(components), axis=1)
+        signs = np.sign(components[range(n_features), max_abs_cols])
+        signs[signs == 0] = 1
+        components *= signs[:, np.newaxis]
+
+        explained_variance = eigenvalues / (n_total - 1)
+        rank = min(n_total, n_features)
+
+        self.components_ = components[:n_components].astype(dtype, copy=False)
+        self.singular_values_ = \
+            np.sqrt(eigenvalues[:n_components]).astype(dtype, copy=False)
+        self.mean_ = self._mean.astype(dtype)
+        self.var_ = (np.diag(self._crossproduct) / n_total).astype(dtype)
+        self.explained_variance_ = \
+            explained_variance[:n_components].astype(dtype, copy=False)
+        self.explained_variance_ratio_ = \
+            (eigenvalues[:n_components] / np.trace(self._crossproduct)).astype(
+                dtype, copy=False)
+        if n_components < rank:
+            self.noise_variance_ = explained_variance[n_components:rank].mean()
+        else:
+            self.noise_variance_ = 0.
+
+    def _partial_fit_daal4py(self, X, finalize=True):
+        n_samples, n_features = X.shape
+        first_pass = not hasattr(self, '_crossproduct')
+        self._check_n_components(n_samples, n_features, first_pass)
+        self._update_daal4py(X)
+        for attr in _FINALIZED_ATTRIBUTES:
+            self.__dict__.pop(attr, None)
+        if finalize:
+            self._finalize_daal4py(X.dtype)
+        else:
+            self._finalize_dtype = X.dtype
+        return self
+
+    def fit(self, X, y=None):
+        """Fit the model with X, using minibatches of size batch_size.
+
+        Parameters
+        ----------
+        X : {array-like, sparse matrix} of shape (n_samples, n_features)
+            Training data, where n_samples is the number of samples and
+            n_features is the number of features.
+
+        y : Ignored
+
+        Returns
+        -------
+        self : object
+            Returns the instance itself.
+        """
+        self.__dict__.pop('_crossproduct', None)
+        if sklearn_check_version('0.23'):
+            X = self._validate_data(X, accept_sparse=['csr', 'csc', 'lil'],
+                                    dtype=[np.float64, np.float32], copy=False)
+        else:
+            X = check_array(X, accept_sparse=['csr', 'csc', 'lil'],
+                            dtype=[np.float64, np.float32], copy=False)
+        n_samples, n_features = X.shape
+
+        if self.batch_size is None:
+            self.batch_size_ = 5 * n_features
+        else:
+            self.batch_size_ = self.batch_size
+
+        logging.info(
+            "sklearn.decomposition.IncrementalPCA."
+            "fit: " + get_patch_message("daal"))
+        for batch in gen_batches(n_samples, self.batch_size_,
+                                 min_batch_size=self.n_components or 0):
+            X_batch = X[batch]
+            if sp.issparse(X_batch):
+                X_batch = X_batch.toarray()
+            self._partial_fit_daal4py(X_batch, finalize=False)
+        # the eigendecomposition is done once all batches are accumulated
+        self._finalize_daal4py(self.__dict__.pop('_finalize_dtype'))
+        return self
+
+    def partial_fit(self, X, y=None, check_input=True):
+        """Incremental fit with X. All of X is processed as a single batch.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Training data, where n_samples is the number of samples and
+            n_features is the number of features.
+
+        y : Ignored
+
+        check_input : bool, default=True
+            Run check_array on X.
+
+        Returns
+        -------
+        self : object
+            Returns the instance itself.
+        """
+        first_pass = not hasattr(self, '_crossproduct')
+        if check_input:
+            if sp.issparse(X):
+                raise TypeError(
+                    "IncrementalPCA.partial_fit does not support "
+                    "sparse input. Either convert data to dense "
+                    "or use IncrementalPCA.fit to do so in batches.")
+            if sklearn_check_version('0.23'):
+                X = self._validate_data(X, dtype=[np.float64, np.float32],
+                                        copy=False, reset=first_pass)
+            else:
+                X = check_array(X, dtype=[np.float64, np.float32], copy=False)
+        logging.info(
+            "sklearn.decomposition.IncrementalPCA."
+            "partial_fit: " + get_patch_message("daal"))
+        return self._partial_fit_daal4py(X, finalize=False)
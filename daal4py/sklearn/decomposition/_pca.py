@@ -19,9 +19,9 @@ import numbers
 from math import sqrt
 from scipy.sparse import issparse
 
-from sklearn.utils import check_array
+from sklearn.utils import check_array, check_random_state
 from sklearn.utils.validation import check_is_fitted
-from sklearn.utils.extmath import stable_cumsum
+from sklearn.utils.extmath import stable_cumsum, svd_flip
 
 import daal4py
 from .._utils import getFPType, get_patch_message, sklearn_check_version
@@ -139,6 +139,70 @@ class PCA(PCA_original):
         self.explained_variance_ratio_ = explained_variance_ratio_[:n_components]
         self.singular_values_ = np.sqrt((n_samples - 1) * self.explained_variance_)
 
+    def _iterated_power(self, n_components, X):
+        if self.iterated_power == 'auto':
+            # same default as scikit-learn
+            return 7 if n_components < .1 * min(X.shape) else 4
+        return self.iterated_power
+
+    def _fit_randomized_daal4py(self, X, n_components):
+        """Randomized range finder with power iterations on the centered
+        data. X is not centered in place: the mean is subtracted from the
+        products of X."""
+        n_samples, n_features = X.shape
+        random_state = check_random_state(self.random_state)
+        fpType = getFPType(X)
+
+        moments_res = daal4py.low_order_moments(
+            fptype=fpType,
+            method='defaultDense',
+            estimatesToCompute='estimatesMeanVariance'
+        ).compute(X)
+        self.mean_ = moments_res.mean.ravel()
+        total_var = moments_res.variance.sum()
+
+        def centered_dot(M):
+            res = X @ M
+            res -= self.mean_ @ M
+            return res
+
+        def centered_t_dot(Q):
+            res = X.T @ Q
+            res -= np.outer(self.mean_, Q.sum(axis=0))
+            return res
+
+        n_random = min(n_components + getattr(self, 'n_oversamples', 10),
+                       n_samples, n_features)
+        qr_algo = daal4py.qr(fptype=fpType)
+        Q = centered_dot(random_state.normal(
+            size=(n_features, n_random)).astype(X.dtype, copy=False))
+        for _ in range(self._iterated_power(n_components, X)):
+            Q = qr_algo.compute(Q).matrixQ
+            Q = qr_algo.compute(centered_t_dot(Q)).matrixQ
+            Q = centered_dot(Q)
+        Q = qr_algo.compute(Q).matrixQ
+
+        # B = Q.T @ (X - mean) is small, its SVD is computed from B.T
+        svd_res = daal4py.svd(fptype=fpType).compute(centered_t_dot(Q))
+        U = Q @ svd_res.rightSingularMatrix.T
+        S = svd_res.singularValues.ravel()
+        U, V = svd_flip(U, svd_res.leftSingularMatrix.T)
+        U, S, V = U[:, :n_components], S[:n_components], V[:n_components]
+
+        self.n_samples_, self.n_features_ = n_samples, n_features
+        self.components_ = V
+        self.n_components_ = n_components
+        self.explained_variance_ = (S ** 2) / (n_samples - 1)
+        self.explained_variance_ratio_ = self.explained_variance_ / total_var
+        self.singular_values_ = S.copy()
+        if self.n_components_ < min(n_features, n_samples):
+            self.noise_variance_ = total_var - self.explained_variance_.sum()
+            self.noise_variance_ /= min(n_features, n_samples) - n_components
+        else:
+            self.noise_variance_ = 0.
+
+        return U, S, V
+
     def _fit_full(self, X, n_components):
         n_samples, n_features = X.shape
         self._validate_n_components(n_components, n_samples, n_features)
@@ -174,11 +238,12 @@ class PCA(PCA_original):
 
         return U, S, V
 
-    def _fit(self, X):
+    def _fit(self, X, return_X=False):
         if issparse(X):
             raise TypeError('PCA does not support sparse input. See '
                             'TruncatedSVD for a possible alternative.')
 
+        X_input = X
         if sklearn_check_version('0.23'):
             X = self._validate_data(X, dtype=[np.float64, np.float32],
                                     ensure_2d=True, copy=False)
@@ -195,6 +260,11 @@ class PCA(PCA_original):
 
         self._fit_svd_solver = self.svd_solver
         shape_good_for_daal = X.shape[1] / X.shape[0] < 2
+        # 'auto' below was fitted against stock randomized PCA, the daal4py
+        # randomized solver is only used when it is requested explicitly
+        randomized_good_for_daal = self.svd_solver == 'randomized' and \
+            isinstance(n_components, numbers.Integral) and \
+            1 <= n_components <= min(X.shape)
 
         if self._fit_svd_solver == 'auto':
             if n_components == 'mle':
@@ -218,11 +288,11 @@ class PCA(PCA_original):
                 else:
                     self._fit_svd_solver = 'full'
 
-        if not shape_good_for_daal or self._fit_svd_solver != 'full':
-            if sklearn_check_version('0.23'):
-                X = self._validate_data(X, copy=self.copy)
-            else:
-                X = check_array(X, copy=self.copy)
+        use_daal = (self._fit_svd_solver == 'full' and shape_good_for_daal) or \
+            (self._fit_svd_solver == 'randomized' and randomized_good_for_daal)
+        if not use_daal and self.copy and np.may_share_memory(X, X_input):
+            # scikit-learn solvers center X in place, X is already validated
+            X = X.copy()
 
         if self._fit_svd_solver == 'full':
             if shape_good_for_daal:
@@ -235,6 +305,11 @@ class PCA(PCA_original):
                     "sklearn.decomposition.PCA."
                     "fit: " + get_patch_message("sklearn"))
                 result = PCA_original._fit_full(self, X, n_components)
+        elif self._fit_svd_solver == 'randomized' and randomized_good_for_daal:
+            logging.info(
+                "sklearn.decomposition.PCA."
+                "fit: " + get_patch_message("daal"))
+            result = self._fit_randomized_daal4py(X, n_components)
         elif self._fit_svd_solver in ['arpack', 'randomized']:
             logging.info("sklearn.decomposition.PCA.fit: " + get_patch_message("sklearn"))
             result = self._fit_truncated(X, n_components, self._fit_svd_solver)
@@ -242,15 +317,19 @@ class PCA(PCA_original):
             raise ValueError("Unrecognized svd_solver='{0}'"
                              "".format(self._fit_svd_solver))
 
+        if return_X:
+            return result, X
         return result
 
-    def _transform_daal4py(self, X, whiten=False, scale_eigenvalues=True, check_X=True):
-        if sklearn_check_version('0.22'):
-            check_is_fitted(self)
-        else:
-            check_is_fitted(self, ['mean_', 'components_'], all_or_any=all)
+    def _transform_daal4py(self, X, whiten=False, scale_eigenvalues=True, check_X=True,
+                           validate=True):
+        if validate:
+            if sklearn_check_version('0.22'):
+                check_is_fitted(self)
+            else:
+                check_is_fitted(self, ['mean_', 'components_'], all_or_any=all)
 
-        X = check_array(X, dtype=[np.float64, np.float32], force_all_finite=check_X)
+            X = check_array(X, dtype=[np.float64, np.float32], force_all_finite=check_X)
         fpType = getFPType(X)
 
         tr_data = dict()
@@ -292,7 +371,9 @@ class PCA(PCA_original):
             return PCA_original.transform(self, X)
 
     def fit_transform(self, X, y=None):
-        U, S, _ = self._fit(X)
+        # the array validated by _fit is passed to pca_transform as is:
+        # X is neither converted nor checked a second time
+        (U, S, _), X = self._fit(X, return_X=True)
 
         if U is None:
             if self.n_components_ > 0:
@@ -301,7 +382,7 @@ class PCA(PCA_original):
                     "fit_transform: " + get_patch_message("daal"))
 
                 result = self._transform_daal4py(
-                    X, whiten=self.whiten, check_X=False, scale_eigenvalues=False)
+                    X, whiten=self.whiten, scale_eigenvalues=False, validate=False)
             else:
                 result = np.empty((self.n_samples_, 0), dtype=X.dtype)
         else:
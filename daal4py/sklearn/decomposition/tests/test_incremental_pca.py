@@ -0,0 +1,99 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+import numpy as np
+import pytest
+from scipy import sparse as sp
+from sklearn.decomposition import PCA as PCA_original
+from daal4py.sklearn.decomposition import IncrementalPCA
+
+
+def make_data(n_samples, n_features, random_state=0):
+    rng = np.random.RandomState(random_state)
+    return rng.randn(n_samples, n_features) @ rng.randn(n_features, n_features) + 3
+
+
+@pytest.mark.parametrize('n_components', [None, 5])
+def test_fit_matches_full_pca(n_components):
+    X = make_data(1000, 20)
+    ipca = IncrementalPCA(n_components=n_components, batch_size=100).fit(X)
+    pca = PCA_original(n_components=n_components, svd_solver='full').fit(X)
+
+    # accumulated statistics are exact, unlike the truncated updates of
+    # scikit-learn's IncrementalPCA
+    np.testing.assert_allclose(np.abs(ipca.components_), np.abs(pca.components_),
+                               atol=1e-7)
+    np.testing.assert_allclose(ipca.explained_variance_, pca.explained_variance_,
+                               rtol=1e-7)
+    np.testing.assert_allclose(ipca.explained_variance_ratio_,
+                               pca.explained_variance_ratio_, rtol=1e-7)
+    np.testing.assert_allclose(ipca.singular_values_, pca.singular_values_,
+                               rtol=1e-7)
+    np.testing.assert_allclose(ipca.mean_, pca.mean_, rtol=1e-7)
+    np.testing.assert_allclose(ipca.var_, X.var(axis=0), rtol=1e-7)
+    assert ipca.noise_variance_ == pytest.approx(pca.noise_variance_, rel=1e-7)
+    assert ipca.n_samples_seen_ == X.shape[0]
+
+
+def test_partial_fit_matches_fit():
+    X = make_data(1000, 20)
+    ipca = IncrementalPCA(n_components=5)
+    for X_batch in np.array_split(X, 7):
+        ipca.partial_fit(X_batch)
+    fitted = IncrementalPCA(n_components=5).fit(X)
+
+    np.testing.assert_allclose(ipca.components_, fitted.components_, atol=1e-7)
+    np.testing.assert_allclose(ipca.explained_variance_,
+                               fitted.explained_variance_, rtol=1e-7)
+    np.testing.assert_allclose(ipca.transform(X), fitted.transform(X), atol=1e-6)
+
+
+def test_fit_sparse():
+    X = make_data(300, 10)
+    X[X < 3] = 0
+    dense = IncrementalPCA(n_components=3, batch_size=50).fit(X)
+    sparse = IncrementalPCA(n_components=3, batch_size=50).fit(sp.csr_matrix(X))
+    np.testing.assert_allclose(sparse.components_, dense.components_, atol=1e-7)
+    with pytest.raises(TypeError):
+        IncrementalPCA(n_components=3).partial_fit(sp.csr_matrix(X))
+
+
+def test_partial_fit_finalizes_lazily(monkeypatch):
+    X = make_data(1000, 20)
+    ipca = IncrementalPCA(n_components=5)
+    calls = []
+    finalize = ipca._finalize_daal4py
+
+    def recording_finalize(dtype):
+        calls.append(dtype)
+        finalize(dtype)
+
+    monkeypatch.setattr(ipca, '_finalize_daal4py', recording_finalize)
+    for X_batch in np.array_split(X, 7):
+        ipca.partial_fit(X_batch)
+    assert not calls
+    assert ipca.n_samples_seen_ == X.shape[0]
+
+    components = ipca.components_
+    assert len(calls) == 1
+    ipca.transform(X)
+    assert len(calls) == 1
+
+    # a new chunk invalidates the fitted attributes
+    ipca.partial_fit(X[:100])
+    assert 'components_' not in vars(ipca)
+    assert not np.array_equal(ipca.components_, components)
+    assert len(calls) == 2
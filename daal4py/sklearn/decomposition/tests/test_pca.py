@@ -0,0 +1,77 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+import numpy as np
+import pytest
+from sklearn.decomposition import PCA as PCA_original
+from daal4py.sklearn.decomposition import PCA
+
+
+def make_low_rank_data(n_samples, n_features, random_state=0):
+    rng = np.random.RandomState(random_state)
+    scales = np.r_[np.linspace(50, 20, 10), np.linspace(5, 0.1, n_features - 10)]
+    return rng.randn(n_samples, n_features) * scales + 3
+
+
+@pytest.mark.parametrize('shape', [(3000, 800), (600, 2000)])
+def test_randomized_matches_full(shape):
+    X = make_low_rank_data(*shape)
+    randomized = PCA(n_components=10, svd_solver='randomized', random_state=0)
+    X_transformed = randomized.fit_transform(X)
+    full = PCA_original(n_components=10, svd_solver='full').fit(X)
+
+    np.testing.assert_allclose(np.abs(randomized.components_),
+                               np.abs(full.components_), atol=1e-5)
+    np.testing.assert_allclose(randomized.explained_variance_,
+                               full.explained_variance_, rtol=1e-5)
+    np.testing.assert_allclose(randomized.explained_variance_ratio_,
+                               full.explained_variance_ratio_, rtol=1e-5)
+    assert randomized.noise_variance_ == pytest.approx(full.noise_variance_, rel=1e-5)
+    np.testing.assert_allclose(np.abs(X_transformed), np.abs(full.transform(X)),
+                               rtol=1e-3, atol=1e-3)
+
+
+@pytest.mark.parametrize('shape, n_components, expected_solver', [
+    ((1000, 50), 10, 'full'),
+    ((1000, 50), 0.5, 'full'),
+    ((1000, 1000), 10, 'randomized'),
+    ((1000, 1000), 900, 'full'),
+    ((2000, 20000), 5, 'randomized'),
+])
+def test_svd_solver_auto(shape, n_components, expected_solver):
+    X = np.random.RandomState(0).uniform(size=shape)
+    pca = PCA(n_components=n_components).fit(X)
+    assert pca._fit_svd_solver == expected_solver
+
+
+def test_svd_solver_auto_keeps_stock_randomized(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('daal4py randomized solver used by auto')
+    monkeypatch.setattr(PCA, '_fit_randomized_daal4py', fail)
+    X = np.random.RandomState(0).uniform(size=(1000, 1000))
+    assert PCA(n_components=10).fit(X)._fit_svd_solver == 'randomized'
+
+
+@pytest.mark.parametrize('whiten', [False, True])
+@pytest.mark.parametrize('dtype', [np.float64, np.float32, np.int64])
+def test_fit_transform_matches_transform(whiten, dtype):
+    X = (make_low_rank_data(1000, 50) * 10).astype(dtype)
+    X_transformed = PCA(n_components=10, whiten=whiten).fit_transform(X)
+    pca = PCA(n_components=10, whiten=whiten).fit(X)
+
+    rtol = 1e-4 if dtype == np.float32 else 1e-7
+    np.testing.assert_allclose(X_transformed, pca.transform(X),
+                               rtol=rtol, atol=rtol)
@@ -17,7 +17,9 @@
 import numpy as np
 
 import numbers
+import operator
 import warnings
+from collections.abc import Sequence
 
 import daal4py
 from .._utils import (getFPType, get_patch_message)
@@ -41,6 +43,95 @@ from distutils.version import LooseVersion
 from math import ceil
 from scipy import sparse as sp
 
+try:
+    from sklearn.utils._joblib import Parallel, delayed
+except ImportError:
+    from sklearn.externals.joblib import Parallel, delayed
+
+
+class _LazyEstimators(Sequence):
+    """Trees of a oneDAL decision forest model as sklearn decision trees.
+
+    A tree is converted on first access and kept afterwards, so touching
+    a few estimators of a large forest does not convert all of them.
+    ``materialize`` converts the remaining trees in parallel threads, the
+    native tree traversal runs without the GIL.
+    """
+
+    def __init__(self, model, estimator, random_state, n_estimators,
+                 n_features_in, n_outputs, classes=None, n_classes=None):
+        self._model = model
+        self._estimator = estimator
+        random_state = check_random_state(random_state)
+        self._random_states = [random_state.randint(np.iinfo(np.int32).max)
+                               for _ in range(n_estimators)]
+        self._n_features_in = n_features_in
+        self._n_outputs = n_outputs
+        self._classes = classes
+        self._n_classes = n_classes
+        self._estimators = [None] * n_estimators
+
+    def __len__(self):
+        return len(self._estimators)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('estimator index out of range')
+        if self._estimators[index] is None:
+            self._estimators[index] = self._convert(index)
+        return self._estimators[index]
+
+    def materialize(self, n_jobs=None):
+        """Convert all trees that were not accessed yet.
+
+        Parameters
+        ----------
+        n_jobs : int, default=None
+            The number of threads converting trees in parallel.
+
+        Returns
+        -------
+        estimators : list of DecisionTreeClassifier or DecisionTreeRegressor
+        """
+        missing = [i for i, est in enumerate(self._estimators) if est is None]
+        converted = Parallel(n_jobs=n_jobs, backend='threading')(
+            delayed(self._convert)(i) for i in missing)
+        for i, est in zip(missing, converted):
+            self._estimators[i] = est
+        return list(self._estimators)
+
+    def _convert(self, i):
+        est_i = clone(self._estimator)
+        est_i.set_params(random_state=self._random_states[i])
+        if sklearn_check_version('1.0'):
+            est_i.n_features_in_ = self._n_features_in
+        else:
+            est_i.n_features_ = self._n_features_in
+        est_i.n_outputs_ = self._n_outputs
+        n_classes = 1
+        if self._classes is not None:
+            est_i.classes_ = self._classes
+            est_i.n_classes_ = n_classes = self._n_classes
+        # treeState members: 'class_count', 'leaf_count', 'max_depth',
+        # 'node_ar', 'node_count', 'value_ar'
+        tree_i_state_class = daal4py.getTreeState(self._model, i, n_classes)
+        tree_i_state_dict = {
+            'max_depth': tree_i_state_class.max_depth,
+            'node_count': tree_i_state_class.node_count,
+            'nodes': tree_i_state_class.node_ar,
+            'values': tree_i_state_class.value_ar}
+        est_i.tree_ = Tree(
+            self._n_features_in,
+            np.array([n_classes], dtype=np.intp),
+            self._n_outputs)
+        est_i.tree_.__setstate__(tree_i_state_dict)
+        return est_i
+
 
 def _to_absolute_max_features(
     max_features,
@@ -768,49 +859,11 @@ class RandomForestClassifier(RandomForestClassifier_original):
             params['min_impurity_split'] = self.min_impurity_split
         est = DecisionTreeClassifier(**params)
         # we need to set est.tree_ field with Trees constructed from Intel(R)
-        # oneAPI Data Analytics Library solution
-        estimators_ = []
-        random_state_checked = check_random_state(self.random_state)
-        for i in range(self.n_estimators):
-            # print("Tree #{}".format(i))
-            est_i = clone(est)
-            est_i.set_params(
-                random_state=random_state_checked.randint(np.iinfo(np.int32).max))
-            if sklearn_check_version('1.0'):
-                est_i.n_features_in_ = self.n_features_in_
-            else:
-                est_i.n_features_ = self.n_features_in_
-            est_i.n_outputs_ = self.n_outputs_
-            est_i.classes_ = classes_
-            est_i.n_classes_ = n_classes_
-            # treeState members: 'class_count', 'leaf_count', 'max_depth',
-            # 'node_ar', 'node_count', 'value_ar'
-            tree_i_state_class = daal4py.getTreeState(
-                self.daal_model_, i, n_classes_)
-
-            # node_ndarray = tree_i_state_class.node_ar
-            # value_ndarray = tree_i_state_class.value_ar
-            # value_shape = (node_ndarray.shape[0], self.n_outputs_,
-            #                n_classes_)
-            # assert np.allclose(
-            #     value_ndarray, value_ndarray.astype(np.intc, casting='unsafe')
-            # ), "Value array is non-integer"
-            tree_i_state_dict = {
-                'max_depth': tree_i_state_class.max_depth,
-                'node_count': tree_i_state_class.node_count,
-                'nodes': tree_i_state_class.node_ar,
-                'values': tree_i_state_class.value_ar}
-            est_i.tree_ = Tree(
-                self.n_features_in_,
-                np.array(
-                    [n_classes_],
-                    dtype=np.intp),
-                self.n_outputs_)
-            est_i.tree_.__setstate__(tree_i_state_dict)
-            estimators_.append(est_i)
-
-        self._cached_estimators_ = estimators_
-        return estimators_
+        # oneAPI Data Analytics Library solution, this happens on access
+        self._cached_estimators_ = _LazyEstimators(
+            self.daal_model_, est, self.random_state, self.n_estimators,
+            self.n_features_in_, self.n_outputs_, classes_, n_classes_)
+        return self._cached_estimators_
 
 
 class RandomForestRegressor(RandomForestRegressor_original):
@@ -1005,30 +1058,8 @@ class RandomForestRegressor(RandomForestRegressor_original):
         est = DecisionTreeClassifier(**params)
 
         # we need to set est.tree_ field with Trees constructed from Intel(R)
-        # oneAPI Data Analytics Library solution
-        estimators_ = []
-        random_state_checked = check_random_state(self.random_state)
-        for i in range(self.n_estimators):
-            est_i = clone(est)
-            est_i.set_params(
-                random_state=random_state_checked.randint(np.iinfo(np.int32).max))
-            if sklearn_check_version('1.0'):
-                est_i.n_features_in_ = self.n_features_in_
-            else:
-                est_i.n_features_ = self.n_features_in_
-            est_i.n_outputs_ = self.n_outputs_
-
-            tree_i_state_class = daal4py.getTreeState(self.daal_model_, i)
-            tree_i_state_dict = {
-                'max_depth': tree_i_state_class.max_depth,
-                'node_count': tree_i_state_class.node_count,
-                'nodes': tree_i_state_class.node_ar,
-                'values': tree_i_state_class.value_ar}
-
-            est_i.tree_ = Tree(
-                self.n_features_in_, np.array(
-                    [1], dtype=np.intp), self.n_outputs_)
-            est_i.tree_.__setstate__(tree_i_state_dict)
-            estimators_.append(est_i)
-
-        return estimators_
+        # oneAPI Data Analytics Library solution, this happens on access
+        self._cached_estimators_ = _LazyEstimators(
+            self.daal_model_, est, self.random_state, self.n_estimators,
+            self.n_features_in_, self.n_outputs_)
+        return self._cached_estimators_
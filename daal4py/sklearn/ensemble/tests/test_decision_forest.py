@@ -197,3 +197,22 @@ def test_mse_regressor_big_estimators_iris(n_estimators):
         n_estimators=n_estimators,
         description=f"Regression: n_estimators={n_estimators}: "
     )
+
+
+@pytest.mark.parametrize('Forest', [DaalRandomForestClassifier,
+                                    DaalRandomForestRegressor])
+def test_estimators_converted_on_access(Forest):
+    model = Forest(n_estimators=20, random_state=0).fit(IRIS.data, IRIS.target)
+    estimators = model.estimators_
+    assert len(estimators) == 20
+    assert all(est is None for est in estimators._estimators)
+
+    last = estimators[-1]
+    assert last is estimators[19]
+    assert sum(est is not None for est in estimators._estimators) == 1
+    assert last.tree_.node_count > 0
+
+    converted = estimators.materialize(n_jobs=2)
+    assert converted[19] is last
+    assert all(est.tree_.node_count > 0 for est in estimators)
+    assert model.feature_importances_.shape == (IRIS.data.shape[1],)
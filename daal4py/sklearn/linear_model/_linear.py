@@ -24,7 +24,7 @@ from ..utils.base import _daal_validate_data
 from .._utils import sklearn_check_version
 from sklearn.utils.fixes import sparse_lsqr
 from sklearn.utils.validation import _check_sample_weight
-from sklearn.utils import check_array
+from sklearn.utils import check_array, check_X_y, gen_batches
 
 from sklearn.linear_model import LinearRegression as LinearRegression_original
 if sklearn_check_version('1.0'):
@@ -86,6 +86,188 @@ def _daal4py_fit(self, X, y_):
     return self
 
 
+def _daal4py_weighted_fit(algorithm, X, y, sample_weight, fit_intercept):
+    """Solve the weighted normal equations with a streaming oneDAL
+    regression training algorithm.
+
+    Rows are centered by the weighted means and scaled by the square root
+    of their weights one chunk at a time, so no scaled copy of X is made.
+    The algorithm must be created with interceptFlag=False.
+
+    Returns the coefficients and intercepts, of shapes
+    (n_targets, n_features) and (n_targets,).
+    """
+    sqrt_weight = np.sqrt(sample_weight)
+    if fit_intercept:
+        weight_sum = sample_weight.sum()
+        X_offset = (sample_weight @ X) / weight_sum
+        y_offset = (sample_weight @ y) / weight_sum
+    else:
+        X_offset = np.zeros(X.shape[1], dtype=X.dtype)
+        y_offset = np.zeros(y.shape[1], dtype=X.dtype)
+
+    chunk_n_rows = max(1, 2 ** 20 // (X.shape[1] + y.shape[1]))
+    for batch in gen_batches(X.shape[0], chunk_n_rows):
+        scale = sqrt_weight[batch, np.newaxis]
+        X_batch = X[batch] - X_offset
+        X_batch *= scale
+        y_batch = y[batch] - y_offset
+        y_batch *= scale
+        algorithm.compute(X_batch, y_batch)
+
+    coef = algorithm.finalize().model.Beta[:, 1:].copy(order='C')
+    intercept = y_offset - coef @ X_offset
+    return coef, intercept
+
+
+def _daal4py_model_from_coef(model_builder, coef, intercept, fit_intercept):
+    """oneDAL model with the coefficients of a weighted fit, of shapes
+    (n_targets, n_features) and (n_targets,), for the oneDAL prediction."""
+    builder = model_builder(coef.shape[1], coef.shape[0])
+    builder.set_beta(coef, intercept if fit_intercept else None)
+    return builder.model
+
+
+def _daal4py_fit_weighted(self, X, y_, sample_weight):
+    y = make2d(y_)
+    X_fptype = getFPType(X)
+    if hasattr(self, 'daal_model_'):
+        del self.daal_model_
+
+    for method in ['defaultDense', 'qrDense']:
+        lr_algorithm = daal4py.linear_regression_training(
+            fptype=X_fptype,
+            interceptFlag=False,
+            method=method,
+            streaming=True
+        )
+        try:
+            coef, intercept = _daal4py_weighted_fit(
+                lr_algorithm, X, y, sample_weight, self.fit_intercept)
+            break
+        except RuntimeError:
+            # Normal system is not invertible, try QR
+            continue
+    else:
+        # fall back on sklearn
+        return None
+
+    # the trained model has no intercept, the model with both is built
+    self.daal_model_ = _daal4py_model_from_coef(
+        daal4py.linear_regression_model_builder, coef, intercept,
+        self.fit_intercept)
+    self.intercept_ = intercept
+    self.coef_ = coef
+    self.n_features_in_ = X.shape[1]
+    self.rank_ = X.shape[1]
+    self.singular_ = np.full((X.shape[1],), np.nan)
+
+    if self.coef_.shape[0] == 1 and y_.ndim == 1:
+        self.coef_ = np.ravel(self.coef_)
+        self.intercept_ = self.intercept_[0]
+
+    return self
+
+
+# attributes computed from the streaming partial result when first accessed
+_PARTIAL_FIT_ATTRIBUTES = ['coef_', 'intercept_', 'daal_model_']
+
+
+def _partial_fit_daal4py(self, X, y_, make_algorithm):
+    """Feed a chunk to the streaming oneDAL training algorithm kept on the
+    estimator. The normal equations are accumulated natively, the
+    coefficients are only computed when coef_, intercept_ or daal_model_
+    is accessed."""
+    stream = self.__dict__.get('_daal_stream')
+    if stream is False:
+        raise ValueError(
+            'The partial results of a pickled estimator are not kept, '
+            'partial_fit cannot continue. Call partial_fit on a new estimator.')
+
+    X, y_ = check_X_y(X, y_, dtype=[np.float64, np.float32] if stream is None
+                      else self._daal_stream_dtype, multi_output=True, y_numeric=True)
+    y = make2d(y_)
+    if stream is None:
+        self.n_features_in_ = X.shape[1]
+        self._daal_stream_dtype = X.dtype
+        self._daal_stream_n_targets = y.shape[1]
+        self._daal_stream_ravel = y_.ndim == 1
+        stream = make_algorithm(X, y)
+        self._daal_stream = stream
+    elif X.shape[1] != self.n_features_in_:
+        raise ValueError(
+            f'X has {X.shape[1]} features, but {self.__class__.__name__} '
+            f'is expecting {self.n_features_in_} features as input')
+    elif y.shape[1] != self._daal_stream_n_targets:
+        raise ValueError(
+            f'y has {y.shape[1]} targets, but {self.__class__.__name__} '
+            f'is expecting {self._daal_stream_n_targets} targets')
+
+    stream.compute(X, y)
+    for attr in _PARTIAL_FIT_ATTRIBUTES:
+        self.__dict__.pop(attr, None)
+    self.fit_shape_good_for_daal_ = True
+    return self
+
+
+def _finalize_partial_fit(self):
+    try:
+        model = self._daal_stream.finalize().model
+    except RuntimeError:
+        raise ValueError(
+            f'The normal equations accumulated by {self.__class__.__name__}.'
+            'partial_fit are singular: the features of the chunks seen so far '
+            'are linearly dependent. Pass more chunks, or use fit instead.')
+    self.daal_model_ = model
+    coefs = model.Beta
+
+    self.intercept_ = coefs[:, 0].copy(order='C')
+    self.coef_ = coefs[:, 1:].copy(order='C')
+    if self._daal_stream_ravel:
+        self.coef_ = np.ravel(self.coef_)
+        self.intercept_ = self.intercept_[0]
+
+
+def _check_partial_fit_finalized(self):
+    """Finalize a pending partial fit, raising ValueError if its normal
+    equations cannot be solved."""
+    if self.__dict__.get('_daal_stream') and 'coef_' not in self.__dict__:
+        _finalize_partial_fit(self)
+
+
+def _reset_partial_fit(self):
+    for attr in ['_daal_stream', '_daal_stream_dtype',
+                 '_daal_stream_n_targets', '_daal_stream_ravel']:
+        self.__dict__.pop(attr, None)
+
+
+class _PartialFitMixin:
+    """Lazy finalization and pickling of estimators fitted with
+    _partial_fit_daal4py."""
+
+    def __getattr__(self, name):
+        if name in _PARTIAL_FIT_ATTRIBUTES and self.__dict__.get('_daal_stream'):
+            # attribute lookup only raises AttributeError, predict and
+            # pickling report why the fit failed
+            try:
+                _finalize_partial_fit(self)
+            except ValueError as e:
+                raise AttributeError(
+                    f"'{self.__class__.__name__}' object has no attribute "
+                    f"'{name}': {e}") from e
+            return self.__dict__[name]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def __getstate__(self):
+        # oneDAL algorithms cannot be pickled, only the finalized model is kept
+        _check_partial_fit_finalized(self)
+        state = super().__getstate__()
+        if '_daal_stream' in state:
+            state['_daal_stream'] = False
+        return state
+
+
 def _daal4py_predict(self, X):
     X = make2d(X)
     _fptype = getFPType(self.coef_)
@@ -156,8 +338,11 @@ def _fit_linear(self, X, y, sample_weight=None):
     self.fit_shape_good_for_daal_ = \
         bool(X.shape[0] > X.shape[1] + int(self.fit_intercept))
 
+    if sample_weight is not None:
+        sample_weight = _check_sample_weight(sample_weight, X, dtype=X.dtype)
+
     daal_ready = self.fit_shape_good_for_daal_ and not sp.issparse(X) and \
-        sample_weight is None
+        (sample_weight is None or np.all(sample_weight >= 0))
     if sklearn_check_version('0.22') and not sklearn_check_version('0.23'):
         daal_ready = daal_ready and dtype in [np.float32, np.float64]
 
@@ -165,7 +350,10 @@ def _fit_linear(self, X, y, sample_weight=None):
         logging.info(
             "sklearn.linar_model.LinearRegression."
             "fit: " + get_patch_message("daal"))
-        res = _daal4py_fit(self, X, y)
+        if sample_weight is None:
+            res = _daal4py_fit(self, X, y)
+        else:
+            res = _daal4py_fit_weighted(self, X, y, sample_weight)
         if res is not None:
             return res
         logging.info(
@@ -219,7 +407,7 @@ def _predict_linear(self, X):
     return _daal4py_predict(self, X)
 
 
-class LinearRegression(LinearRegression_original):
+class LinearRegression(_PartialFitMixin, LinearRegression_original):
     __doc__ = LinearRegression_original.__doc__
 
     if sklearn_check_version('0.24'):
@@ -266,10 +454,51 @@ class LinearRegression(LinearRegression_original):
                 logging.info(
                     "sklearn.linar_model.LinearRegression."
                     "fit: " + get_patch_message("sklearn"))
+                _reset_partial_fit(self)
                 return super(LinearRegression, self).fit(
                     X, y=y, sample_weight=sample_weight
                 )
+        _reset_partial_fit(self)
         return _fit_linear(self, X, y, sample_weight=sample_weight)
 
+    def partial_fit(self, X, y):
+        """Update the least squares solution with a chunk of samples.
+
+        The normal equations of all chunks seen since the first call are
+        accumulated, the result is the exact least squares fit of their
+        concatenation. Data passed to ``fit`` is not part of it.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Training data chunk.
+
+        y : array-like of shape (n_samples,) or (n_samples, n_targets)
+            Target values chunk.
+
+        Returns
+        -------
+        self : returns an instance of self.
+        """
+        if sklearn_check_version('0.24') and self.positive is True:
+            raise ValueError('partial_fit does not support positive=True')
+
+        def make_algorithm(X, y):
+            return daal4py.linear_regression_training(
+                fptype=getFPType(X),
+                interceptFlag=bool(self.fit_intercept),
+                method='defaultDense',
+                streaming=True
+            )
+
+        logging.info(
+            "sklearn.linar_model.LinearRegression."
+            "partial_fit: " + get_patch_message("daal"))
+        _partial_fit_daal4py(self, X, y, make_algorithm)
+        self.rank_ = self.n_features_in_
+        self.singular_ = np.full((self.n_features_in_,), np.nan)
+        return self
+
     def predict(self, X):
+        _check_partial_fit_finalized(self)
         return _predict_linear(self, X)
@@ -16,16 +16,21 @@
 
 import numpy as np
 from scipy import sparse as sp
-from sklearn.utils import check_array, check_X_y
+from sklearn.utils import check_array, check_X_y, gen_batches
+from sklearn.utils.validation import _check_sample_weight
 from sklearn.linear_model._ridge import _BaseRidge
 from sklearn.linear_model._ridge import Ridge as Ridge_original
+from sklearn.linear_model._ridge import RidgeCV as RidgeCV_original
 
 import daal4py
 from .._utils import make2d, getFPType, get_patch_message, sklearn_check_version
+from ._linear import (_check_partial_fit_finalized, _daal4py_model_from_coef,
+                      _daal4py_weighted_fit, _partial_fit_daal4py,
+                      _reset_partial_fit, _PartialFitMixin)
 import logging
 
 
-def _daal4py_fit(self, X, y_):
+def _daal4py_fit(self, X, y_, sample_weight=None):
     X = make2d(X)
     y = make2d(y_)
 
@@ -36,23 +41,42 @@ def _daal4py_fit(self, X, y_):
         raise ValueError("alpha length is wrong")
     ridge_params = ridge_params.reshape((1, -1))
 
-    ridge_alg = daal4py.ridge_regression_training(
-        fptype=_fptype,
-        method='defaultDense',
-        interceptFlag=(self.fit_intercept is True),
-        ridgeParameters=ridge_params
-    )
-    try:
-        ridge_res = ridge_alg.compute(X, y)
-    except RuntimeError:
-        return None
+    if sample_weight is not None:
+        # the data is centered by the weighted means, the intercept is
+        # not penalized
+        ridge_alg = daal4py.ridge_regression_training(
+            fptype=_fptype,
+            method='defaultDense',
+            interceptFlag=False,
+            ridgeParameters=ridge_params,
+            streaming=True
+        )
+        try:
+            self.coef_, self.intercept_ = _daal4py_weighted_fit(
+                ridge_alg, X, y, sample_weight, self.fit_intercept is True)
+        except RuntimeError:
+            return None
+        self.daal_model_ = _daal4py_model_from_coef(
+            daal4py.ridge_regression_model_builder, self.coef_, self.intercept_,
+            self.fit_intercept is True)
+    else:
+        ridge_alg = daal4py.ridge_regression_training(
+            fptype=_fptype,
+            method='defaultDense',
+            interceptFlag=(self.fit_intercept is True),
+            ridgeParameters=ridge_params
+        )
+        try:
+            ridge_res = ridge_alg.compute(X, y)
+        except RuntimeError:
+            return None
 
-    ridge_model = ridge_res.model
-    self.daal_model_ = ridge_model
-    coefs = ridge_model.Beta
+        ridge_model = ridge_res.model
+        self.daal_model_ = ridge_model
+        coefs = ridge_model.Beta
 
-    self.intercept_ = coefs[:, 0].copy(order='C')
-    self.coef_ = coefs[:, 1:].copy(order='C')
+        self.intercept_ = coefs[:, 0].copy(order='C')
+        self.coef_ = coefs[:, 1:].copy(order='C')
 
     if self.coef_.shape[0] == 1 and y_.ndim == 1:
         self.coef_ = np.ravel(self.coef_)
@@ -112,20 +136,22 @@ def _fit_ridge(self, X, y, sample_weight=None):
     X, y = check_X_y(X, y, ['csr', 'csc', 'coo'], dtype=[np.float64, np.float32],
                      multi_output=True, y_numeric=True)
     self.n_features_in_ = X.shape[1]
+    if sample_weight is not None:
+        sample_weight = _check_sample_weight(sample_weight, X, dtype=X.dtype)
     self.sample_weight_ = sample_weight
     self.fit_shape_good_for_daal_ = True if X.shape[0] >= X.shape[1] else False
+    if hasattr(self, 'daal_model_'):
+        del self.daal_model_
     if not self.solver == 'auto' or sp.issparse(X) or \
             not self.fit_shape_good_for_daal_ or \
             not (X.dtype == np.float64 or X.dtype == np.float32) or \
-            sample_weight is not None or \
+            (sample_weight is not None and np.any(sample_weight < 0)) or \
             (hasattr(self, 'positive') and self.positive):
-        if hasattr(self, 'daal_model_'):
-            del self.daal_model_
         logging.info("sklearn.linear_model.Ridge.fit: " + get_patch_message("sklearn"))
         return super(Ridge, self).fit(X, y, sample_weight=sample_weight)
     self.n_iter_ = None
     logging.info("sklearn.linear_model.Ridge.fit: " + get_patch_message("daal"))
-    res = _daal4py_fit(self, X, y)
+    res = _daal4py_fit(self, X, y, sample_weight=sample_weight)
     if res is None:
         logging.info(
             "sklearn.linear_model.Ridge.fit: " + get_patch_message("sklearn_after_daal"))
@@ -156,8 +182,7 @@ def _predict_ridge(self, X):
     if not self.solver == 'auto' or \
             not hasattr(self, 'daal_model_') or \
             sp.issparse(X) or \
-            not good_shape_for_daal or \
-            (hasattr(self, 'sample_weight_') and self.sample_weight_ is not None):
+            not good_shape_for_daal:
         logging.info(
             "sklearn.linear_model.Ridge.predict: " + get_patch_message("sklearn"))
         return self._decision_function(X)
@@ -165,7 +190,7 @@ def _predict_ridge(self, X):
     return _daal4py_predict(self, X)
 
 
-class Ridge(Ridge_original, _BaseRidge):
+class Ridge(_PartialFitMixin, Ridge_original, _BaseRidge):
     __doc__ = Ridge_original.__doc__
 
     if sklearn_check_version('1.0'):
@@ -212,7 +237,219 @@ class Ridge(Ridge_original, _BaseRidge):
             self.random_state = random_state
 
     def fit(self, X, y, sample_weight=None):
+        _reset_partial_fit(self)
         return _fit_ridge(self, X, y, sample_weight=sample_weight)
 
+    def partial_fit(self, X, y):
+        """Update the Ridge solution with a chunk of samples.
+
+        The regularized normal equations of all chunks seen since the first
+        call are accumulated, the result is the exact Ridge fit of their
+        concatenation. Data passed to ``fit`` is not part of it.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Training data chunk.
+
+        y : array-like of shape (n_samples,) or (n_samples, n_targets)
+            Target values chunk.
+
+        Returns
+        -------
+        self : returns an instance of self.
+        """
+        if self.solver != 'auto' or (hasattr(self, 'positive') and self.positive):
+            raise ValueError("partial_fit supports only solver='auto' "
+                             "and positive=False")
+
+        def make_algorithm(X, y):
+            ridge_params = np.asarray(self.alpha, dtype=X.dtype)
+            if ridge_params.size != 1 and ridge_params.size != y.shape[1]:
+                raise ValueError("alpha length is wrong")
+            return daal4py.ridge_regression_training(
+                fptype=getFPType(X),
+                method='defaultDense',
+                interceptFlag=(self.fit_intercept is True),
+                ridgeParameters=ridge_params.reshape((1, -1)),
+                streaming=True
+            )
+
+        logging.info(
+            "sklearn.linear_model.Ridge.partial_fit: " + get_patch_message("daal"))
+        self.sample_weight_ = None
+        self.n_iter_ = None
+        return _partial_fit_daal4py(self, X, y, make_algorithm)
+
     def predict(self, X):
+        _check_partial_fit_finalized(self)
         return _predict_ridge(self, X)
+
+
+def _daal4py_gram_eigen(X, y, fit_intercept):
+    """Eigendecomposition of the Gram matrix of X, centered if
+    fit_intercept, with X^T y projected on its eigenvectors.
+
+    X^T X is accumulated by the oneDAL covariance algorithm in one pass
+    over X, every ridge solution is then a rescaling in the eigenbasis.
+    X^T y is accumulated in float64 from centered chunks, also for
+    float32 data.
+    """
+    n_samples, n_features = X.shape
+    covariance_res = daal4py.covariance(
+        fptype=getFPType(X), outputMatrixType='covarianceMatrix').compute(X)
+    X_offset = covariance_res.mean.ravel().astype(np.float64)
+    gram = (n_samples - 1) * covariance_res.covariance.astype(np.float64)
+
+    if fit_intercept:
+        y_offset = y.mean(axis=0, dtype=np.float64)
+    else:
+        gram += n_samples * np.outer(X_offset, X_offset)
+        X_offset = np.zeros_like(X_offset)
+        y_offset = np.zeros(y.shape[1])
+
+    Xty = np.zeros((n_features, y.shape[1]))
+    chunk_n_rows = max(1, 2 ** 20 // (n_features + y.shape[1]))
+    for batch in gen_batches(n_samples, chunk_n_rows):
+        Xty += (X[batch] - X_offset).T @ (y[batch] - y_offset)
+
+    eigenvalues, eigenvectors = np.linalg.eigh(gram)
+    eigenvalues = np.maximum(eigenvalues, 0)
+    return X_offset, y_offset, eigenvalues, eigenvectors, eigenvectors.T @ Xty
+
+
+def _ridge_path_coefs(eigenvectors, projected_Xty, shrinkage):
+    # shrinkage[a, j] = 1 / (eigenvalue[j] + alpha[a])
+    return np.einsum('fj,aj,jt->atf', eigenvectors, shrinkage, projected_Xty)
+
+
+def _ridge_loo_errors(X, y, X_offset, y_offset, eigenvectors, projected_Xty,
+                      shrinkage, fit_intercept):
+    """Mean squared leave-one-out errors of every alpha, of shape
+    (n_alphas, n_targets). X is read in chunks, the n_samples x
+    n_features projection of X is never stored."""
+    n_samples, n_features = X.shape
+    n_alphas, n_targets = shrinkage.shape[0], y.shape[1]
+    # solutions in the eigenbasis, of shape (n_features, n_alphas * n_targets)
+    dual = (shrinkage.T[:, :, np.newaxis] * projected_Xty[:, np.newaxis, :]).reshape(
+        (n_features, n_alphas * n_targets))
+
+    squared_errors = np.zeros((n_alphas, n_targets))
+    chunk_n_rows = max(1, 2 ** 20 // (n_features + n_alphas * n_targets))
+    for batch in gen_batches(n_samples, chunk_n_rows):
+        Z = (X[batch] - X_offset) @ eigenvectors
+        hat_diag = (Z ** 2) @ shrinkage.T
+        if fit_intercept:
+            hat_diag += 1. / n_samples
+        residuals = (y[batch] - y_offset)[:, np.newaxis, :] - \
+            (Z @ dual).reshape((-1, n_alphas, n_targets))
+        residuals /= (1 - hat_diag)[:, :, np.newaxis]
+        squared_errors += (residuals ** 2).sum(axis=0)
+    return squared_errors / n_samples
+
+
+def ridge_path(X, y, alphas, fit_intercept=True):
+    """Compute Ridge regression solutions for a list of regularization
+    strengths.
+
+    X^T X and X^T y are computed once and eigendecomposed, so the cost of
+    each additional alpha does not depend on the number of samples.
+
+    Parameters
+    ----------
+    X : array-like of shape (n_samples, n_features)
+        Training data, n_samples must be greater than n_features.
+
+    y : array-like of shape (n_samples,) or (n_samples, n_targets)
+        Target values.
+
+    alphas : array-like of shape (n_alphas,)
+        Regularization strengths, must be non-negative.
+
+    fit_intercept : bool, default=True
+        Whether to fit the intercept.
+
+    Returns
+    -------
+    coefs : ndarray of shape (n_alphas, n_features) or \
+            (n_alphas, n_targets, n_features)
+        The coefficients for every alpha.
+
+    intercepts : ndarray of shape (n_alphas,) or (n_alphas, n_targets)
+        The intercepts for every alpha.
+    """
+    X, y_ = check_X_y(X, y, dtype=[np.float64, np.float32],
+                      multi_output=True, y_numeric=True)
+    y = make2d(y_).astype(X.dtype, copy=False)
+    alphas = np.asarray(alphas, dtype=np.float64).ravel()
+    if np.any(alphas < 0):
+        raise ValueError("alphas must be non-negative")
+
+    logging.info("sklearn.linear_model.ridge_path: " + get_patch_message("daal"))
+    X_offset, y_offset, eigenvalues, eigenvectors, projected_Xty = \
+        _daal4py_gram_eigen(X, y, fit_intercept)
+    shrinkage = 1. / (eigenvalues + alphas[:, np.newaxis])
+    coefs = _ridge_path_coefs(eigenvectors, projected_Xty, shrinkage)
+    intercepts = y_offset - coefs @ X_offset
+
+    if y_.ndim == 1:
+        coefs, intercepts = coefs[:, 0], intercepts[:, 0]
+    return coefs.astype(X.dtype, copy=False), intercepts
+
+
+def _fit_ridge_cv(self, X, y, sample_weight=None, **params):
+    """Fit Ridge regression model with leave-one-out cross-validation
+    computed from one eigendecomposition of X^T X."""
+    alphas = np.asarray(self.alphas, dtype=np.float64).ravel()
+    store_cv_values = getattr(self, 'store_cv_values', False) is True or \
+        getattr(self, 'store_cv_results', False) is True
+
+    daal_ready = self.cv is None and self.scoring is None and \
+        sample_weight is None and not params and not store_cv_values and \
+        self.gcv_mode in [None, 'auto', 'eigen'] and \
+        np.all(np.isfinite(alphas)) and np.all(alphas > 0)
+    if daal_ready:
+        X, y_ = check_X_y(X, y, ['csr', 'csc', 'coo'], dtype=[np.float64, np.float32],
+                          multi_output=True, y_numeric=True)
+        daal_ready = not sp.issparse(X) and X.shape[0] > X.shape[1] + 1
+
+    if not daal_ready:
+        logging.info(
+            "sklearn.linear_model.RidgeCV.fit: " + get_patch_message("sklearn"))
+        return super(RidgeCV, self).fit(X, y, sample_weight=sample_weight, **params)
+
+    logging.info("sklearn.linear_model.RidgeCV.fit: " + get_patch_message("daal"))
+    self.n_features_in_ = X.shape[1]
+    y = make2d(y_).astype(X.dtype, copy=False)
+    X_offset, y_offset, eigenvalues, eigenvectors, projected_Xty = \
+        _daal4py_gram_eigen(X, y, self.fit_intercept)
+    shrinkage = 1. / (eigenvalues + alphas[:, np.newaxis])
+    squared_errors = _ridge_loo_errors(
+        X, y, X_offset, y_offset, eigenvectors, projected_Xty, shrinkage,
+        self.fit_intercept)
+
+    if getattr(self, 'alpha_per_target', False) and y.shape[1] > 1:
+        best = np.argmin(squared_errors, axis=0)
+        self.alpha_ = alphas[best]
+        self.best_score_ = -squared_errors[best, np.arange(y.shape[1])]
+    else:
+        best = np.full(y.shape[1], np.argmin(squared_errors.mean(axis=1)))
+        self.alpha_ = alphas[best[0]]
+        self.best_score_ = -squared_errors[best[0]].mean()
+
+    coef = np.einsum('fj,tj,jt->tf', eigenvectors, shrinkage[best], projected_Xty)
+    self.coef_ = coef.astype(X.dtype, copy=False)
+    self.intercept_ = y_offset - coef @ X_offset
+    if y_.ndim == 1:
+        self.coef_ = np.ravel(self.coef_)
+        self.intercept_ = self.intercept_[0]
+    if not self.fit_intercept:
+        self.intercept_ = 0.
+    return self
+
+
+class RidgeCV(RidgeCV_original):
+    __doc__ = RidgeCV_original.__doc__
+
+    def fit(self, X, y, sample_weight=None, **params):
+        return _fit_ridge_cv(self, X, y, sample_weight=sample_weight, **params)
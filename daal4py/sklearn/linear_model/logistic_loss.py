@@ -15,6 +15,7 @@
 #===============================================================================
 
 import numpy as np
+from scipy.special import expit
 
 import daal4py
 from .._utils import (make2d, getFPType)
@@ -123,6 +124,58 @@ def _daal4py_grad_(beta, objF_instance, X, y, n, l2_unused):
     return gr
 
 
+def _logistic_hessp(X, beta, l2):
+    beta = beta.astype(X.dtype, copy=False)
+    # second derivative of the loss in the linear predictor, p * (1 - p)
+    pp = expit(beta[0, 0] + np.dot(X, beta[1:, 0]))
+    pp *= 1 - pp
+
+    # buffer reused by every product
+    buffer = np.empty(X.shape[0], dtype=X.dtype)
+
+    def hessp(v):
+        # v is cast to the type of X so that np.dot does not convert X
+        v_ = v.astype(X.dtype, copy=False)
+        Xv = np.dot(X, v_[1:], out=buffer)
+        Xv += v_[0]
+        Xv *= pp
+        res = np.empty_like(v)
+        res[0] = Xv.sum()
+        res[1:] = np.dot(Xv, X)
+        res[1:] += (2 * l2) * v[1:]
+        return res
+    return hessp
+
+
+def _cross_entropy_hessp(X, beta, l2):
+    n_samples, n_features = X.shape
+    beta = beta.astype(X.dtype, copy=False).reshape((-1, 1 + n_features))
+    beta_shape = beta.shape
+    n_classes = beta_shape[0]
+    # pp - array of class probabilities, shape=(nSamples, nClasses)
+    pp = beta[np.newaxis, :, 0] + np.dot(X, beta[:, 1:].T)
+    pp -= pp.max(axis=1, keepdims=True)
+    np.exp(pp, out=pp)
+    pp /= pp.sum(axis=1, keepdims=True)
+
+    # buffer reused by every product
+    buffer = np.empty((n_samples, n_classes), dtype=X.dtype)
+
+    def hessp(v):
+        v2 = v.reshape(beta_shape)
+        v_ = v2.astype(X.dtype, copy=False)
+        r_yhat = np.dot(X, v_[:, 1:].T, out=buffer)
+        r_yhat += v_[:, 0]
+        r_yhat -= np.einsum('ij,ij->i', pp, r_yhat)[:, np.newaxis]
+        r_yhat *= pp
+        hessProd = np.empty(beta_shape)
+        hessProd[:, 1:] = np.dot(r_yhat.T, X)
+        hessProd[:, 1:] += (2 * l2) * v2[:, 1:]
+        hessProd[:, 0] = r_yhat.sum(axis=0)
+        return hessProd.ravel()
+    return hessp
+
+
 def _daal4py_grad_hess_(beta, objF_instance, X, y, n, l2):
     beta_ = make2d(beta)
     if beta_.shape[1] != 1 and beta_.shape[0] == 1:
@@ -133,41 +186,9 @@ def _daal4py_grad_hess_(beta, objF_instance, X, y, n, l2):
 
     if isinstance(objF_instance, daal4py.optimization_solver_logistic_loss):
         # dealing with binary logistic regression
-        # pp - array of probabilities for class=1, shape=(nSamples,)
-        pp = beta_[0, 0] + np.dot(X, beta_[1:, 0])
-        y2 = -1 + 2 * y[:, 0]
-        pp *= y2
-        np.exp(pp, out=pp)
-        pp += 1
-        np.reciprocal(pp, out=pp)
-        np.square(pp, out=pp)
-        del y2
-
-        def hessp(v):
-            pp0 = pp * (v[0] + np.dot(X, v[1:]))
-            res = np.empty_like(v)
-            res[0] = pp0.sum()
-            res[1:] = np.dot(pp0, X)
-            res[1:] += (2 * l2) * v[1:]
-            return res
+        hessp = _logistic_hessp(X, beta_, l2)
     else:
         # dealing with multi-class logistic regression
-        beta__ = beta_.reshape((-1, 1 + X.shape[1]))  # (nClasses, nSamples)
-        beta_shape = beta__.shape
-        # pp - array of class probabilities, shape=(nSamples, nClasses)
-        pp = beta__[np.newaxis, :, 0] + np.dot(X, beta__[:, 1:].T)
-        pp -= pp.max(axis=1, keepdims=True)
-        np.exp(pp, out=pp)
-        pp /= pp.sum(axis=1, keepdims=True)
-
-        def hessp(v):
-            v2 = v.reshape(beta_shape)
-            r_yhat = v2[np.newaxis, :, 0] + np.dot(X, v2[:, 1:].T)
-            r_yhat += (-pp * r_yhat).sum(axis=1)[:, np.newaxis]
-            r_yhat *= pp
-            hessProd = np.zeros(beta_shape)
-            hessProd[:, 1:] = np.dot(r_yhat.T, X) + (2 * l2) * v2[:, 1:]
-            hessProd[:, 0] = r_yhat.sum(axis=0)
-            return hessProd.ravel()
+        hessp = _cross_entropy_hessp(X, beta_, l2)
 
     return gr, hessp
@@ -19,6 +19,7 @@ import numpy as np
 import scipy.sparse as sparse
 import scipy.optimize as optimize
 import numbers
+import threading
 
 from .logistic_loss import (_daal4py_loss_and_grad,
                             _daal4py_logistic_loss_extra_args,
@@ -28,6 +29,7 @@ from .logistic_loss import (_daal4py_loss_and_grad,
 import sklearn.linear_model._logistic as logistic_module
 
 from sklearn.utils import (check_array,
+                           check_X_y,
                            check_consistent_length,
                            compute_class_weight,
                            check_random_state)
@@ -45,11 +47,20 @@ from sklearn.linear_model._logistic import (
     _multinomial_loss_grad,
     _multinomial_grad_hess,
     _LOGISTIC_SOLVER_CONVERGENCE_MSG,
-    LogisticRegression as LogisticRegression_original)
+    LogisticRegression as LogisticRegression_original,
+    LogisticRegressionCV as LogisticRegressionCV_original)
 from sklearn.preprocessing import LabelEncoder, LabelBinarizer
+from sklearn.metrics import get_scorer
+from sklearn.model_selection import check_cv
+from sklearn.utils.multiclass import check_classification_targets
 from .._utils import getFPType, get_patch_message, sklearn_check_version
 import logging
 
+try:
+    from sklearn.utils._joblib import Parallel, delayed
+except ImportError:
+    from sklearn.externals.joblib import Parallel, delayed
+
 
 # Code adapted from sklearn.linear_model.logistic version 0.21
 def __logistic_regression_path(
@@ -585,6 +596,41 @@ def __logistic_regression_path(
     return np.array(coefs), np.array(Cs), n_iter
 
 
+def _get_daal4py_predict_cache(self):
+    """Return the oneDAL model and prediction algorithms built from coef_.
+
+    They are rebuilt after fit or whenever coef_ or intercept_ have been
+    reassigned or modified in place since the last prediction.
+    """
+    cache = getattr(self, '_daal4py_predict_cache', None)
+    if cache is not None and cache['n_classes'] == len(self.classes_) and \
+            np.array_equal(cache['coef'], self.coef_) and \
+            np.array_equal(cache['intercept'], self.intercept_):
+        return cache
+
+    builder = d4p.logistic_regression_model_builder(
+        self.coef_.shape[1], len(self.classes_))
+    builder.set_beta(self.coef_, self.intercept_)
+    cache = {
+        'n_classes': len(self.classes_),
+        'coef': np.array(self.coef_, copy=True),
+        'intercept': np.array(self.intercept_, copy=True),
+        'model': builder.model,
+        # oneDAL algorithm objects keep their inputs between calls, so
+        # every thread gets its own prediction algorithms
+        'local': threading.local(),
+    }
+    self._daal4py_predict_cache = cache
+    return cache
+
+
+def _daal4py_getstate(self, state):
+    # the cached oneDAL objects are rebuilt on demand and are not picklable
+    state = state.copy()
+    state.pop('_daal4py_predict_cache', None)
+    return state
+
+
 def daal4py_predict(self, X, resultsToEvaluate):
     check_is_fitted(self)
     X = check_array(X, accept_sparse='csr', dtype=[np.float64, np.float32])
@@ -608,15 +654,21 @@ def daal4py_predict(self, X, resultsToEvaluate):
                 f'X has {X.shape[1]} features, '
                 f'but LogisticRegression is expecting {n_features} features as input'
             )
-        builder = d4p.logistic_regression_model_builder(X.shape[1], len(self.classes_))
-        builder.set_beta(self.coef_, self.intercept_)
-        predict = d4p.logistic_regression_prediction(
-            nClasses=len(self.classes_),
-            fptype=fptype,
-            method='defaultDense',
-            resultsToEvaluate=resultsToEvaluate
-        )
-        res = predict.compute(X, builder.model)
+        cache = _get_daal4py_predict_cache(self)
+        key = (fptype, resultsToEvaluate)
+        algorithms = getattr(cache['local'], 'algorithms', None)
+        if algorithms is None:
+            algorithms = cache['local'].algorithms = {}
+        predict = algorithms.get(key)
+        if predict is None:
+            predict = d4p.logistic_regression_prediction(
+                nClasses=len(self.classes_),
+                fptype=fptype,
+                method='defaultDense',
+                resultsToEvaluate=resultsToEvaluate
+            )
+            algorithms[key] = predict
+        res = predict.compute(X, cache['model'])
         if resultsToEvaluate == 'computeClassLabels':
             res = res.prediction
             if not np.array_equal(self.classes_, np.arange(0, len(self.classes_))) or \
@@ -734,10 +786,14 @@ if sklearn_check_version('0.24'):
             replacer = logistic_regression_path
             descriptor = getattr(which, what, None)
             setattr(which, what, replacer)
+            self._daal4py_predict_cache = None
             clf = super().fit(X, y, sample_weight)
             setattr(which, what, descriptor)
             return clf
 
+        def __getstate__(self):
+            return _daal4py_getstate(self, super().__getstate__())
+
         def predict(self, X):
             return daal4py_predict(self, X, 'computeClassLabels')
 
@@ -828,10 +884,14 @@ else:
             replacer = logistic_regression_path
             descriptor = getattr(which, what, None)
             setattr(which, what, replacer)
+            self._daal4py_predict_cache = None
             clf = super().fit(X, y, sample_weight)
             setattr(which, what, descriptor)
             return clf
 
+        def __getstate__(self):
+            return _daal4py_getstate(self, super().__getstate__())
+
         def predict(self, X):
             return daal4py_predict(self, X, 'computeClassLabels')
 
@@ -840,3 +900,236 @@ else:
 
         def predict_proba(self, X):
             return daal4py_predict(self, X, 'computeClassProbabilities')
+
+
+def _daal4py_log_reg_scoring_path(X, y, train, test, pos_class, Cs, scoring,
+                                  fit_intercept, max_iter, tol, verbose,
+                                  solver, penalty, multi_class, random_state):
+    """Compute the regularization path of the train fold with daal4py and
+    score it on the test fold, as _log_reg_scoring_path of scikit-learn."""
+    X_train = X[train]
+    X_test = X[test]
+    y_train = y[train]
+    y_test = y[test]
+
+    coefs, Cs, n_iter = logistic_regression_path(
+        X_train, y_train, pos_class=pos_class, Cs=Cs,
+        fit_intercept=fit_intercept, max_iter=max_iter, tol=tol,
+        verbose=verbose, solver=solver, penalty=penalty,
+        multi_class=multi_class, random_state=random_state, check_input=False)
+
+    log_reg = LogisticRegression_original(solver=solver, multi_class=multi_class)
+
+    # The score method of Logistic Regression has a classes_ attribute.
+    if multi_class == 'ovr':
+        log_reg.classes_ = np.array([-1, 1])
+    else:
+        log_reg.classes_ = np.unique(y_train)
+
+    if pos_class is not None:
+        mask = (y_test == pos_class)
+        y_test = np.ones(y_test.shape, dtype=np.float64)
+        y_test[~mask] = -1.
+
+    scores = list()
+
+    scoring = get_scorer(scoring)
+    for w in coefs:
+        if multi_class == 'ovr':
+            w = w[np.newaxis, :]
+        if fit_intercept:
+            log_reg.coef_ = w[:, :-1]
+            log_reg.intercept_ = w[:, -1]
+        else:
+            log_reg.coef_ = w
+            log_reg.intercept_ = 0.
+
+        if scoring is None:
+            scores.append(log_reg.score(X_test, y_test))
+        else:
+            scores.append(scoring(log_reg, X_test, y_test))
+
+    return coefs, Cs, np.array(scores), n_iter
+
+
+# Code adapted from sklearn.linear_model.LogisticRegressionCV.fit
+# version 0.24, for the l2 penalty without sample and class weights
+def _daal4py_fit_cv(self, X, y):
+    solver = _check_solver(self.solver, self.penalty, self.dual)
+
+    if not isinstance(self.max_iter, numbers.Number) or self.max_iter < 0:
+        raise ValueError("Maximum number of iteration must be positive;"
+                         " got (max_iter=%r)" % self.max_iter)
+    if not isinstance(self.tol, numbers.Number) or self.tol < 0:
+        raise ValueError("Tolerance for stopping criteria must be "
+                         "positive; got (tol=%r)" % self.tol)
+
+    if sklearn_check_version('0.23'):
+        X, y = self._validate_data(X, y, accept_sparse='csr', dtype=np.float64,
+                                   order="C")
+    else:
+        X, y = check_X_y(X, y, accept_sparse='csr', dtype=np.float64,
+                         order="C")
+    check_classification_targets(y)
+
+    # Encode for string labels
+    label_encoder = LabelEncoder().fit(y)
+    y = label_encoder.transform(y)
+
+    # The original class labels
+    classes = self.classes_ = label_encoder.classes_
+    encoded_labels = label_encoder.transform(label_encoder.classes_)
+
+    multi_class = _check_multi_class(self.multi_class, solver, len(classes))
+
+    # init cross-validation generator
+    cv = check_cv(self.cv, y, classifier=True)
+    folds = list(cv.split(X, y))
+
+    # Use the label encoded classes
+    n_classes = len(encoded_labels)
+
+    if n_classes < 2:
+        raise ValueError("This solver needs samples of at least 2 classes"
+                         " in the data, but the data contains only one"
+                         " class: %r" % classes[0])
+
+    if n_classes == 2:
+        # OvR in case of binary problems is as good as fitting
+        # the higher label
+        n_classes = 1
+        encoded_labels = encoded_labels[1:]
+        classes = classes[1:]
+
+    # We need this hack to iterate only once over labels, in the case of
+    # multi_class = multinomial, without changing the value of the labels.
+    if multi_class == 'multinomial':
+        iter_encoded_labels = iter_classes = [None]
+    else:
+        iter_encoded_labels = encoded_labels
+        iter_classes = classes
+
+    # oneDAL releases the GIL while it evaluates the loss, so the folds run
+    # concurrently in threads that all share X instead of a copy per
+    # worker process
+    fold_coefs_ = Parallel(n_jobs=self.n_jobs, verbose=self.verbose,
+                           backend='threading')(
+        delayed(_daal4py_log_reg_scoring_path)(
+            X, y, train, test, pos_class=label, Cs=self.Cs,
+            scoring=self.scoring, fit_intercept=self.fit_intercept,
+            max_iter=self.max_iter, tol=self.tol, verbose=self.verbose,
+            solver=solver, penalty=self.penalty, multi_class=multi_class,
+            random_state=self.random_state)
+        for label in iter_encoded_labels
+        for train, test in folds)
+
+    # After reshaping,
+    # - scores is of shape (n_classes, n_folds, n_Cs)
+    # - coefs_paths is of shape (n_classes, n_folds, n_Cs, n_features)
+    # - n_iter is of shape (n_classes, n_folds, n_Cs) or (1, n_folds, n_Cs)
+    coefs_paths, Cs, scores, n_iter_ = zip(*fold_coefs_)
+    self.Cs_ = Cs[0]
+    if multi_class == 'multinomial':
+        coefs_paths = np.reshape(
+            coefs_paths, (len(folds), len(self.Cs_), n_classes, -1))
+        # equiv to coefs_paths = np.moveaxis(coefs_paths, (0, 1, 2, 3),
+        #                                                 (1, 2, 0, 3))
+        coefs_paths = np.swapaxes(coefs_paths, 0, 1)
+        coefs_paths = np.swapaxes(coefs_paths, 0, 2)
+        self.n_iter_ = np.reshape(n_iter_, (1, len(folds), len(self.Cs_)))
+        # repeat same scores across all classes
+        scores = np.tile(scores, (n_classes, 1, 1))
+    else:
+        coefs_paths = np.reshape(
+            coefs_paths, (n_classes, len(folds), len(self.Cs_), -1))
+        self.n_iter_ = np.reshape(
+            n_iter_, (n_classes, len(folds), len(self.Cs_)))
+    scores = np.reshape(scores, (n_classes, len(folds), -1))
+    self.scores_ = dict(zip(classes, scores))
+    self.coefs_paths_ = dict(zip(classes, coefs_paths))
+
+    self.C_ = list()
+    self.l1_ratio_ = list()
+    self.coef_ = np.empty((n_classes, X.shape[1]))
+    self.intercept_ = np.zeros(n_classes)
+    for index, (cls, encoded_label) in enumerate(
+            zip(iter_classes, iter_encoded_labels)):
+
+        if multi_class == 'ovr':
+            scores = self.scores_[cls]
+            coefs_paths = self.coefs_paths_[cls]
+        else:
+            # For multinomial, all scores are the same across classes
+            scores = scores[0]
+            # coefs_paths will keep its original shape because
+            # logistic_regression_path expects it this way
+
+        if self.refit:
+            best_index = scores.sum(axis=0).argmax()
+            C_ = self.Cs_[best_index]
+            self.C_.append(C_)
+            self.l1_ratio_.append(None)
+
+            if multi_class == 'multinomial':
+                coef_init = np.mean(coefs_paths[:, :, best_index, :], axis=1)
+            else:
+                coef_init = np.mean(coefs_paths[:, best_index, :], axis=0)
+
+            # Note that y is label encoded and hence pos_class must be
+            # the encoded label / None (for 'multinomial')
+            w, _, _ = logistic_regression_path(
+                X, y, pos_class=encoded_label, Cs=[C_], solver=solver,
+                fit_intercept=self.fit_intercept, coef=coef_init,
+                max_iter=self.max_iter, tol=self.tol, penalty=self.penalty,
+                multi_class=multi_class, verbose=max(0, self.verbose - 1),
+                random_state=self.random_state, check_input=False)
+            w = w[0]
+
+        else:
+            # Take the best scores across every fold and the average of
+            # all coefficients corresponding to the best scores.
+            best_indices = np.argmax(scores, axis=1)
+            if multi_class == 'ovr':
+                w = np.mean([coefs_paths[i, best_indices[i], :]
+                             for i in range(len(folds))], axis=0)
+            else:
+                w = np.mean([coefs_paths[:, i, best_indices[i], :]
+                             for i in range(len(folds))], axis=0)
+            self.C_.append(np.mean(self.Cs_[best_indices]))
+            self.l1_ratio_.append(None)
+
+        if multi_class == 'multinomial':
+            self.C_ = np.tile(self.C_, n_classes)
+            self.l1_ratio_ = np.tile(self.l1_ratio_, n_classes)
+            self.coef_ = w[:, :X.shape[1]]
+            if self.fit_intercept:
+                self.intercept_ = w[:, -1]
+        else:
+            self.coef_[index] = w[: X.shape[1]]
+            if self.fit_intercept:
+                self.intercept_[index] = w[-1]
+
+    self.C_ = np.asarray(self.C_)
+    self.l1_ratio_ = np.asarray(self.l1_ratio_)
+    self.l1_ratios_ = np.asarray([None])
+    return self
+
+
+class LogisticRegressionCV(LogisticRegressionCV_original):
+    __doc__ = LogisticRegressionCV_original.__doc__
+
+    def fit(self, X, y, sample_weight=None, **params):
+        daal_ready = self.solver in ['lbfgs', 'newton-cg'] and \
+            self.penalty == 'l2' and self.l1_ratios is None and \
+            not sparse.issparse(X) and sample_weight is None and \
+            self.class_weight is None and not params
+        if not daal_ready:
+            logging.info(
+                "sklearn.linear_model.LogisticRegressionCV."
+                "fit: " + get_patch_message("sklearn"))
+            return super().fit(X, y, sample_weight=sample_weight, **params)
+
+        logging.info(
+            "sklearn.linear_model.LogisticRegressionCV."
+            "fit: " + get_patch_message("daal"))
+        return _daal4py_fit_cv(self, X, y)
@@ -182,3 +182,77 @@ def test_linear_array_vs_dataframe_heterogen_float_int():
     assert_array_almost_equal(
         array_reg.predict(x_test).reshape((-1, 1)),
         df_reg.predict(df_x_test).reshape((-1, 1)))
+
+
+def weighted_ridge_solution(x, y, sample_weight, alpha):
+    weights = sample_weight / sample_weight.sum()
+    x_offset, y_offset = weights @ x, weights @ y
+    x_scaled = (x - x_offset) * np.sqrt(sample_weight)[:, np.newaxis]
+    y_scaled = (y - y_offset) * np.sqrt(sample_weight)
+    coef = np.linalg.solve(x_scaled.T @ x_scaled + alpha * np.eye(x.shape[1]),
+                           x_scaled.T @ y_scaled)
+    return coef, y_offset - x_offset @ coef
+
+
+@pytest.mark.parametrize('alpha', [0.0, 10.0])
+def test_sample_weight(alpha):
+    from daal4py.sklearn.linear_model import LinearRegression, Ridge
+
+    rng = np.random.RandomState(0)
+    x, y = make_regression(500, 10, noise=10.0, random_state=0)
+    sample_weight = rng.uniform(0, 5, size=500)
+    coef, intercept = weighted_ridge_solution(x, y, sample_weight, alpha)
+
+    if alpha == 0:
+        reg = LinearRegression().fit(x, y, sample_weight=sample_weight)
+    else:
+        reg = Ridge(alpha=alpha).fit(x, y, sample_weight=sample_weight)
+
+    assert_array_almost_equal(reg.coef_, coef)
+    assert_array_almost_equal(reg.intercept_, intercept)
+    assert_array_almost_equal(reg.predict(x), x @ coef + intercept)
+
+
+@pytest.mark.parametrize('n_targets', [1, 2])
+def test_partial_fit(n_targets):
+    import pickle
+    from daal4py.sklearn.linear_model import LinearRegression
+
+    x, y = make_regression(1000, 10, n_targets=n_targets, noise=10.0, random_state=0)
+    reg = LinearRegression()
+    for batch in np.array_split(np.arange(1000), 4):
+        reg.partial_fit(x[batch], y[batch])
+    expected = LinearRegression().fit(x, y)
+
+    assert_array_almost_equal(reg.coef_, expected.coef_)
+    assert_array_almost_equal(reg.intercept_, expected.intercept_)
+    assert_array_almost_equal(reg.predict(x), expected.predict(x))
+    assert reg.rank_ == expected.rank_
+    assert reg.singular_.shape == expected.singular_.shape
+
+    # the coefficients are updated by further chunks
+    reg.partial_fit(x, y)
+    assert_array_almost_equal(reg.coef_, expected.coef_)
+
+    unpickled = pickle.loads(pickle.dumps(reg))
+    assert_array_almost_equal(unpickled.predict(x), expected.predict(x))
+    with pytest.raises(ValueError):
+        unpickled.partial_fit(x, y)
+
+
+def test_partial_fit_collinear():
+    from sklearn.utils.validation import check_is_fitted
+    from daal4py.sklearn.linear_model import LinearRegression
+
+    x, y = make_regression(1000, 5, noise=10.0, random_state=0)
+    # a feature that is zero in every chunk makes the system exactly singular
+    x = np.hstack([x, np.zeros((1000, 1))])
+    reg = LinearRegression()
+    for batch in np.array_split(np.arange(1000), 4):
+        reg.partial_fit(x[batch], y[batch])
+
+    # the singular system is reported by predict, not by attribute lookup
+    check_is_fitted(reg)
+    assert not hasattr(reg, 'coef_')
+    with pytest.raises(ValueError, match='linearly dependent'):
+        reg.predict(x)
@@ -0,0 +1,131 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from scipy.special import expit, logsumexp
+from sklearn.datasets import load_iris
+from sklearn.linear_model import LogisticRegressionCV as LogisticRegressionCV_sklearn
+from sklearn.utils._testing import assert_array_almost_equal
+from daal4py.sklearn.linear_model import LogisticRegression, LogisticRegressionCV
+from daal4py.sklearn.linear_model import logistic_loss
+
+
+def test_logistic_predict_follows_coef_changes():
+    X, y = load_iris(return_X_y=True)
+    clf = LogisticRegression(max_iter=1000).fit(X, y)
+    proba = clf.predict_proba(X)
+    assert_array_almost_equal(proba, clf.predict_proba(X))
+
+    # in-place changes of the coefficients must invalidate the cached model
+    clf.coef_[:] = 0
+    clf.intercept_[:] = 0
+    assert_array_almost_equal(
+        clf.predict_proba(X), np.full_like(proba, 1. / 3))
+
+    clf.fit(X, y)
+    assert_array_almost_equal(proba, clf.predict_proba(X))
+
+    restored = pickle.loads(pickle.dumps(clf))
+    assert_array_almost_equal(proba, restored.predict_proba(X))
+
+
+def test_logistic_concurrent_predict():
+    X, y = load_iris(return_X_y=True)
+    clf = LogisticRegression(max_iter=1000).fit(X, y)
+    batches = [X[i::8] for i in range(8)]
+    expected = [clf.predict_proba(batch) for batch in batches]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(clf.predict_proba, batches * 4))
+    for result, proba in zip(results, expected * 4):
+        assert_array_almost_equal(result, proba)
+
+
+def _finite_difference(grad, w, v, eps=1e-6):
+    return (grad(w + eps * v) - grad(w - eps * v)) / (2 * eps)
+
+
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_hessp_matches_gradient(dtype):
+    rng = np.random.RandomState(0)
+    n_samples, n_features, n_classes, l2 = 200, 5, 3, 0.7
+    X = rng.randn(n_samples, n_features)
+    y_bin = rng.randint(0, 2, n_samples)
+    y_multi = rng.randint(0, n_classes, n_samples)
+
+    def logistic_grad(w):
+        residuals = expit(w[0] + X @ w[1:]) - y_bin
+        return np.r_[residuals.sum(), X.T @ residuals + 2 * l2 * w[1:]]
+
+    def cross_entropy_grad(w):
+        w = w.reshape((n_classes, -1))
+        z = w[:, 0] + X @ w[:, 1:].T
+        residuals = np.exp(z - logsumexp(z, axis=1, keepdims=True))
+        residuals[np.arange(n_samples), y_multi] -= 1
+        grad = np.c_[residuals.sum(axis=0), residuals.T @ X + 2 * l2 * w[:, 1:]]
+        return grad.ravel()
+
+    # the products are computed in the dtype of X
+    tol = 1e-6 if dtype == np.float64 else 1e-4
+    w, v = rng.randn(n_features + 1), rng.randn(n_features + 1)
+    hessp = logistic_loss._logistic_hessp(X.astype(dtype), w[:, np.newaxis], l2)
+    np.testing.assert_allclose(hessp(v), _finite_difference(logistic_grad, w, v),
+                               rtol=tol, atol=tol)
+
+    w = rng.randn(n_classes * (n_features + 1))
+    v = rng.randn(n_classes * (n_features + 1))
+    hessp = logistic_loss._cross_entropy_hessp(X.astype(dtype), w[:, np.newaxis], l2)
+    np.testing.assert_allclose(hessp(v), _finite_difference(cross_entropy_grad, w, v),
+                               rtol=tol, atol=tol)
+
+
+@pytest.mark.parametrize('solver', ['lbfgs', 'newton-cg'])
+def test_logistic_cv_threads_match_sequential(solver):
+    X, y = load_iris(return_X_y=True)
+    params = dict(Cs=5, cv=3, solver=solver, max_iter=1000, tol=1e-8)
+    sequential = LogisticRegressionCV(n_jobs=1, **params).fit(X, y)
+    threaded = LogisticRegressionCV(n_jobs=3, **params).fit(X, y)
+    assert_array_almost_equal(sequential.C_, threaded.C_)
+    assert_array_almost_equal(sequential.coef_, threaded.coef_)
+    assert_array_almost_equal(sequential.predict_proba(X), threaded.predict_proba(X))
+    for label, scores in sequential.scores_.items():
+        assert_array_almost_equal(scores, threaded.scores_[label])
+
+    reference = LogisticRegressionCV_sklearn(n_jobs=1, **params).fit(X, y)
+    assert_array_almost_equal(reference.C_, threaded.C_)
+    assert_array_almost_equal(
+        reference.predict_proba(X), threaded.predict_proba(X), decimal=3)
+
+
+@pytest.mark.parametrize('refit', [True, False])
+def test_logistic_cv_leaves_sklearn_untouched(monkeypatch, refit):
+    import sklearn.linear_model._logistic as logistic_module
+
+    def fail(*args, **kwargs):
+        raise AssertionError('scikit-learn path used by the daal4py fit')
+
+    # the folds and the refit run the daal4py path without patching
+    # scikit-learn, stock estimators fitted meanwhile are not affected
+    monkeypatch.setattr(logistic_module, '_log_reg_scoring_path', fail)
+    monkeypatch.setattr(logistic_module, '_logistic_regression_path', fail)
+    X, y = load_iris(return_X_y=True)
+    clf = LogisticRegressionCV(Cs=3, cv=3, refit=refit, max_iter=1000).fit(X, y)
+    assert clf.coef_.shape == (3, X.shape[1])
+    assert logistic_module._log_reg_scoring_path is fail
+    assert logistic_module._logistic_regression_path is fail
@@ -0,0 +1,81 @@
+#===============================================================================
+# Copyright 2020-2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+import numpy as np
+import pytest
+from sklearn.datasets import make_regression
+from sklearn.linear_model._ridge import Ridge as Ridge_original
+from sklearn.linear_model._ridge import RidgeCV as RidgeCV_original
+from daal4py.sklearn.linear_model import RidgeCV, ridge_path
+
+
+ALPHAS = np.logspace(-2, 4, 20)
+
+
+@pytest.mark.parametrize('fit_intercept', [True, False])
+@pytest.mark.parametrize('n_targets', [1, 3])
+def test_ridge_path(fit_intercept, n_targets):
+    X, y = make_regression(1000, 15, n_targets=n_targets, noise=30.0, random_state=0)
+    coefs, intercepts = ridge_path(X, y, ALPHAS, fit_intercept=fit_intercept)
+
+    for coef, intercept, alpha in zip(coefs, intercepts, ALPHAS):
+        expected = Ridge_original(alpha=alpha, fit_intercept=fit_intercept).fit(X, y)
+        np.testing.assert_allclose(coef, expected.coef_, rtol=1e-7, atol=1e-10)
+        np.testing.assert_allclose(intercept, expected.intercept_, atol=1e-8)
+
+
+def test_ridge_path_float32():
+    X, y = make_regression(20000, 15, noise=30.0, random_state=0)
+    # large offsets make float32 accumulation of X^T y lose the signal
+    X, y = X + 100, y + 1000
+    coefs, intercepts = ridge_path(X.astype(np.float32), y.astype(np.float32),
+                                   ALPHAS)
+    expected_coefs, expected_intercepts = ridge_path(
+        X.astype(np.float32).astype(np.float64),
+        y.astype(np.float32).astype(np.float64), ALPHAS)
+
+    assert coefs.dtype == np.float32
+    np.testing.assert_allclose(coefs, expected_coefs, rtol=1e-3, atol=1e-3)
+    np.testing.assert_allclose(intercepts, expected_intercepts, rtol=1e-4)
+
+
+@pytest.mark.parametrize('fit_intercept', [True, False])
+@pytest.mark.parametrize('alpha_per_target', [False, True])
+def test_ridge_cv_matches_gcv(fit_intercept, alpha_per_target):
+    X, y = make_regression(1000, 15, n_targets=3, noise=30.0, random_state=0)
+    params = {'alphas': ALPHAS, 'fit_intercept': fit_intercept,
+              'alpha_per_target': alpha_per_target}
+    ridge = RidgeCV(**params).fit(X, y)
+    expected = RidgeCV_original(**params).fit(X, y)
+
+    np.testing.assert_allclose(ridge.alpha_, expected.alpha_)
+    np.testing.assert_allclose(ridge.best_score_, expected.best_score_, rtol=1e-7)
+    np.testing.assert_allclose(ridge.coef_, expected.coef_, rtol=1e-7, atol=1e-10)
+    np.testing.assert_allclose(ridge.intercept_, expected.intercept_, atol=1e-8)
+
+
+def test_ridge_partial_fit():
+    from daal4py.sklearn.linear_model import Ridge
+
+    X, y = make_regression(1000, 15, noise=30.0, random_state=0)
+    ridge = Ridge(alpha=10.0)
+    for batch in np.array_split(np.arange(1000), 4):
+        ridge.partial_fit(X[batch], y[batch])
+    expected = Ridge_original(alpha=10.0).fit(X, y)
+
+    np.testing.assert_allclose(ridge.coef_, expected.coef_, rtol=1e-7)
+    np.testing.assert_allclose(ridge.intercept_, expected.intercept_, atol=1e-8)
+    np.testing.assert_allclose(ridge.predict(X), expected.predict(X), rtol=1e-7)
@@ -14,7 +14,8 @@
 # limitations under the License.
 #===============================================================================
 
-from daal4py.sklearn._utils import daal_check_version, set_idp_sklearn_verbose
+from daal4py.sklearn._utils import (
+    daal_check_version, set_idp_sklearn_verbose, sklearn_check_version)
 from ..neighbors import KNeighborsRegressor as KNeighborsRegressor_daal4py
 from ..neighbors import NearestNeighbors as NearestNeighbors_daal4py
 from ..neighbors import KNeighborsClassifier as KNeighborsClassifier_daal4py
@@ -27,14 +28,21 @@ from ..metrics import _daal_roc_auc_score
 from ..metrics import daal_pairwise_distances
 from ..cluster.k_means import KMeans as KMeans_daal4py
 from ..cluster.dbscan import DBSCAN as DBSCAN_daal4py
+if sklearn_check_version('0.23'):
+    from ..cluster.k_means import MiniBatchKMeans as MiniBatchKMeans_daal4py
 from ..linear_model.coordinate_descent import Lasso as Lasso_daal4py
 from ..linear_model.coordinate_descent import ElasticNet as ElasticNet_daal4py
 from ..linear_model.linear import LinearRegression as LinearRegression_daal4py
 from ..linear_model.ridge import Ridge as Ridge_daal4py
+from ..linear_model.ridge import RidgeCV as RidgeCV_daal4py
 from ..linear_model.logistic_path import LogisticRegression as LogisticRegression_daal4py
+from ..linear_model.logistic_path import LogisticRegressionCV as \
+    LogisticRegressionCV_daal4py
 from ..linear_model.logistic_path import logistic_regression_path as \
     daal_optimized_logistic_path
 from ..decomposition._pca import PCA as PCA_daal4py
+from ..decomposition._incremental_pca import IncrementalPCA as \
+    IncrementalPCA_daal4py
 from ..manifold import TSNE as TSNE_daal4py
 from sklearn import model_selection
 from sklearn import metrics
@@ -60,12 +68,15 @@ import warnings
 def _get_map_of_algorithms():
     mapping = {
         'pca': [[(decomposition_module, 'PCA', PCA_daal4py), None]],
+        'incremental_pca': [[(decomposition_module, 'IncrementalPCA',
+                              IncrementalPCA_daal4py), None]],
         'kmeans': [[(cluster_module, 'KMeans', KMeans_daal4py), None]],
         'dbscan': [[(cluster_module, 'DBSCAN', DBSCAN_daal4py), None]],
         'distances': [[(metrics, 'pairwise_distances', daal_pairwise_distances), None]],
         'linear': [[(linear_model_module, 'LinearRegression',
                      LinearRegression_daal4py), None]],
         'ridge': [[(linear_model_module, 'Ridge', Ridge_daal4py), None]],
+        'ridge_cv': [[(linear_model_module, 'RidgeCV', RidgeCV_daal4py), None]],
         'elasticnet': [[(linear_model_module, 'ElasticNet', ElasticNet_daal4py), None]],
         'lasso': [[(linear_model_module, 'Lasso', Lasso_daal4py), None]],
         'svm': [[(svm_module, 'SVC', SVC_daal4py), None]],
@@ -73,6 +84,8 @@ def _get_map_of_algorithms():
                        daal_optimized_logistic_path), None]],
         'log_reg': [[(linear_model_module, 'LogisticRegression',
                     LogisticRegression_daal4py), None]],
+        'log_reg_cv': [[(linear_model_module, 'LogisticRegressionCV',
+                       LogisticRegressionCV_daal4py), None]],
         'knn_classifier': [[(neighbors_module, 'KNeighborsClassifier',
                              KNeighborsClassifier_daal4py), None]],
         'nearest_neighbors': [[(neighbors_module, 'NearestNeighbors',
@@ -92,12 +105,20 @@ def _get_map_of_algorithms():
         'tsne': [[(manifold_module, 'TSNE', TSNE_daal4py), None]],
     }
     mapping['svc'] = mapping['svm']
+    mapping['incrementalpca'] = mapping['incremental_pca']
+    mapping['ridgecv'] = mapping['ridge_cv']
     mapping['logisticregression'] = mapping['log_reg']
+    mapping['logisticregressioncv'] = mapping['log_reg_cv']
     mapping['kneighborsclassifier'] = mapping['knn_classifier']
     mapping['nearestneighbors'] = mapping['nearest_neighbors']
     mapping['kneighborsregressor'] = mapping['knn_regressor']
     mapping['randomrorestclassifier'] = mapping['random_forest_classifier']
     mapping['randomforestregressor'] = mapping['random_forest_regressor']
+
+    if sklearn_check_version('0.23'):
+        mapping['minibatch_kmeans'] = [[(cluster_module, 'MiniBatchKMeans',
+                                         MiniBatchKMeans_daal4py), None]]
+        mapping['minibatchkmeans'] = mapping['minibatch_kmeans']
     return mapping
 
 
@@ -24,12 +24,18 @@ from .._utils import (
     getFPType,
     sklearn_check_version,
     get_patch_message)
+from sklearn.utils import gen_batches, get_chunk_n_rows
 from sklearn.utils.validation import check_array, check_is_fitted, check_X_y
 from sklearn.utils.multiclass import check_classification_targets
 from sklearn.base import is_classifier, is_regressor
 import logging
 import warnings
 
+try:
+    from sklearn.utils._joblib import Parallel, delayed, effective_n_jobs
+except ImportError:
+    from sklearn.externals.joblib import Parallel, delayed, effective_n_jobs
+
 if sklearn_check_version("0.22"):
     from sklearn.neighbors._base import KNeighborsMixin as BaseKNeighborsMixin
     from sklearn.neighbors._base import RadiusNeighborsMixin as BaseRadiusNeighborsMixin
@@ -160,8 +166,6 @@ def daal4py_kneighbors(estimator, X=None, n_neighbors=None,
             (n_samples_fit, n_neighbors)
         )
 
-    chunked_results = None
-
     try:
         fptype = getFPType(X)
     except ValueError:
@@ -183,29 +187,49 @@ def daal4py_kneighbors(estimator, X=None, n_neighbors=None,
     method = parse_auto_method(
         estimator, estimator._fit_method, estimator.n_samples_fit_, n_features)
 
-    predict_alg = prediction_algorithm(method, fptype, params)
-    prediction_result = predict_alg.compute(X, estimator._daal_model)
+    def compute_batch(X_batch):
+        # oneDAL algorithm objects are stateful, so every batch gets its own
+        predict_alg = prediction_algorithm(method, fptype, params)
+        prediction_result = predict_alg.compute(X_batch, estimator._daal_model)
 
-    distances = prediction_result.distances
-    indices = prediction_result.indices
+        distances = prediction_result.distances
+        indices = prediction_result.indices
 
-    if method == 'kd_tree':
-        for i in range(distances.shape[0]):
-            seq = distances[i].argsort()
-            indices[i] = indices[i][seq]
-            distances[i] = distances[i][seq]
+        if method == 'kd_tree':
+            # kd_tree returns neighbors unordered, sort all rows at once
+            seq = np.argsort(distances, axis=1)
+            distances = np.take_along_axis(distances, seq, axis=1)
+            indices = np.take_along_axis(indices, seq, axis=1)
 
-    if return_distance:
-        results = distances, indices.astype(int)
+        return distances, indices
+
+    # Split the queries into batches whose outputs fit into sklearn's
+    # working_memory, taking into account that n_jobs batches are in flight
+    n_queries = X.shape[0]
+    row_bytes = n_neighbors * (X.dtype.itemsize + np.dtype(np.intp).itemsize)
+    chunk_n_rows = get_chunk_n_rows(row_bytes, max_n_rows=n_queries)
+
+    if chunk_n_rows >= n_queries:
+        distances, indices = compute_batch(X)
+        indices = indices.astype(int)
     else:
-        results = indices.astype(int)
+        n_jobs = effective_n_jobs(getattr(estimator, 'n_jobs', None))
+        chunk_n_rows = max(1, chunk_n_rows // n_jobs)
 
-    if chunked_results is not None:
-        if return_distance:
-            neigh_dist, neigh_ind = zip(*chunked_results)
-            results = np.vstack(neigh_dist), np.vstack(neigh_ind)
-        else:
-            results = np.vstack(chunked_results)
+        distances = np.empty((n_queries, n_neighbors), dtype=X.dtype)
+        indices = np.empty((n_queries, n_neighbors), dtype=int)
+
+        def fill_batch(batch):
+            distances[batch], indices[batch] = compute_batch(X[batch])
+
+        Parallel(n_jobs=n_jobs, backend='threading')(
+            delayed(fill_batch)(batch)
+            for batch in gen_batches(n_queries, chunk_n_rows))
+
+    if return_distance:
+        results = distances, indices
+    else:
+        results = indices
 
     if not query_is_train:
         return results
@@ -15,10 +15,14 @@
 #===============================================================================
 
 import pytest
+import numpy as np
+from sklearn import config_context
 from sklearn.neighbors \
     import KNeighborsClassifier as ScikitKNeighborsClassifier
 from daal4py.sklearn.neighbors \
     import KNeighborsClassifier as DaalKNeighborsClassifier
+from daal4py.sklearn.neighbors \
+    import NearestNeighbors as DaalNearestNeighbors
 from sklearn.datasets import load_iris
 from sklearn.metrics import (accuracy_score, log_loss, roc_auc_score)
 from sklearn.model_selection import train_test_split
@@ -103,3 +107,21 @@ def _test_determenistic(distance, algorithm, weight, k):
 @pytest.mark.parametrize('k', KS)
 def test_determenistic(distance, algorithm, weight, k):
     _test_determenistic(distance, algorithm, weight, k)
+
+
+@pytest.mark.parametrize('algorithm', ['brute', 'kd_tree'])
+@pytest.mark.parametrize('n_jobs', [None, 2])
+def test_kneighbors_chunked(algorithm, n_jobs):
+    rng = np.random.RandomState(0)
+    x_train = rng.rand(200, 5)
+    x_test = rng.rand(1000, 5)
+
+    model = DaalNearestNeighbors(n_neighbors=7, algorithm=algorithm,
+                                 n_jobs=n_jobs).fit(x_train)
+    distances, indices = model.kneighbors(x_test)
+    # 0.01 MiB of working memory leaves room for ~90 query rows per batch
+    with config_context(working_memory=0.01):
+        chunked_distances, chunked_indices = model.kneighbors(x_test)
+
+    np.testing.assert_allclose(chunked_distances, distances)
+    np.testing.assert_array_equal(chunked_indices, indices)
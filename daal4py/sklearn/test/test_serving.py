@@ -0,0 +1,93 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from numpy.testing import assert_allclose, assert_array_equal
+from daal4py.sklearn import ServingPredictor
+from daal4py.sklearn.ensemble import (RandomForestClassifier, RandomForestRegressor,
+                                      GBTDAALClassifier, GBTDAALRegressor)
+from daal4py.sklearn.linear_model import LinearRegression, LogisticRegression, Ridge
+from daal4py.sklearn.neighbors import KNeighborsClassifier
+from daal4py.sklearn.svm import SVC
+from sklearn.datasets import make_classification
+
+X, Y = make_classification(n_samples=300, n_features=6, n_informative=4,
+                           n_classes=3, random_state=777)
+
+ESTIMATORS = [
+    (RandomForestClassifier(n_estimators=10, random_state=777), 'predict'),
+    (RandomForestRegressor(n_estimators=10, random_state=777), 'predict'),
+    (GBTDAALClassifier(max_iterations=10), 'predict'),
+    (GBTDAALClassifier(max_iterations=10), 'predict_proba'),
+    (GBTDAALRegressor(max_iterations=10), 'predict'),
+    (SVC(), 'predict'),
+    (KNeighborsClassifier(n_neighbors=5), 'predict'),
+    (LinearRegression(), 'predict'),
+    (Ridge(), 'predict'),
+    (LogisticRegression(multi_class='multinomial', max_iter=1000), 'predict'),
+    (LogisticRegression(multi_class='multinomial', max_iter=1000),
+     'predict_proba'),
+]
+
+
+@pytest.mark.parametrize('estimator,method', ESTIMATORS)
+def test_serving_matches_estimator(estimator, method):
+    estimator.fit(X, Y)
+    expected = getattr(estimator, method)(X)
+
+    predictor = ServingPredictor(estimator, method)
+    assert_allclose(predictor.predict_batch(X), expected, rtol=1e-5)
+    for i in range(5):
+        assert_array_equal(np.asarray(predictor.predict_one(list(X[i]))),
+                           np.asarray(predictor.predict_batch(X[i:i + 1])[0]))
+
+
+@pytest.mark.parametrize('estimator', [LinearRegression(), Ridge(),
+                                       LinearRegression(fit_intercept=False)])
+def test_serving_weighted_linear(estimator):
+    sample_weight = np.random.RandomState(0).uniform(0, 5, size=X.shape[0])
+    estimator.fit(X, Y, sample_weight=sample_weight)
+    expected = X @ estimator.coef_ + estimator.intercept_
+
+    assert hasattr(estimator, 'daal_model_')
+    assert_allclose(estimator.predict(X), expected, rtol=1e-7)
+    predictor = ServingPredictor(estimator)
+    assert_allclose(predictor.predict_batch(X), expected, rtol=1e-7)
+
+
+@pytest.mark.parametrize('estimator', [LinearRegression(), Ridge()])
+def test_serving_linear_float32(estimator):
+    estimator.fit(X, Y)
+    predictor = ServingPredictor(estimator, dtype=np.float32)
+    assert_allclose(predictor.predict_batch(X), estimator.predict(X), rtol=1e-4)
+
+
+def test_serving_from_threads():
+    estimator = RandomForestClassifier(n_estimators=10, random_state=777).fit(X, Y)
+    predictor = ServingPredictor(estimator, 'predict')
+    expected = estimator.predict(X)
+    batches = [X[i:i + 30] for i in range(0, X.shape[0], 30)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(predictor.predict_batch, batches * 4))
+    assert_array_equal(np.concatenate(results), np.concatenate([expected] * 4))
+
+
+def test_serving_rejects_wrong_shape():
+    predictor = ServingPredictor(LinearRegression().fit(X, Y))
+    with pytest.raises(ValueError):
+        predictor.predict_batch(X[:, :3])
@@ -56,8 +56,8 @@ def read_next(file, chunksize, readcsv=read_csv):
 
 
 if __name__ == "__main__":
-    # get the generator
-    rn = read_next("./data/batch/svd.csv", 112)
+    # get the generator, d4p.csv_stream reads the file only once
+    rn = d4p.csv_stream("./data/batch/svd.csv", 112)
 
     # creat an SVD algo object
     algo = d4p.svd(streaming=True)
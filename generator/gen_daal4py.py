@@ -1079,6 +1079,10 @@ def gen_daal4py(daalroot, outdir, version, warn_all=False,
     if 'algorithms::tree_utils' in iface.namespace_dict:
         with open(jp('src', 'gettree.pyx'), 'r') as f:
             pyx_gettree = f.read()
+    with open(jp('src', 'kmeans_weighted.pyx'), 'r') as f:
+        pyx_kmeans_weighted = f.read()
+    with open(jp('src', 'linear_model_builder.pyx'), 'r') as f:
+        pyx_linear_model_builder = f.read()
 
     with open(jp(outdir, 'daal4py_cy.pyx'), 'w') as f:
         f.write(pyx_file)
@@ -1086,3 +1090,5 @@ def gen_daal4py(daalroot, outdir, version, warn_all=False,
         f.write(pyx_gbt_model_builder)
         f.write(pyx_log_reg_model_builder)
         f.write(pyx_gbt_generators)
+        f.write(pyx_kmeans_weighted)
+        f.write(pyx_linear_model_builder)
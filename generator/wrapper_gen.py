@@ -260,6 +260,47 @@ def daal_generate_shuffled_indices(idx, random_state):
     c_generate_shuffled_indices(data_or_file(<PyObject*>idx),
                                 data_or_file(<PyObject*>random_state))
 
+
+cdef extern from "daal4py.h":
+    cdef cppclass CSVStream:
+        CSVStream(std_string fname, size_t chunkRows) except +
+        NumericTablePtr next() nogil except +
+
+
+cdef class csv_stream:
+    """
+    Iterator reading a CSV file in chunks of rows. Each chunk is a numpy array
+    which can be passed to compute of an algorithm created with streaming=True.
+    The file is read once, chunks share no memory with each other.
+
+    :param str path: path to the CSV file
+    :param size_t chunk_rows: number of rows in each chunk, the last one can be smaller
+    :param dtype: np.float64 or np.float32, float32 chunks are converted after reading
+    """
+    cdef CSVStream * c_ptr
+    cdef object dtype
+
+    def __cinit__(self, path, size_t chunk_rows, dtype=np.float64):
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float64, np.float32):
+            raise ValueError('dtype must be np.float64 or np.float32')
+        path = str(path)
+        self.c_ptr = new CSVStream(to_std_string(<PyObject *>path), chunk_rows)
+
+    def __dealloc__(self):
+        del self.c_ptr
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef NumericTablePtr table
+        with nogil:
+            table = self.c_ptr.next()
+        if not is_valid_ptrptr(&table):
+            raise StopIteration
+        return (<object>make_nda(&table)).astype(self.dtype, copy=False)
+
 def _execute_with_context(func):
     def exec_func(*args, **keyArgs):
         # we check is DPPY imported or not
@@ -1220,8 +1261,9 @@ hpat_spec.append({
 # requires {{algos}}    list of algorithms that are available
 #          {{version}}  version of DAAL
 pyx_footer_template = '''
-def getTreeState(model, i=0, n_classes=1):
+def getTreeState(model, size_t i=0, size_t n_classes=1):
     cdef TreeState cTreeState
+    # the tree traversal only reads the model, trees can be converted in parallel threads
     if False:
         pass
 {% for model in ['algorithms::decision_forest::classification',
@@ -1229,14 +1271,16 @@ def getTreeState(model, i=0, n_classes=1):
 {% if model in algos %}
 {% set flatname = '::'.join([model, 'model'])|flat %}
     elif isinstance(model, {{flatname}}):
-        cTreeState = _getTreeState((<{{flatname}}>model).c_ptr, i, n_classes)
+        with nogil:
+            cTreeState = _getTreeState((<{{flatname}}>model).c_ptr, i, n_classes)
 {% endif %}
 {% endfor %}
 {% for model in ['algorithms::decision_tree::classification'] %}
 {% if model in algos %}
 {% set flatname = '::'.join([model, 'model'])|flat %}
     elif isinstance(model, {{flatname}}):
-        cTreeState = _getTreeState((<{{flatname}}>model).c_ptr, n_classes)
+        with nogil:
+            cTreeState = _getTreeState((<{{flatname}}>model).c_ptr, n_classes)
 {% endif %}
 {% endfor %}
 {% for model in ['algorithms::decision_forest::regression',
@@ -1244,14 +1288,16 @@ def getTreeState(model, i=0, n_classes=1):
 {% if model in algos %}
 {% set flatname = '::'.join([model, 'model'])|flat %}
     elif isinstance(model, {{flatname}}):
-        cTreeState = _getTreeState((<{{flatname}}>model).c_ptr, i, 1)
+        with nogil:
+            cTreeState = _getTreeState((<{{flatname}}>model).c_ptr, i, 1)
 {% endif %}
 {% endfor %}
 {% for model in ['algorithms::decision_tree::regression'] %}
 {% if model in algos %}
 {% set flatname = '::'.join([model, 'model'])|flat %}
     elif isinstance(model, {{flatname}}):
-        cTreeState = _getTreeState((<{{flatname}}>model).c_ptr, 1)
+        with nogil:
+            cTreeState = _getTreeState((<{{flatname}}>model).c_ptr, 1)
 {% endif %}
 {% endfor %}
     else:
@@ -84,6 +84,57 @@ inline dal::homogen_table convert_to_homogen_impl(PyArrayObject *np_data) {
     return res_table;
 }
 
+template <typename Index>
+inline dal::array<std::int64_t> make_one_based_impl(const Index *indices, std::int64_t count) {
+    auto one_based = dal::array<std::int64_t>::empty(count);
+    auto one_based_data = one_based.get_mutable_data();
+    for (std::int64_t i = 0; i < count; ++i)
+        one_based_data[i] = static_cast<std::int64_t>(indices[i]) + 1;
+    return one_based;
+}
+
+#define SET_NPY_INDEX(_T, _FUNCT, _EXCEPTION) \
+    switch (_T) {                             \
+        case NPY_INT32: {                     \
+            _FUNCT(std::int32_t);             \
+            break;                            \
+        }                                     \
+        case NPY_INT64: {                     \
+            _FUNCT(std::int64_t);             \
+            break;                            \
+        }                                     \
+        default: _EXCEPTION;                  \
+    };
+
+// oneDAL CSR tables are one-based, so scipy indices and indptr are copied
+// with an offset in a single pass that reads int32/int64 indices in place
+inline void get_one_based_csr_indices(PyArrayObject *np_column_indices,
+                                      PyArrayObject *np_row_indices,
+                                      dal::array<std::int64_t> &column_indices_one_based,
+                                      dal::array<std::int64_t> &row_indices_one_based) {
+    const std::int64_t column_indices_count =
+        static_cast<std::int64_t>(array_size(np_column_indices, 0));
+    const std::int64_t row_indices_count =
+        static_cast<std::int64_t>(array_size(np_row_indices, 0));
+
+#define MAKE_ONE_BASED(Index)                                                                 \
+    column_indices_one_based =                                                                \
+        make_one_based_impl(static_cast<const Index *>(array_data(np_column_indices)),       \
+                            column_indices_count);
+    SET_NPY_INDEX(array_type(np_column_indices),
+                  MAKE_ONE_BASED,
+                  throw std::invalid_argument("Found unsupported index type in csr_matrix"));
+#undef MAKE_ONE_BASED
+#define MAKE_ONE_BASED(Index)                                                                 \
+    row_indices_one_based =                                                                   \
+        make_one_based_impl(static_cast<const Index *>(array_data(np_row_indices)),          \
+                            row_indices_count);
+    SET_NPY_INDEX(array_type(np_row_indices),
+                  MAKE_ONE_BASED,
+                  throw std::invalid_argument("Found unsupported index type in csr_matrix"));
+#undef MAKE_ONE_BASED
+}
+
 template <typename T>
 inline dal::detail::csr_table convert_to_csr_impl(PyObject *py_data,
                                                   PyObject *py_column_indices,
@@ -94,26 +145,12 @@ inline dal::detail::csr_table convert_to_csr_impl(PyObject *py_data,
     PyArrayObject *np_column_indices = reinterpret_cast<PyArrayObject *>(py_column_indices);
     PyArrayObject *np_row_indices = reinterpret_cast<PyArrayObject *>(py_row_indices);
 
-    const std::int64_t *row_indices_zero_based =
-        static_cast<std::int64_t *>(array_data(np_row_indices));
-    const std::int64_t row_indices_count = static_cast<std::int64_t>(array_size(np_row_indices, 0));
-
-    auto row_indices_one_based = dal::array<std::int64_t>::empty(row_indices_count);
-    auto row_indices_one_based_data = row_indices_one_based.get_mutable_data();
-
-    for (std::int64_t i = 0; i < row_indices_count; ++i)
-        row_indices_one_based_data[i] = row_indices_zero_based[i] + 1;
-
-    const std::int64_t *column_indices_zero_based =
-        static_cast<std::int64_t *>(array_data(np_column_indices));
-    const std::int64_t column_indices_count =
-        static_cast<std::int64_t>(array_size(np_column_indices, 0));
-
-    auto column_indices_one_based = dal::array<std::int64_t>::empty(column_indices_count);
-    auto column_indices_one_based_data = column_indices_one_based.get_mutable_data();
-
-    for (std::int64_t i = 0; i < column_indices_count; ++i)
-        column_indices_one_based_data[i] = column_indices_zero_based[i] + 1;
+    dal::array<std::int64_t> column_indices_one_based;
+    dal::array<std::int64_t> row_indices_one_based;
+    get_one_based_csr_indices(np_column_indices,
+                              np_row_indices,
+                              column_indices_one_based,
+                              row_indices_one_based);
 
     const T *data_pointer = static_cast<T *>(array_data(np_data));
     const std::int64_t data_count = static_cast<std::int64_t>(array_size(np_data, 0));
@@ -158,18 +195,24 @@ dal::table convert_to_table(PyObject *obj) {
             throw std::invalid_argument("[convert_to_table] Got invalid csr_matrix object.");
         }
         PyObject *np_data = PyArray_FROMANY(py_data, array_type(py_data), 0, 0, NPY_ARRAY_CARRAY);
+        // int32 and int64 indices are read in place, anything else is cast once
+        const int column_indices_type = array_type(py_column_indices) == NPY_INT32
+                                            ? NPY_INT32
+                                            : NPY_INT64;
+        const int row_indices_type = array_type(py_row_indices) == NPY_INT32
+                                         ? NPY_INT32
+                                         : NPY_INT64;
         PyObject *np_column_indices =
             PyArray_FROMANY(py_column_indices,
-                            NPY_UINT64,
-                            0,
-                            0,
-                            NPY_ARRAY_CARRAY | NPY_ARRAY_ENSURECOPY | NPY_ARRAY_FORCECAST);
-        PyObject *np_row_indices =
-            PyArray_FROMANY(py_row_indices,
-                            NPY_UINT64,
+                            column_indices_type,
                             0,
                             0,
-                            NPY_ARRAY_CARRAY | NPY_ARRAY_ENSURECOPY | NPY_ARRAY_FORCECAST);
+                            NPY_ARRAY_CARRAY | NPY_ARRAY_FORCECAST);
+        PyObject *np_row_indices = PyArray_FROMANY(py_row_indices,
+                                                   row_indices_type,
+                                                   0,
+                                                   0,
+                                                   NPY_ARRAY_CARRAY | NPY_ARRAY_FORCECAST);
 
         PyObject *np_row_count = PyTuple_GetItem(py_shape, 0);
         PyObject *np_column_count = PyTuple_GetItem(py_shape, 1);
@@ -192,6 +235,11 @@ dal::table convert_to_table(PyObject *obj) {
                         MAKE_CSR_TABLE,
                         throw std::invalid_argument("Found unsupported data type in csr_matrix"));
 #undef MAKE_CSR_TABLE
+        Py_DECREF(np_column_indices);
+        Py_DECREF(np_row_indices);
+        Py_DECREF(py_column_indices);
+        Py_DECREF(py_row_indices);
+        Py_DECREF(py_shape);
     }
     else {
         throw std::invalid_argument(
@@ -149,3 +149,17 @@ def test_diabetes(kernel):
 
 #     assert_array_equal(clf.support_vectors_, sp_clf.support_vectors_.toarray())
 #     assert_array_equal(clf.dual_coef_, sp_clf.dual_coef_.toarray())
+
+
+@pytest.mark.parametrize('index_dtype', [np.int32, np.int64])
+def test_predict_with_csr_index_dtypes(index_dtype):
+    X, y = make_classification(n_samples=100, n_features=20, random_state=42)
+    X[X < 0.5] = 0
+    X[:, -1] = 0
+    X = sp.csr_matrix(X)
+    X.indices = X.indices.astype(index_dtype)
+    X.indptr = X.indptr.astype(index_dtype)
+
+    clf = SVC(kernel='rbf').fit(X, y)
+    expected = SVC(kernel='rbf').fit(X.toarray(), y).decision_function(X.toarray())
+    assert_array_almost_equal(expected, clf.decision_function(X))
@@ -15,7 +15,12 @@
 # limitations under the License.
 #===============================================================================
 
+from daal4py.sklearn._utils import sklearn_check_version
 from .k_means import KMeans
 from .dbscan import DBSCAN
 
 __all__ = ['KMeans', 'DBSCAN']
+
+if sklearn_check_version('0.23'):
+    from .k_means import MiniBatchKMeans
+    __all__ += ['MiniBatchKMeans']
@@ -15,4 +15,8 @@
 # limitations under the License.
 #===============================================================================
 
+from daal4py.sklearn._utils import sklearn_check_version
 from daal4py.sklearn.cluster import KMeans
+
+if sklearn_check_version('0.23'):
+    from daal4py.sklearn.cluster import MiniBatchKMeans
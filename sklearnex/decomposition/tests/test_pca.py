@@ -24,3 +24,10 @@ def test_sklearnex_import():
     X = np.array([[-1, -1], [-2, -1], [-3, -2], [1, 1]])
     pca = PCA(n_components=2, svd_solver='full').fit(X)
     assert 'daal4py' in pca.__module__
+
+
+def test_sklearnex_import_incremental_pca():
+    from sklearnex.decomposition import IncrementalPCA
+    X = np.array([[-1, -1], [-2, -1], [-3, -2], [1, 1], [2, 1], [3, 2]])
+    ipca = IncrementalPCA(n_components=2).fit(X)
+    assert 'daal4py' in ipca.__module__
@@ -16,14 +16,18 @@
 #===============================================================================
 
 from .linear import LinearRegression
-from .logistic_path import logistic_regression_path, LogisticRegression
-from .ridge import Ridge
+from .logistic_path import (logistic_regression_path, LogisticRegression,
+                            LogisticRegressionCV)
+from .ridge import Ridge, RidgeCV, ridge_path
 from .coordinate_descent import ElasticNet, Lasso
 
 __all__ = [
     'Ridge',
+    'RidgeCV',
+    'ridge_path',
     'LinearRegression',
     'LogisticRegression',
+    'LogisticRegressionCV',
     'logistic_regression_path',
     'ElasticNet',
     'Lasso'
@@ -15,4 +15,5 @@
 # limitations under the License.
 #===============================================================================
 
-from daal4py.sklearn.linear_model import logistic_regression_path, LogisticRegression
+from daal4py.sklearn.linear_model import (logistic_regression_path, LogisticRegression,
+                                          LogisticRegressionCV)
@@ -40,6 +40,14 @@ def test_sklearnex_import_ridge():
     assert_allclose(ridgereg.coef_, [0.8, 1.4])
 
 
+def test_sklearnex_import_ridge_cv():
+    from sklearnex.linear_model import RidgeCV
+    X, y = make_regression(n_features=2, random_state=0)
+    ridgecv = RidgeCV(alphas=[0.1, 1.0, 10.0]).fit(X, y)
+    assert 'daal4py' in ridgecv.__module__
+    assert ridgecv.alpha_ in [0.1, 1.0, 10.0]
+
+
 def test_sklearnex_import_lasso():
     from sklearnex.linear_model import Lasso
     X = [[0, 0], [1, 1], [2, 2]]
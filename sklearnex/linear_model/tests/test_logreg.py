@@ -26,3 +26,11 @@ def test_sklearnex_import():
     logreg = LogisticRegression(random_state=0, max_iter=200).fit(X, y)
     assert 'daal4py' in logreg.__module__
     assert_allclose(logreg.score(X, y), 0.9733, atol=1e-3)
+
+
+def test_sklearnex_import_cv():
+    from sklearnex.linear_model import LogisticRegressionCV
+    X, y = load_iris(return_X_y=True)
+    logreg = LogisticRegressionCV(Cs=3, cv=3, max_iter=200, n_jobs=2).fit(X, y)
+    assert 'daal4py' in logreg.__module__
+    assert logreg.score(X, y) > 0.9
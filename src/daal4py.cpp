@@ -365,13 +365,46 @@ static daal::data_management::NumericTablePtr _make_npynt(PyObject * nda)
     return daal::data_management::NumericTablePtr(ptr);
 }
 
+template <typename Index>
+static daal::services::SharedPtr<size_t> _make_one_based(const Index * indices, size_t count)
+{
+    size_t * one_based = static_cast<size_t *>(daal::services::daal_malloc(count * sizeof(size_t)));
+    DAAL4PY_CHECK_MALLOC(one_based);
+    for (size_t i = 0; i < count; ++i) one_based[i] = static_cast<size_t>(indices[i]) + 1;
+    return daal::services::SharedPtr<size_t>(one_based, daal::services::ServiceDeleter());
+}
+
+#define SET_NPY_INDEX(_T, _FUNCT, _EXCEPTION) \
+    switch (_T)                               \
+    {                                         \
+    case NPY_INT32: _FUNCT(int32_t); break;   \
+    case NPY_INT64: _FUNCT(int64_t); break;   \
+    default: _EXCEPTION;                      \
+    };
+
+// oneDAL CSR tables are one-based, so scipy indices and indptr are copied with an
+// offset in a single pass that reads int32/int64 indices in place
+static void _get_one_based_csr_indices(PyObject * np_indcs, PyObject * np_roffs, daal::services::SharedPtr<size_t> & indcs_one_based,
+                                       daal::services::SharedPtr<size_t> & roffs_one_based)
+{
+    const size_t n_indcs = array_size(np_indcs, 0);
+    const size_t n_roffs = array_size(np_roffs, 0);
+
+#define MKONEBASED_(_T) indcs_one_based = _make_one_based(static_cast<const _T *>(array_data(np_indcs)), n_indcs)
+    SET_NPY_INDEX(array_type(np_indcs), MKONEBASED_, throw std::invalid_argument("Found unsupported index type in csr_matrix"));
+#undef MKONEBASED_
+#define MKONEBASED_(_T) roffs_one_based = _make_one_based(static_cast<const _T *>(array_data(np_roffs)), n_roffs)
+    SET_NPY_INDEX(array_type(np_roffs), MKONEBASED_, throw std::invalid_argument("Found unsupported index type in csr_matrix"));
+#undef MKONEBASED_
+}
+
 // Try to convert given object to oneDAL Table without copying. Currently supports
 // * numpy contiguous, homogenous -> oneDAL HomogenNumericTable
 // * numpy non-contiguous, homogenous -> NpyNumericTable
 // * numpy structured, heterogenous -> NpyNumericTable
 // * list of arrays, heterogen -> oneDAL SOANumericTable
 // * scipy csr_matrix -> oneDAL CSRNumericTable
-//   As long as oneDAL CSR is only 0-based we need to copy indices/offsets
+//   As long as oneDAL CSR is only 1-based we need to copy indices/offsets
 daal::data_management::NumericTablePtr make_nt(PyObject * obj)
 {
     if (PyErr_Occurred())
@@ -556,14 +589,15 @@ daal::data_management::NumericTablePtr make_nt(PyObject * obj)
                     throw std::runtime_error("Python Error");
                 }
 
-                // As long as oneDAL does not support 0-based indexing we have to copy the indices and add 1 to each
-                PyObject * np_indcs = PyArray_FROMANY(indcs, NPY_UINT64, 0, 0, NPY_ARRAY_CARRAY | NPY_ARRAY_ENSURECOPY | NPY_ARRAY_FORCECAST);
+                // As long as oneDAL does not support 0-based indexing we have to copy the indices and add 1 to each.
+                // int32 and int64 indices are read in place, anything else is cast once.
+                PyObject * np_indcs = PyArray_FROMANY(indcs, array_type(indcs) == NPY_INT32 ? NPY_INT32 : NPY_INT64, 0, 0, NPY_ARRAY_CARRAY | NPY_ARRAY_FORCECAST);
                 if (PyErr_Occurred())
                 {
                     PyErr_Print();
                     throw std::runtime_error("Python Error");
                 }
-                PyObject * np_roffs = PyArray_FROMANY(roffs, NPY_UINT64, 0, 0, NPY_ARRAY_CARRAY | NPY_ARRAY_ENSURECOPY | NPY_ARRAY_FORCECAST);
+                PyObject * np_roffs = PyArray_FROMANY(roffs, array_type(roffs) == NPY_INT32 ? NPY_INT32 : NPY_INT64, 0, 0, NPY_ARRAY_CARRAY | NPY_ARRAY_FORCECAST);
                 if (PyErr_Occurred())
                 {
                     PyErr_Print();
@@ -591,16 +625,10 @@ daal::data_management::NumericTablePtr make_nt(PyObject * obj)
 
                 if (np_indcs && np_roffs && np_vals && nr && nc)
                 {
-                    size_t * c_indcs           = static_cast<size_t *>(array_data(np_indcs));
-                    size_t n                   = array_size(np_indcs, 0);
-                    size_t * c_indcs_one_based = static_cast<size_t *>(daal::services::daal_malloc(n * sizeof(size_t)));
-                    DAAL4PY_CHECK_MALLOC(c_indcs_one_based);
-                    for (size_t i = 0; i < n; ++i) c_indcs_one_based[i] = c_indcs[i] + 1;
-                    size_t * c_roffs           = static_cast<size_t *>(array_data(np_roffs));
-                    n                          = array_size(np_roffs, 0);
-                    size_t * c_roffs_one_based = static_cast<size_t *>(daal::services::daal_malloc((n + 1) * sizeof(size_t)));
-                    DAAL4PY_CHECK_MALLOC(c_roffs_one_based);
-                    for (size_t i = 0; i < n; ++i) c_roffs_one_based[i] = c_roffs[i] + 1;
+                    daal::services::SharedPtr<size_t> c_indcs_one_based, c_roffs_one_based;
+                    _get_one_based_csr_indices(np_indcs, np_roffs, c_indcs_one_based, c_roffs_one_based);
+                    Py_DECREF(np_indcs);
+                    Py_DECREF(np_roffs);
                     size_t c_nc = static_cast<size_t>(PyInt_AsSsize_t(nc));
                     if (PyErr_Occurred())
                     {
@@ -613,7 +641,7 @@ daal::data_management::NumericTablePtr make_nt(PyObject * obj)
                         PyErr_Print();
                         throw std::runtime_error("Python Error");
                     }
-#define MKCSR_(_T) ret = daal::data_management::CSRNumericTable::create(daal::services::SharedPtr<_T>(reinterpret_cast<_T *>(array_data(np_vals)), NumpyDeleter(reinterpret_cast<PyArrayObject *>(np_vals))), daal::services::SharedPtr<size_t>(c_indcs_one_based, daal::services::ServiceDeleter()), daal::services::SharedPtr<size_t>(c_roffs_one_based, daal::services::ServiceDeleter()), c_nc, c_nr)
+#define MKCSR_(_T) ret = daal::data_management::CSRNumericTable::create(daal::services::SharedPtr<_T>(reinterpret_cast<_T *>(array_data(np_vals)), NumpyDeleter(reinterpret_cast<PyArrayObject *>(np_vals))), c_indcs_one_based, c_roffs_one_based, c_nc, c_nr)
                     SET_NPY_FEATURE(array_type(np_vals), MKCSR_, throw std::invalid_argument("Found unsupported data type in csr_matrix"));
 #undef MKCSR_
                 }
@@ -715,6 +743,30 @@ const daal::data_management::NumericTablePtr readCSV(const std::string & fname)
     return dataSource.getNumericTable();
 }
 
+CSVStream::CSVStream(const std::string & fname, size_t chunkRows)
+    : _dataSource(fname, daal::data_management::DataSource::notAllocateNumericTable, daal::data_management::DataSource::doDictionaryFromContext),
+      _nColumns(0),
+      _chunkRows(chunkRows)
+{
+    if (chunkRows == 0) throw std::invalid_argument("chunk_rows must be positive");
+    daal::services::Status status = _dataSource.status();
+    if (status) status = _dataSource.createDictionaryFromContext();
+    if (!status) throw std::runtime_error(status.getDescription());
+    _nColumns = _dataSource.getNumberOfColumns();
+}
+
+daal::data_management::NumericTablePtr CSVStream::next()
+{
+    if (_dataSource.isEOF()) return daal::data_management::NumericTablePtr();
+    daal::data_management::NumericTablePtr table =
+        daal::data_management::HomogenNumericTable<double>::create(_nColumns, 0, daal::data_management::NumericTable::notAllocate);
+    const size_t nRows = _dataSource.loadDataBlock(_chunkRows, table.get());
+    if (!_dataSource.status()) throw std::runtime_error(_dataSource.status().getDescription());
+    if (nRows == 0) return daal::data_management::NumericTablePtr();
+    if (table->getNumberOfRows() != nRows) table->resize(nRows);
+    return table;
+}
+
 extern "C" void to_c_array(const daal::data_management::NumericTablePtr * ptr, void ** data, size_t * dims, char dtype)
 {
     *data = NULL;
@@ -244,6 +244,21 @@ extern daal::data_management::KeyValueDataCollectionPtr make_dnt(PyObject * dict
 
 extern const daal::data_management::NumericTablePtr readCSV(const std::string& fname);
 
+// Reads a CSV file block by block, every block goes to a newly allocated table
+// so that arrays returned for earlier blocks stay valid
+class CSVStream
+{
+public:
+    CSVStream(const std::string & fname, size_t chunkRows);
+    // returns an empty pointer when the end of the file is reached
+    daal::data_management::NumericTablePtr next();
+
+private:
+    daal::data_management::FileDataSource<daal::data_management::CSVFeatureManager> _dataSource;
+    size_t _nColumns;
+    size_t _chunkRows;
+};
+
 
 template<class T, class U>
 T* dynamicPointerPtrCast(U *r)
@@ -14,27 +14,70 @@
 # limitations under the License.
 #===============================================================================
 
-from typing import List, Deque, Dict, Any
-from collections import deque
-from os import remove
+from typing import List, Dict, Iterator, Tuple, Any
 import json
 import re
 
-def get_gbt_model_from_lightgbm(model: Any) -> Any:
-    class Node:
-        def __init__(self, tree: Dict[str, Any], parent_id: int, position: int):
-            self.tree = tree
-            self.parent_id = parent_id
-            self.position = position
+def _lightgbm_trees(model_str: str) -> Iterator[Dict[str, str]]:
+    # Trees of the LightGBM text model are blocks of "key=value" lines
+    # starting with "Tree=<index>" and ending with "end of trees"
+    end = model_str.find("\nend of trees")
+    if end < 0:
+        end = len(model_str)
+    begin = model_str.find("\nTree=")
+    while 0 <= begin < end:
+        next_begin = model_str.find("\nTree=", begin + 1)
+        tree_end = next_begin if 0 <= next_begin < end else end
+        yield dict(line.split("=", 1)
+                   for line in model_str[begin + 1:tree_end].split("\n") if "=" in line)
+        begin = next_begin
+
+
+def _lightgbm_tree_arrays(tree: Dict[str, str]) -> Tuple[np.ndarray, ...]:
+    leaf_value = np.array(tree["leaf_value"].split(), dtype=np.float64)
+    n_leaves = leaf_value.shape[0]
+    if n_leaves == 1:
+        return (np.zeros(1, dtype=np.int64), np.zeros(1), np.full(1, -1, dtype=np.int64),
+                np.full(1, -1, dtype=np.int64), leaf_value)
+
+    if int(tree.get("num_cat", 0)) > 0 or \
+            np.any(np.array(tree["decision_type"].split(), dtype=np.int64) & 1):
+        raise NotImplementedError(
+            "Categorical features are not supported in daal4py Gradient Boosting Trees")
+
+    # Splits keep their indices, leaf i is stored after the splits,
+    # LightGBM references it as the child ~i
+    n_splits = n_leaves - 1
+    children = []
+    for key in ("left_child", "right_child"):
+        child = np.array(tree[key].split(), dtype=np.int64)
+        children.append(np.where(child < 0, n_splits + ~child, child))
+    left = np.full(n_splits + n_leaves, -1, dtype=np.int64)
+    right = np.full(n_splits + n_leaves, -1, dtype=np.int64)
+    left[:n_splits], right[:n_splits] = children
+
+    feature = np.zeros(n_splits + n_leaves, dtype=np.int64)
+    feature[:n_splits] = np.array(tree["split_feature"].split(), dtype=np.int64)
+    threshold = np.zeros(n_splits + n_leaves)
+    threshold[:n_splits] = np.array(tree["threshold"].split(), dtype=np.float64)
+    value = np.zeros(n_splits + n_leaves)
+    value[n_splits:] = leaf_value
+    return feature, threshold, left, right, value
+
 
-    lgb_model = model.dump_model()
+def get_gbt_model_from_lightgbm(model: Any) -> Any:
+    # The text model is parsed tree by tree instead of model.dump_model(),
+    # which builds a nested dict of all nodes of the model at once
+    model_str = model.model_to_string()
+    header = dict(line.split("=", 1)
+                  for line in model_str[:model_str.find("\nTree=")].split("\n") if "=" in line)
 
-    n_features = lgb_model["max_feature_idx"] + 1
-    n_iterations = len(lgb_model["tree_info"]) / lgb_model["num_tree_per_iteration"]
-    n_classes = lgb_model["num_tree_per_iteration"]
+    n_features = int(header["max_feature_idx"]) + 1
+    n_classes = int(header["num_tree_per_iteration"])
+    n_iterations = model_str.count("\nTree=") // n_classes
 
     is_regression = False
-    objective_fun = lgb_model["objective"]
+    objective_fun = header["objective"]
     if n_classes > 2:
         if "multiclass" not in objective_fun:
             raise TypeError(
@@ -52,83 +95,72 @@ def get_gbt_model_from_lightgbm(model: Any) -> Any:
 
     class_label = 0
     iterations_counter = 0
-    for tree in lgb_model["tree_info"]:
+    for tree in _lightgbm_trees(model_str):
         if is_regression:
-            tree_id = mb.create_tree(tree["num_leaves"]*2-1)
+            mb.add_tree_from_arrays(*_lightgbm_tree_arrays(tree))
         else:
-            tree_id = mb.create_tree(n_nodes=tree["num_leaves"]*2-1, class_label=class_label)
+            mb.add_tree_from_arrays(*_lightgbm_tree_arrays(tree), class_label=class_label)
 
         iterations_counter += 1
         if iterations_counter == n_iterations:
             iterations_counter = 0
             class_label += 1
-        tree_struct = tree["tree_structure"]
 
-        # root is leaf
-        if "leaf_value" in tree_struct:
-            mb.add_leaf(tree_id=tree_id, response=tree_struct["leaf_value"])
+    return mb.model()
+
+
+def _xgboost_tree_from_dump(tree: Dict[str, Any]) -> Dict[str, List[Any]]:
+    nodes: List[Dict[str, Any]] = []
+    stack: List[Dict[str, Any]] = [tree]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(node.get("children", []))
+    n_nodes = max(node["nodeid"] for node in nodes) + 1
+
+    arrays: Dict[str, List[Any]] = {
+        "left_children": [-1] * n_nodes,
+        "right_children": [-1] * n_nodes,
+        "split_indices": [0] * n_nodes,
+        "split_conditions": [0.0] * n_nodes,
+        "default_left": [0] * n_nodes,
+    }
+    for node in nodes:
+        i = node["nodeid"]
+        if "leaf" in node:
+            arrays["split_conditions"][i] = node["leaf"]
             continue
+        try:
+            feature_index = int(re.sub(r'[^0-9]', '', str(node["split"])))
+        except ValueError:
+            raise TypeError("Feature names must be integers")
+        arrays["left_children"][i] = node["yes"]
+        arrays["right_children"][i] = node["no"]
+        arrays["split_indices"][i] = feature_index
+        arrays["split_conditions"][i] = node["split_condition"]
+        if node["missing"] == node["yes"]:
+            arrays["default_left"][i] = 1
+        elif node["missing"] != node["no"]:
+            raise TypeError("Missing values are not supported in daal4py Gradient Boosting Trees")
+    return arrays
 
-        # add root
-        feat_val = tree_struct["threshold"]
-        if isinstance(feat_val, str):
-            raise NotImplementedError(
-                "Categorical features are not supported in daal4py Gradient Boosting Trees")
-        parent_id = mb.add_split(
-            tree_id=tree_id, feature_index=tree_struct["split_feature"],
-            feature_value=feat_val)
-
-        # create stack
-        node_stack: List[Node] = [Node(tree_struct["left_child"], parent_id, 0),
-                                  Node(tree_struct["right_child"], parent_id, 1)]
-
-        # dfs through it
-        while node_stack:
-            tree_struct = node_stack[-1].tree
-            parent_id = node_stack[-1].parent_id
-            position = node_stack[-1].position
-            node_stack.pop()
-
-            # current node is leaf
-            if "leaf_index" in tree_struct:
-                mb.add_leaf(
-                    tree_id=tree_id, response=tree_struct["leaf_value"],
-                    parent_id=parent_id, position=position)
-                continue
-
-            # current node is split
-            feat_val = tree_struct["threshold"]
-            if isinstance(feat_val, str):
-                raise NotImplementedError(
-                    "Categorical features are not supported in daal4py Gradient Boosting Trees")
-            parent_id = mb.add_split(
-                tree_id=tree_id, feature_index=tree_struct["split_feature"],
-                feature_value=feat_val,
-                parent_id=parent_id, position=position)
-
-            # append children
-            node_stack.append(Node(tree_struct["left_child"], parent_id, 0))
-            node_stack.append(Node(tree_struct["right_child"], parent_id, 1))
 
-    return mb.model()
+def _get_xgboost_trees(booster: Any) -> List[Dict[str, List[Any]]]:
+    try:
+        xgb_model = json.loads(booster.save_raw("json"))
+    except TypeError:
+        # save_raw has no format argument in older XGBoost, use the JSON text dump
+        return [_xgboost_tree_from_dump(json.loads(tree))
+                for tree in booster.get_dump(dump_format="json")]
+    gradient_booster = xgb_model["learner"]["gradient_booster"]
+    if "gbtree" in gradient_booster:
+        gradient_booster = gradient_booster["gbtree"]
+    return gradient_booster["model"]["trees"]
 
 
 def get_gbt_model_from_xgboost(booster: Any) -> Any:
-    class Node:
-        def __init__(self, tree: str, parent_id: int, position: int):
-            self.tree = tree
-            self.parent_id = parent_id
-            self.position = position
-
-    booster.dump_model("raw.txt")
-    with open("raw.txt", "r") as read_file:
-        xgb_model = read_file.read()
-    remove("./raw.txt")
     xgb_config = json.loads(booster.save_config())
 
-    updater = list(xgb_config["learner"]["gradient_booster"]["updater"].keys())[0]
-    max_depth = int(xgb_config["learner"]["gradient_booster"]
-                    ["updater"][updater]["train_param"]["max_depth"])
     n_features = int(xgb_config["learner"]["learner_model_param"]["num_feature"])
     n_classes = int(xgb_config["learner"]["learner_model_param"]["num_class"])
     base_score = float(xgb_config["learner"]["learner_model_param"]["base_score"])
@@ -148,9 +180,8 @@ def get_gbt_model_from_xgboost(booster: Any) -> Any:
     else:
         is_regression = True
 
-    last_booster_start = xgb_model.rfind("booster[") + 8
-    n_iterations = int((int(xgb_model[last_booster_start:xgb_model.find(
-        "]", last_booster_start)]) + 1) / (n_classes if n_classes > 2 else 1))
+    trees = _get_xgboost_trees(booster)
+    n_iterations = len(trees) // (n_classes if n_classes > 2 else 1)
 
     # Create + base iteration
     if is_regression:
@@ -165,102 +196,30 @@ def get_gbt_model_from_xgboost(booster: Any) -> Any:
     class_label = 0
     iterations_counter = 0
     mis_eq_yes = None
-    for tree in xgb_model.expandtabs(1).replace(" ", "").split("booster[")[1:]:
+    for tree in trees:
+        left = np.asarray(tree["left_children"], dtype=np.int64)
+        is_split = left >= 0
+
+        # daal4py sends missing values to one side of every split of the model
+        default_left = np.asarray(tree["default_left"], dtype=np.int64)[is_split]
+        if default_left.size:
+            if mis_eq_yes is None:
+                mis_eq_yes = default_left[0] != 0
+            if np.any(default_left != int(mis_eq_yes)):
+                raise TypeError("Missing values are not supported in daal4py Gradient Boosting Trees")
+
+        conditions = np.asarray(tree["split_conditions"], dtype=np.float64)
+        threshold = np.nextafter(conditions.astype(np.float32), np.float32(-np.inf))
         if is_regression:
-            tree_id = mb.create_tree(len(tree.split("\n")) - 1)
+            mb.add_tree_from_arrays(tree["split_indices"], threshold, left,
+                                    tree["right_children"], conditions)
         else:
-            tree_id = mb.create_tree(n_nodes=len(tree.split("\n")) - 1, class_label=class_label)
+            mb.add_tree_from_arrays(tree["split_indices"], threshold, left,
+                                    tree["right_children"], conditions, class_label)
 
         iterations_counter += 1
         if iterations_counter == n_iterations:
             iterations_counter = 0
             class_label += 1
-        sub_tree = tree[tree.find("\n")+1:]
-
-        # root is leaf
-        if sub_tree.find("leaf") == sub_tree.find(":") + 1:
-            mb.add_leaf(
-                tree_id=tree_id, response=float(
-                    sub_tree[sub_tree.find("=") + 1: sub_tree.find("\n")]))
-            continue
-
-        # add root
-        try:
-            feature_name = sub_tree[sub_tree.find("[") + 1:sub_tree.find("<")]
-            str_index = re.sub(r'[^0-9]', '', feature_name)
-            feature_index = int(str_index)
-        except ValueError:
-            raise TypeError("Feature names must be integers")
-        feature_value = np.nextafter(
-            np.single(sub_tree[sub_tree.find("<") + 1: sub_tree.find("]")]),
-            np.single(-np.inf))
-        parent_id = mb.add_split(tree_id=tree_id, feature_index=feature_index,
-                                 feature_value=feature_value)
-
-        # create queue
-        yes_idx = sub_tree[sub_tree.find("yes=") + 4:sub_tree.find(",no")]
-        no_idx = sub_tree[sub_tree.find("no=") + 3:sub_tree.find(",missing")]
-        mis_idx = sub_tree[sub_tree.find("missing=") + 8:sub_tree.find("\n")]
-        if mis_eq_yes is None:
-            if mis_idx == yes_idx:
-                mis_eq_yes = True
-            elif mis_idx == no_idx:
-                mis_eq_yes = False
-            else:
-                raise TypeError("Missing values are not supported in daal4py Gradient Boosting Trees")
-        elif mis_eq_yes and mis_idx != yes_idx or not mis_eq_yes and mis_idx != no_idx:
-            raise TypeError("Missing values are not supported in daal4py Gradient Boosting Trees")
-        node_queue: Deque[Node] = deque()
-        node_queue.append(
-            Node(
-                sub_tree
-                [sub_tree.find("\n" + yes_idx + ":") + 1: sub_tree.find("\n" + no_idx + ":") + 1],
-                parent_id, 0))
-        node_queue.append(Node(sub_tree[sub_tree.find("\n" + no_idx + ":") + 1:], parent_id, 1))
-
-        # bfs through it
-        while node_queue:
-            sub_tree = node_queue[0].tree
-            parent_id = node_queue[0].parent_id
-            position = node_queue[0].position
-            node_queue.popleft()
-
-            # current node is leaf
-            if sub_tree.find("leaf") == sub_tree.find(":") + 1:
-                mb.add_leaf(
-                    tree_id=tree_id,
-                    response=float(sub_tree[sub_tree.find("=") + 1: sub_tree.find("\n")]),
-                    parent_id=parent_id, position=position)
-                continue
-
-            # current node is split
-            try:
-                feature_name = sub_tree[sub_tree.find("[") + 1:sub_tree.find("<")]
-                str_index = re.sub(r'[^0-9]', '', feature_name)
-                feature_index = int(str_index)
-            except ValueError:
-                raise TypeError("Feature names must be integers")
-            feature_value = np.nextafter(
-                np.single(sub_tree[sub_tree.find("<") + 1: sub_tree.find("]")]),
-                np.single(-np.inf))
-            parent_id = mb.add_split(
-                tree_id=tree_id, feature_index=feature_index, feature_value=feature_value,
-                parent_id=parent_id, position=position)
-
-            # append to queue
-            yes_idx = sub_tree[sub_tree.find("yes=") + 4:sub_tree.find(",no")]
-            no_idx = sub_tree[sub_tree.find("no=") + 3:sub_tree.find(",missing")]
-            mis_idx = sub_tree[sub_tree.find("missing=") + 8:sub_tree.find("\n")]
-            if mis_eq_yes and mis_idx != yes_idx or not mis_eq_yes and mis_idx != no_idx:
-                raise TypeError("Missing values are not supported in daal4py Gradient Boosting Trees")
-            node_queue.append(
-                Node(
-                    sub_tree
-                    [sub_tree.find("\n" + yes_idx + ":") + 1: sub_tree.find("\n" + no_idx + ":") + 1],
-                    parent_id, 0))
-            node_queue.append(
-                Node(
-                    sub_tree[sub_tree.find("\n" + no_idx + ":") + 1:],
-                    parent_id, 1))
 
     return mb.model()
@@ -20,6 +20,8 @@
 #define _GBT_MODEL_BUILDER_INCLUDED_
 
 #include <daal.h>
+#include <stdexcept>
+#include <vector>
 
 typedef daal::algorithms::gbt::classification::ModelBuilder c_gbt_classification_model_builder;
 typedef daal::algorithms::gbt::regression::ModelBuilder c_gbt_regression_model_builder;
@@ -42,4 +44,92 @@ static daal::algorithms::gbt::regression::ModelPtr * get_gbt_regression_model_bu
     return RAW<daal::algorithms::gbt::regression::ModelPtr>()(obj_->getModel());
 }
 
+struct GbtQueuedNode
+{
+    size_t node;
+    size_t parent; // index of the parent in the queue
+    size_t position;
+};
+
+// Returns the nodes of a tree given as flat node arrays, node 0 being the root.
+// Node i is a leaf if left[i] < 0, otherwise it is a split with children left[i]
+// and right[i]. Only nodes reachable from the root are returned, in breadth-first
+// order, so parents always precede their children.
+static std::vector<GbtQueuedNode> gbtTreeNodes(size_t nNodes, const int64_t * left, const int64_t * right, const int64_t * feature)
+{
+    if (nNodes == 0) throw std::invalid_argument("Tree must contain at least one node");
+
+    std::vector<GbtQueuedNode> queue;
+    queue.reserve(nNodes);
+    queue.push_back({ 0, 0, 0 });
+    for (size_t i = 0; i < queue.size(); ++i)
+    {
+        const size_t node = queue[i].node;
+        if (left[node] < 0) continue;
+        if (static_cast<size_t>(left[node]) >= nNodes || right[node] < 0 || static_cast<size_t>(right[node]) >= nNodes)
+            throw std::invalid_argument("Child node index is out of range");
+        if (feature[node] < 0) throw std::invalid_argument("Feature index of a split node must be non-negative");
+        if (queue.size() + 2 > nNodes) throw std::invalid_argument("Nodes must form a tree rooted at node 0");
+        queue.push_back({ static_cast<size_t>(left[node]), i, 0 });
+        queue.push_back({ static_cast<size_t>(right[node]), i, 1 });
+    }
+    return queue;
+}
+
+// Adds nTrees trees whose nodes are stored in the node arrays from offsets[t] to
+// offsets[t + 1], with child indices local to each tree. Split nodes use feature[i]
+// and threshold[i], leaves the response value[i]. All trees are validated before
+// any of them is added, so an invalid tree leaves the builder unchanged.
+template <typename ModelBuilder, typename CreateTree>
+static void gbtAddTreesFromArrays(ModelBuilder * builder, CreateTree createTree, size_t nTrees, const int64_t * offsets,
+                                  const int64_t * left, const int64_t * right, const int64_t * feature, const double * threshold,
+                                  const double * value, typename ModelBuilder::TreeId * treeIds)
+{
+    typedef typename ModelBuilder::NodeId NodeId;
+
+    std::vector<std::vector<GbtQueuedNode> > trees(nTrees);
+    for (size_t t = 0; t < nTrees; ++t)
+    {
+        const int64_t begin = offsets[t];
+        trees[t]            = gbtTreeNodes(offsets[t + 1] - begin, left + begin, right + begin, feature + begin);
+    }
+
+    std::vector<NodeId> nodeIds;
+    for (size_t t = 0; t < nTrees; ++t)
+    {
+        const std::vector<GbtQueuedNode> & queue = trees[t];
+        const int64_t begin                      = offsets[t];
+        treeIds[t]                               = createTree(t, queue.size());
+        nodeIds.resize(queue.size());
+        for (size_t i = 0; i < queue.size(); ++i)
+        {
+            const GbtQueuedNode & q = queue[i];
+            const NodeId parentId   = i == 0 ? ModelBuilder::noParent : nodeIds[q.parent];
+            const size_t node       = begin + q.node;
+            if (left[node] < 0)
+                nodeIds[i] = builder->addLeafNode(treeIds[t], parentId, q.position, value[node]);
+            else
+                nodeIds[i] = builder->addSplitNode(treeIds[t], parentId, q.position, static_cast<size_t>(feature[node]), threshold[node]);
+        }
+    }
+}
+
+static void gbtClfAddTreesFromArrays(c_gbt_classification_model_builder * builder, size_t nTrees, const int64_t * offsets,
+                                     const int64_t * classLabels, const int64_t * left, const int64_t * right, const int64_t * feature,
+                                     const double * threshold, const double * value, c_gbt_clf_tree_id * treeIds)
+{
+    gbtAddTreesFromArrays(
+        builder, [builder, classLabels](size_t t, size_t n) { return builder->createTree(n, static_cast<size_t>(classLabels[t])); }, nTrees,
+        offsets, left, right, feature, threshold, value, treeIds);
+}
+
+static void gbtRegAddTreesFromArrays(c_gbt_regression_model_builder * builder, size_t nTrees, const int64_t * offsets, const int64_t * left,
+                                     const int64_t * right, const int64_t * feature, const double * threshold, const double * value,
+                                     c_gbt_reg_tree_id * treeIds)
+{
+    gbtAddTreesFromArrays(
+        builder, [builder](size_t, size_t n) { return builder->createTree(n); }, nTrees, offsets, left, right, feature, threshold, value,
+        treeIds);
+}
+
 #endif // _GBT_MODEL_BUILDER_INCLUDED_
@@ -42,15 +42,44 @@ cdef extern from "gbt_model_builder.h":
     cdef gbt_classification_ModelPtr * get_gbt_classification_model_builder_model(c_gbt_classification_model_builder *)
     cdef gbt_regression_ModelPtr * get_gbt_regression_model_builder_model(c_gbt_regression_model_builder *)
 
+    cdef void gbtClfAddTreesFromArrays(c_gbt_classification_model_builder * builder, size_t nTrees, const int64_t * offsets,
+                                       const int64_t * classLabels, const int64_t * left, const int64_t * right,
+                                       const int64_t * feature, const double * threshold, const double * value,
+                                       c_gbt_clf_tree_id * treeIds) nogil except +
+    cdef void gbtRegAddTreesFromArrays(c_gbt_regression_model_builder * builder, size_t nTrees, const int64_t * offsets,
+                                       const int64_t * left, const int64_t * right, const int64_t * feature,
+                                       const double * threshold, const double * value, c_gbt_reg_tree_id * treeIds) nogil except +
+
+
+def _gbt_tree_arrays(feature, threshold, left, right, value, tree_offsets):
+    arrays = (np.ascontiguousarray(feature, dtype=np.int64),
+              np.ascontiguousarray(threshold, dtype=np.float64),
+              np.ascontiguousarray(left, dtype=np.int64),
+              np.ascontiguousarray(right, dtype=np.int64),
+              np.ascontiguousarray(value, dtype=np.float64))
+    n_nodes = arrays[0].shape[0]
+    if n_nodes == 0 or any(a.ndim != 1 or a.shape[0] != n_nodes for a in arrays):
+        raise ValueError('Node arrays must be non-empty, one-dimensional and of equal length')
+    if tree_offsets is None:
+        tree_offsets = np.array([0, n_nodes], dtype=np.int64)
+    else:
+        tree_offsets = np.ascontiguousarray(tree_offsets, dtype=np.int64)
+        if tree_offsets.ndim != 1 or tree_offsets.shape[0] < 2 or tree_offsets[0] != 0 or \
+                tree_offsets[-1] != n_nodes or np.any(np.diff(tree_offsets) <= 0):
+            raise ValueError('tree_offsets must increase strictly from 0 to the number of nodes')
+    return arrays + (tree_offsets,)
+
 
 cdef class gbt_classification_model_builder:
     '''
     Model Builder for gradient boosted trees.
     '''
     cdef c_gbt_classification_model_builder * c_ptr
+    cdef size_t n_classes
 
     def __cinit__(self, size_t n_features, size_t n_iterations, size_t n_classes):
         self.c_ptr = new c_gbt_classification_model_builder(n_features, n_iterations, n_classes)
+        self.n_classes = n_classes
 
     def __dealloc__(self):
         del self.c_ptr
@@ -90,6 +119,44 @@ cdef class gbt_classification_model_builder:
         '''
         return self.c_ptr.addSplitNode(tree_id, parent_id, position, feature_index, feature_value)
 
+    def add_tree_from_arrays(self, feature, threshold, left, right, value, class_label=0, tree_offsets=None):
+        '''
+        Create whole trees from arrays of node attributes in a single call
+
+        Node 0 of each tree is its root. Node i is a leaf if left[i] is negative,
+        otherwise it is a split sending samples with feature values less than
+        or equal to threshold[i] to left[i] and all others to right[i].
+        All trees are checked before any of them is added, so a ValueError
+        leaves the builder unchanged; adding more trees than n_iterations is
+        only detected by oneDAL once the previous trees have been added.
+
+        :param array feature: feature index of each split node, ignored for leaves
+        :param array threshold: split value of each split node, ignored for leaves
+        :param array left: index of the left child of each node, negative for leaves
+        :param array right: index of the right child of each node, ignored for leaves
+        :param array value: response of each leaf node, ignored for splits
+        :param class_label: label of class for which trees are created, one per tree if tree_offsets is given
+        :param array tree_offsets: optional, n_trees + 1 offsets of the trees in the node
+            arrays if they hold a whole forest; child indices are local to each tree
+        :rtype: tree identifier, or list of tree identifiers if tree_offsets is given
+        '''
+        cdef const int64_t[::1] c_feature, c_left, c_right, c_offsets, c_labels
+        cdef const double[::1] c_threshold, c_value
+        cdef size_t[::1] c_tree_ids
+        c_feature, c_threshold, c_left, c_right, c_value, c_offsets = \
+            _gbt_tree_arrays(feature, threshold, left, right, value, tree_offsets)
+        cdef Py_ssize_t n_trees = c_offsets.shape[0] - 1
+        labels = np.ascontiguousarray(np.broadcast_to(class_label, (n_trees,)), dtype=np.int64)
+        if np.any(labels < 0) or np.any(labels >= self.n_classes):
+            raise ValueError('class_label must be in the range [0, n_classes)')
+        c_labels = labels
+        tree_ids = np.empty(n_trees, dtype=np.uintp)
+        c_tree_ids = tree_ids
+        with nogil:
+            gbtClfAddTreesFromArrays(self.c_ptr, n_trees, &c_offsets[0], &c_labels[0], &c_left[0], &c_right[0],
+                                     &c_feature[0], &c_threshold[0], &c_value[0], &c_tree_ids[0])
+        return tree_ids.tolist() if tree_offsets is not None else int(tree_ids[0])
+
     def model(self):
         '''
         Get built model
@@ -147,6 +214,39 @@ cdef class gbt_regression_model_builder:
         '''
         return self.c_ptr.addSplitNode(tree_id, parent_id, position, feature_index, feature_value)
 
+    def add_tree_from_arrays(self, feature, threshold, left, right, value, tree_offsets=None):
+        '''
+        Create whole trees from arrays of node attributes in a single call
+
+        Node 0 of each tree is its root. Node i is a leaf if left[i] is negative,
+        otherwise it is a split sending samples with feature values less than
+        or equal to threshold[i] to left[i] and all others to right[i].
+        All trees are checked before any of them is added, so a ValueError
+        leaves the builder unchanged; adding more trees than n_iterations is
+        only detected by oneDAL once the previous trees have been added.
+
+        :param array feature: feature index of each split node, ignored for leaves
+        :param array threshold: split value of each split node, ignored for leaves
+        :param array left: index of the left child of each node, negative for leaves
+        :param array right: index of the right child of each node, ignored for leaves
+        :param array value: response of each leaf node, ignored for splits
+        :param array tree_offsets: optional, n_trees + 1 offsets of the trees in the node
+            arrays if they hold a whole forest; child indices are local to each tree
+        :rtype: tree identifier, or list of tree identifiers if tree_offsets is given
+        '''
+        cdef const int64_t[::1] c_feature, c_left, c_right, c_offsets
+        cdef const double[::1] c_threshold, c_value
+        cdef size_t[::1] c_tree_ids
+        c_feature, c_threshold, c_left, c_right, c_value, c_offsets = \
+            _gbt_tree_arrays(feature, threshold, left, right, value, tree_offsets)
+        cdef Py_ssize_t n_trees = c_offsets.shape[0] - 1
+        tree_ids = np.empty(n_trees, dtype=np.uintp)
+        c_tree_ids = tree_ids
+        with nogil:
+            gbtRegAddTreesFromArrays(self.c_ptr, n_trees, &c_offsets[0], &c_left[0], &c_right[0],
+                                     &c_feature[0], &c_threshold[0], &c_value[0], &c_tree_ids[0])
+        return tree_ids.tolist() if tree_offsets is not None else int(tree_ids[0])
+
     def model(self):
         '''
         Get built model
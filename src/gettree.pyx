@@ -47,8 +47,8 @@ cdef extern from "tree_visitor.h":
         size_t         leaf_count
         size_t         class_count
 
-    cdef TreeState _getTreeState[M](M * model, size_t i, size_t n_classes)
-    cdef TreeState _getTreeState[M](M * model, size_t n_classes)
+    cdef TreeState _getTreeState[M](M * model, size_t i, size_t n_classes) nogil
+    cdef TreeState _getTreeState[M](M * model, size_t n_classes) nogil
 
 NODE_DTYPE = np.dtype({
     'names': ['left_child', 'right_child', 'feature', 'threshold', 'impurity',
@@ -0,0 +1,75 @@
+/*******************************************************************************
+* Copyright 2021 Intel Corporation
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+*     http://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+*******************************************************************************/
+
+// Weighted reductions of the KMeans iterations. oneDAL kmeans has no weights
+// input: it assigns the points to the closest centers, and these reductions
+// compute the weighted centers and the weighted inertia of the assignment.
+// Both make a single serial pass over the rows.
+
+#ifndef _KMEANS_WEIGHTED_INCLUDED_
+#define _KMEANS_WEIGHTED_INCLUDED_
+
+#include <algorithm>
+#include <cstddef>
+#include <stdexcept>
+
+static size_t kmeansWeightedCheckLabel(int label, size_t nClusters)
+{
+    if (label < 0 || static_cast<size_t>(label) >= nClusters) throw std::invalid_argument("labels must be in [0, n_clusters)");
+    return static_cast<size_t>(label);
+}
+
+// sums[c, j] = sum of weights[i] * X[i, j] over the rows i with labels[i] == c,
+// clusterWeights[c] = sum of weights[i] over the same rows
+template <typename T>
+static void kmeansWeightedClusterSums(const T * X, size_t nRows, size_t nCols, const int * labels, const T * weights, size_t nClusters,
+                                      double * sums, double * clusterWeights)
+{
+    std::fill(sums, sums + nClusters * nCols, 0.0);
+    std::fill(clusterWeights, clusterWeights + nClusters, 0.0);
+    for (size_t i = 0; i < nRows; ++i)
+    {
+        const size_t label   = kmeansWeightedCheckLabel(labels[i], nClusters);
+        const double w       = weights[i];
+        const T * row        = X + i * nCols;
+        double * clusterSums = sums + label * nCols;
+        for (size_t j = 0; j < nCols; ++j) clusterSums[j] += w * row[j];
+        clusterWeights[label] += w;
+    }
+}
+
+// sum of weights[i] * ||X[i] - centers[labels[i]]||^2 over all rows
+template <typename T>
+static double kmeansWeightedInertia(const T * X, size_t nRows, size_t nCols, const T * centers, size_t nClusters, const int * labels,
+                                    const T * weights)
+{
+    double inertia = 0.0;
+    for (size_t i = 0; i < nRows; ++i)
+    {
+        const T * row    = X + i * nCols;
+        const T * center = centers + kmeansWeightedCheckLabel(labels[i], nClusters) * nCols;
+        double distance  = 0.0;
+        for (size_t j = 0; j < nCols; ++j)
+        {
+            const double diff = static_cast<double>(row[j]) - center[j];
+            distance += diff * diff;
+        }
+        inertia += weights[i] * distance;
+    }
+    return inertia;
+}
+
+#endif // _KMEANS_WEIGHTED_INCLUDED_
@@ -0,0 +1,79 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+# Weighted reductions of daal4py.sklearn KMeans, run with the GIL released
+# (see kmeans_weighted.h)
+
+from cython cimport floating
+
+cdef extern from "kmeans_weighted.h":
+    void kmeansWeightedClusterSums[T](const T * X, size_t nRows, size_t nCols, const int * labels, const T * weights,
+                                      size_t nClusters, double * sums, double * clusterWeights) nogil except +
+    double kmeansWeightedInertia[T](const T * X, size_t nRows, size_t nCols, const T * centers, size_t nClusters,
+                                    const int * labels, const T * weights) nogil except +
+
+
+def _check_kmeans_weighted_inputs(X, labels, weights):
+    if labels.shape[0] != X.shape[0] or weights.shape[0] != X.shape[0]:
+        raise ValueError('X, labels and weights must have the same number of rows')
+
+
+def _kmeans_weighted_cluster_sums(const floating[:, ::1] X, const int[::1] labels, const floating[::1] weights, size_t n_clusters):
+    '''
+    Weighted sums of the rows of X and total weights of the clusters
+
+    :param array X: C-contiguous float or double array of shape (n_samples, n_features)
+    :param array labels: int32 cluster of each row, in [0, n_clusters)
+    :param array weights: weight of each row, of the dtype of X
+    :param size_t n_clusters: number of clusters
+    :rtype: tuple of float64 arrays of shapes (n_clusters, n_features) and (n_clusters,)
+    '''
+    _check_kmeans_weighted_inputs(X, labels, weights)
+    sums = np.zeros((n_clusters, X.shape[1]), dtype=np.float64)
+    cluster_weights = np.zeros(n_clusters, dtype=np.float64)
+    if X.shape[0] == 0 or X.shape[1] == 0 or n_clusters == 0:
+        return sums, cluster_weights
+    cdef double[:, ::1] c_sums = sums
+    cdef double[::1] c_cluster_weights = cluster_weights
+    with nogil:
+        kmeansWeightedClusterSums(&X[0, 0], X.shape[0], X.shape[1], &labels[0], &weights[0], n_clusters,
+                                  &c_sums[0, 0], &c_cluster_weights[0])
+    return sums, cluster_weights
+
+
+def _kmeans_weighted_inertia(const floating[:, ::1] X, const floating[:, ::1] centers, const int[::1] labels,
+                             const floating[::1] weights):
+    '''
+    Sum over the rows of X of the weight times the squared distance to the center of the row's cluster
+
+    :param array X: C-contiguous float or double array of shape (n_samples, n_features)
+    :param array centers: C-contiguous array of shape (n_clusters, n_features), of the dtype of X
+    :param array labels: int32 cluster of each row, in [0, n_clusters)
+    :param array weights: weight of each row, of the dtype of X
+    :rtype: float
+    '''
+    _check_kmeans_weighted_inputs(X, labels, weights)
+    if centers.shape[1] != X.shape[1]:
+        raise ValueError('X and centers must have the same number of columns')
+    cdef double inertia = 0.0
+    if X.shape[0] == 0 or X.shape[1] == 0:
+        return inertia
+    if centers.shape[0] == 0:
+        raise ValueError('labels must be in [0, n_clusters)')
+    with nogil:
+        inertia = kmeansWeightedInertia(&X[0, 0], X.shape[0], X.shape[1], &centers[0, 0], centers.shape[0], &labels[0],
+                                        &weights[0])
+    return inertia
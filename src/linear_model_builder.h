@@ -0,0 +1,66 @@
+/*******************************************************************************
+* Copyright 2021 Intel Corporation
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+*     http://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+*******************************************************************************/
+
+// Linear and ridge regression models built from given coefficients. beta is a
+// C-contiguous array of shape (nResponses, nFeatures + 1) with the intercepts
+// in its first column, the layout of the Beta of the trained models.
+
+#ifndef _LINEAR_MODEL_BUILDER_INCLUDED_
+#define _LINEAR_MODEL_BUILDER_INCLUDED_
+
+#include <daal.h>
+#include <algorithm>
+#include <stdexcept>
+
+static void linearModelCheckStatus(const daal::services::Status & status)
+{
+    if (!status.ok()) throw std::runtime_error(status.getDescription());
+}
+
+template <typename T>
+static daal::algorithms::linear_regression::ModelPtr * linearRegressionModelFromBeta(const T * beta, size_t nFeatures, size_t nResponses,
+                                                                                     bool interceptFlag)
+{
+    daal::algorithms::linear_regression::ModelBuilder<T> builder(nFeatures, nResponses);
+    linearModelCheckStatus(builder.getStatus());
+    builder.setBeta(beta, beta + nResponses * (nFeatures + 1));
+    builder.setInterceptFlag(interceptFlag);
+    linearModelCheckStatus(builder.getStatus());
+    return RAW<daal::algorithms::linear_regression::ModelPtr>()(builder.getModel());
+}
+
+template <typename T>
+static daal::algorithms::ridge_regression::ModelPtr * ridgeRegressionModelFromBeta(const T * beta, size_t nFeatures, size_t nResponses,
+                                                                                   bool interceptFlag)
+{
+    // oneDAL has no ridge regression model builder, an empty model is
+    // created and its coefficients are written in place
+    daal::algorithms::ridge_regression::TrainParameter parameter;
+    parameter.interceptFlag = interceptFlag;
+    daal::services::Status status;
+    daal::algorithms::ridge_regression::ModelPtr model =
+        daal::algorithms::ridge_regression::ModelNormEq::create<T>(nFeatures, nResponses, parameter, &status);
+    linearModelCheckStatus(status);
+
+    daal::data_management::NumericTablePtr betaTable = model->getBeta();
+    daal::data_management::BlockDescriptor<T> block;
+    linearModelCheckStatus(betaTable->getBlockOfRows(0, nResponses, daal::data_management::writeOnly, block));
+    std::copy(beta, beta + nResponses * (nFeatures + 1), block.getBlockPtr());
+    linearModelCheckStatus(betaTable->releaseBlockOfRows(block));
+    return RAW<daal::algorithms::ridge_regression::ModelPtr>()(model);
+}
+
+#endif // _LINEAR_MODEL_BUILDER_INCLUDED_
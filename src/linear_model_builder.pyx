@@ -0,0 +1,117 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+# Model builders of linear and ridge regression, for models whose
+# coefficients are not computed by oneDAL training (see linear_model_builder.h)
+
+cdef extern from "linear_model_builder.h":
+    cdef linear_regression_ModelPtr * linearRegressionModelFromBeta[T](const T * beta, size_t nFeatures, size_t nResponses,
+                                                                       bint interceptFlag) except +
+    cdef ridge_regression_ModelPtr * ridgeRegressionModelFromBeta[T](const T * beta, size_t nFeatures, size_t nResponses,
+                                                                     bint interceptFlag) except +
+
+
+def _linear_model_beta(beta, intercept, size_t n_features, size_t n_responses):
+    beta = np.asarray(beta)
+    dtype = np.float32 if beta.dtype == np.float32 else np.float64
+    beta_for_daal = np.zeros((n_responses, n_features + 1), dtype=dtype)
+    beta_for_daal[:, 1:] = beta.reshape((n_responses, n_features))
+    if intercept is not None:
+        beta_for_daal[:, 0] = np.asarray(intercept).reshape(-1)
+    return beta_for_daal
+
+
+ctypedef fused regression_ModelPtr:
+    linear_regression_ModelPtr
+    ridge_regression_ModelPtr
+
+
+cdef regression_ModelPtr * _regression_model_from_beta(regression_ModelPtr * model, object beta, size_t n_features,
+                                                       size_t n_responses, bint intercept_flag) except NULL:
+    # model only selects the specialization, the new model is returned
+    cdef const float[:, ::1] beta32
+    cdef const double[:, ::1] beta64
+    if beta is None:
+        raise ValueError('set_beta must be called before getting the model')
+    if beta.dtype == np.float32:
+        beta32 = beta
+        if regression_ModelPtr is linear_regression_ModelPtr:
+            return linearRegressionModelFromBeta(&beta32[0, 0], n_features, n_responses, intercept_flag)
+        else:
+            return ridgeRegressionModelFromBeta(&beta32[0, 0], n_features, n_responses, intercept_flag)
+    beta64 = beta
+    if regression_ModelPtr is linear_regression_ModelPtr:
+        return linearRegressionModelFromBeta(&beta64[0, 0], n_features, n_responses, intercept_flag)
+    else:
+        return ridgeRegressionModelFromBeta(&beta64[0, 0], n_features, n_responses, intercept_flag)
+
+
+cdef class _regression_model_builder:
+    '''
+    Base of the linear and ridge regression model builders.
+    '''
+    cdef size_t n_features
+    cdef size_t n_responses
+    cdef object beta
+    cdef bint intercept_flag
+
+    def __cinit__(self, size_t n_features, size_t n_responses):
+        self.n_features = n_features
+        self.n_responses = n_responses
+        self.beta = None
+        self.intercept_flag = False
+
+    def set_beta(self, beta, intercept):
+        '''
+        Concatenate beta and intercept, convert to daal4py model
+
+        :param beta: coef_ from scikit-learn model, of shape (n_responses, n_features)
+        :param intercept: intercept_ from scikit-learn model, None if it has no intercept
+        '''
+        self.beta = _linear_model_beta(beta, intercept, self.n_features, self.n_responses)
+        self.intercept_flag = intercept is not None
+
+
+cdef class linear_regression_model_builder(_regression_model_builder):
+    '''
+    Model Builder for linear regression.
+    '''
+    @property
+    def model(self):
+        '''
+        Get built model
+
+        :rtype: linear_regression_model
+        '''
+        cdef linear_regression_model res = linear_regression_model.__new__(linear_regression_model)
+        res.c_ptr = _regression_model_from_beta(res.c_ptr, self.beta, self.n_features, self.n_responses, self.intercept_flag)
+        return res
+
+
+cdef class ridge_regression_model_builder(_regression_model_builder):
+    '''
+    Model Builder for ridge regression.
+    '''
+    @property
+    def model(self):
+        '''
+        Get built model
+
+        :rtype: ridge_regression_model
+        '''
+        cdef ridge_regression_model res = ridge_regression_model.__new__(ridge_regression_model)
+        res.c_ptr = _regression_model_from_beta(res.c_ptr, self.beta, self.n_features, self.n_responses, self.intercept_flag)
+        return res
@@ -0,0 +1,62 @@
+#===============================================================================
+# Copyright 2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+
+import os
+import unittest
+import daal4py as d4p
+import numpy as np
+
+test_path = os.path.abspath(os.path.dirname(__file__))
+data_path = os.path.join(os.path.dirname(test_path), "examples", "daal4py",
+                         "data", "batch")
+
+
+class CSVStream(unittest.TestCase):
+    def test_chunks(self):
+        infile = os.path.join(data_path, "svd.csv")
+        data = np.loadtxt(infile, delimiter=',', ndmin=2)
+        chunks = list(d4p.csv_stream(infile, 1000))
+        self.assertEqual([c.shape[0] for c in chunks[:-1]],
+                         [1000] * (len(chunks) - 1))
+        self.assertTrue(0 < chunks[-1].shape[0] <= 1000)
+        self.assertTrue(np.allclose(np.vstack(chunks), data))
+
+    def test_float32(self):
+        infile = os.path.join(data_path, "covcormoments_dense.csv")
+        chunks = list(d4p.csv_stream(infile, 111, dtype=np.float32))
+        self.assertTrue(all(c.dtype == np.float32 for c in chunks))
+        data = np.loadtxt(infile, delimiter=',', ndmin=2, dtype=np.float32)
+        self.assertTrue(np.allclose(np.vstack(chunks), data))
+
+    def test_streaming_compute(self):
+        infile = os.path.join(data_path, "covcormoments_dense.csv")
+        algo = d4p.covariance(streaming=True)
+        for chunk in d4p.csv_stream(infile, 112):
+            algo.compute(chunk)
+        result = algo.finalize()
+        expected = d4p.covariance().compute(infile)
+        self.assertTrue(np.allclose(result.covariance, expected.covariance))
+        self.assertTrue(np.allclose(result.mean, expected.mean))
+
+    def test_invalid_chunk_rows(self):
+        infile = os.path.join(data_path, "svd.csv")
+        with self.assertRaises(ValueError):
+            d4p.csv_stream(infile, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
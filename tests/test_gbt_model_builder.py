@@ -0,0 +1,107 @@
+#===============================================================================
+# Copyright 2020-2021 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+import unittest
+import daal4py as d4p
+import numpy as np
+
+# Stump on feature 1 followed by a depth 2 tree, node 0 is the root of each tree
+FEATURE = [1, 0, 0, 0, 0, 1, 0, 0]
+THRESHOLD = [0.5, 0, 0, 0.25, 0, 0.75, 0, 0]
+LEFT = [1, -1, -1, 1, -1, 3, -1, -1]
+RIGHT = [2, -1, -1, 2, -1, 4, -1, -1]
+VALUE = [0, -1, 1, 0, 2, 0, 10, 20]
+TREE_OFFSETS = [0, 3, 8]
+
+
+def _reg_predict(model, X):
+    return d4p.gbt_regression_prediction().compute(X, model).prediction.ravel()
+
+
+class GbtModelBuilder(unittest.TestCase):
+    def setUp(self):
+        self.X = np.random.RandomState(0).rand(100, 2)
+
+    def _expected(self):
+        X = self.X
+        stump = np.where(X[:, 1] <= 0.5, -1, 1)
+        tree = np.where(X[:, 0] <= 0.25, 2, np.where(X[:, 1] <= 0.75, 10, 20))
+        return stump + tree
+
+    def test_reg_tree_from_arrays_matches_add_split(self):
+        mb = d4p.gbt_reg_model_builder(n_features=2, n_iterations=1)
+        tree_id = mb.create_tree(3)
+        root = mb.add_split(tree_id=tree_id, feature_index=1, feature_value=0.5)
+        mb.add_leaf(tree_id=tree_id, response=-1, parent_id=root, position=0)
+        mb.add_leaf(tree_id=tree_id, response=1, parent_id=root, position=1)
+
+        mb_arrays = d4p.gbt_reg_model_builder(n_features=2, n_iterations=1)
+        mb_arrays.add_tree_from_arrays(FEATURE[:3], THRESHOLD[:3], LEFT[:3],
+                                       RIGHT[:3], VALUE[:3])
+
+        np.testing.assert_allclose(_reg_predict(mb_arrays.model(), self.X),
+                                   _reg_predict(mb.model(), self.X))
+
+    def test_reg_forest_from_arrays(self):
+        mb = d4p.gbt_reg_model_builder(n_features=2, n_iterations=2)
+        tree_ids = mb.add_tree_from_arrays(FEATURE, THRESHOLD, LEFT, RIGHT, VALUE,
+                                           tree_offsets=TREE_OFFSETS)
+        self.assertEqual(len(tree_ids), 2)
+        np.testing.assert_allclose(_reg_predict(mb.model(), self.X), self._expected())
+
+    def test_clf_forest_from_arrays(self):
+        mb = d4p.gbt_clf_model_builder(n_features=2, n_iterations=1, n_classes=3)
+        mb.add_tree_from_arrays(np.tile(FEATURE[:3], 3), np.tile(THRESHOLD[:3], 3),
+                                np.tile(LEFT[:3], 3), np.tile(RIGHT[:3], 3),
+                                [0, -1, 1, 0, 1, -1, 0, 0, 0],
+                                class_label=[0, 1, 2], tree_offsets=[0, 3, 6, 9])
+        alg = d4p.gbt_classification_prediction(nClasses=3)
+        prediction = alg.compute(self.X, mb.model()).prediction.ravel()
+        np.testing.assert_array_equal(prediction, np.where(self.X[:, 1] <= 0.5, 1, 0))
+
+    def test_tree_from_arrays_validation(self):
+        mb = d4p.gbt_reg_model_builder(n_features=2, n_iterations=2)
+        with self.assertRaises(ValueError):
+            mb.add_tree_from_arrays(FEATURE, THRESHOLD, LEFT, RIGHT, VALUE[:3])
+        with self.assertRaises(ValueError):
+            mb.add_tree_from_arrays(FEATURE, THRESHOLD, LEFT, RIGHT, VALUE,
+                                    tree_offsets=[0, 4, 7])
+        with self.assertRaises(ValueError):
+            # a child index outside of the tree
+            mb.add_tree_from_arrays(FEATURE[:3], THRESHOLD[:3], [1, -1, -1],
+                                    [3, -1, -1], VALUE[:3])
+
+    def test_forest_from_arrays_validates_all_trees_first(self):
+        mb = d4p.gbt_reg_model_builder(n_features=2, n_iterations=2)
+        bad_left = LEFT.copy()
+        bad_left[TREE_OFFSETS[1]] = 7
+        with self.assertRaises(ValueError):
+            # the second tree is invalid, so the first one is not added either
+            mb.add_tree_from_arrays(FEATURE, THRESHOLD, bad_left, RIGHT, VALUE,
+                                    tree_offsets=TREE_OFFSETS)
+        mb.add_tree_from_arrays(FEATURE, THRESHOLD, LEFT, RIGHT, VALUE,
+                                tree_offsets=TREE_OFFSETS)
+        np.testing.assert_allclose(_reg_predict(mb.model(), self.X), self._expected())
+
+    def test_clf_tree_from_arrays_class_label(self):
+        mb = d4p.gbt_clf_model_builder(n_features=2, n_iterations=1, n_classes=3)
+        with self.assertRaises(ValueError):
+            mb.add_tree_from_arrays(FEATURE[:3], THRESHOLD[:3], LEFT[:3],
+                                    RIGHT[:3], VALUE[:3], class_label=3)
+
+
+if __name__ == '__main__':
+    unittest.main()